@@ -4,11 +4,15 @@ from tools.api import get_financial_metrics, get_market_cap, search_line_items
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
-import json
+from utils import json_utils
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 import math
+import operator
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils._njit import njit
 
 
 class BenGrahamSignal(BaseModel):
@@ -17,6 +21,65 @@ class BenGrahamSignal(BaseModel):
     reasoning: str
 
 
+class BenGrahamBatchSignal(BaseModel):
+    signals: dict[str, BenGrahamSignal]
+
+
+# Built once at import, the prompts never change between calls
+_GRAHAM_SYSTEM_MESSAGE = """You are a Benjamin Graham AI agent, making investment decisions using his principles:
+        1. Insist on a margin of safety by buying below intrinsic value (e.g., using Graham Number, net-net).
+        2. Emphasize the company's financial strength (low leverage, ample current assets).
+        3. Prefer stable earnings over multiple years.
+        4. Consider dividend record for extra safety.
+        5. Avoid speculative or high-growth assumptions; focus on proven metrics.
+                    
+        Return a rational recommendation: bullish, bearish, or neutral, with a confidence level (0-100) and concise reasoning.
+        """
+
+_GRAHAM_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _GRAHAM_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following analysis, create a Graham-style investment signal:
+
+        Analysis Data for {ticker}:
+        {analysis_data}
+
+        Return JSON exactly in this format:
+        {{
+          "signal": "bullish" or "bearish" or "neutral",
+          "confidence": float (0-100),
+          "reasoning": "string"
+        }}
+        """
+    )
+])
+
+_GRAHAM_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _GRAHAM_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following analysis, create a Graham-style investment signal for each ticker.
+        Judge every ticker on its own analysis only.
+
+        Analysis Data by ticker:
+        {analysis_data}
+
+        Return JSON exactly in this format, with one entry per ticker:
+        {{
+          "signals": {{
+            "<ticker>": {{
+              "signal": "bullish" or "bearish" or "neutral",
+              "confidence": float (0-100),
+              "reasoning": "string"
+            }}
+          }}
+        }}
+        """
+    )
+])
+
+
 def ben_graham_agent(state: AgentState):
     """
     Analyzes stocks using Benjamin Graham's classic value-investing principles:
@@ -32,54 +95,48 @@ def ben_graham_agent(state: AgentState):
     analysis_data = {}
     graham_analysis = {}
 
-    for ticker in tickers:
-        progress.update_status("ben_graham_agent", ticker, "Fetching financial metrics")
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=10)
-
-        progress.update_status("ben_graham_agent", ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(ticker, ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"], end_date, period="annual", limit=10)
-
-        progress.update_status("ben_graham_agent", ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date)
-
-        # Perform sub-analyses
-        progress.update_status("ben_graham_agent", ticker, "Analyzing earnings stability")
-        earnings_analysis = analyze_earnings_stability(metrics, financial_line_items)
-
-        progress.update_status("ben_graham_agent", ticker, "Analyzing financial strength")
-        strength_analysis = analyze_financial_strength(metrics, financial_line_items)
-
-        progress.update_status("ben_graham_agent", ticker, "Analyzing Graham valuation")
-        valuation_analysis = analyze_valuation_graham(metrics, financial_line_items, market_cap)
-
-        # Aggregate scoring
-        total_score = earnings_analysis["score"] + strength_analysis["score"] + valuation_analysis["score"]
-        max_possible_score = 15  # total possible from the three analysis functions
-
-        # Map total_score to signal
-        if total_score >= 0.7 * max_possible_score:
-            signal = "bullish"
-        elif total_score <= 0.3 * max_possible_score:
-            signal = "bearish"
-        else:
-            signal = "neutral"
-
-        analysis_data[ticker] = {"signal": signal, "score": total_score, "max_score": max_possible_score, "earnings_analysis": earnings_analysis, "strength_analysis": strength_analysis, "valuation_analysis": valuation_analysis}
-
-        progress.update_status("ben_graham_agent", ticker, "Generating Graham-style analysis")
-        graham_output = generate_graham_output(
+    # Each ticker is independent and dominated by network I/O, so fan them out
+    max_workers = max(1, min(16, len(tickers)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_analyze_ticker, ticker, end_date) for ticker in tickers]
+        for future in as_completed(futures):
+            ticker, analysis_entry = future.result()
+            analysis_data[ticker] = analysis_entry
+            progress.update_status("ben_graham_agent", ticker, "Generating Graham-style analysis")
+
+    # Keep the output ordered like the input tickers
+    analysis_data = {ticker: analysis_data[ticker] for ticker in tickers}
+
+    # One LLM round trip for every ticker instead of one per ticker
+    batch_output = generate_graham_batch_output(
+        analysis_data=analysis_data,
+        model_name=state["metadata"]["model_name"],
+        model_provider=state["metadata"]["model_provider"],
+    )
+
+    # Tickers missing from the batch response (or all of them, if the batch call failed)
+    # are asked for one by one, concurrently
+    missing = [ticker for ticker in tickers if ticker not in batch_output.signals]
+    fallback_outputs = map_llm_calls(
+        lambda ticker: generate_graham_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            ticker_analysis=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
+        ),
+        missing,
+        state["metadata"],
+    )
+
+    for ticker in tickers:
+        graham_output = batch_output.signals.get(ticker) or fallback_outputs[ticker]
 
         graham_analysis[ticker] = {"signal": graham_output.signal, "confidence": graham_output.confidence, "reasoning": graham_output.reasoning}
 
         progress.update_status("ben_graham_agent", ticker, "Done")
 
     # Wrap results in a single message for the chain
-    message = HumanMessage(content=json.dumps(graham_analysis), name="ben_graham_agent")
+    message = HumanMessage(content=json_utils.dumps(graham_analysis), name="ben_graham_agent")
 
     # Optionally display reasoning
     if state["metadata"]["show_reasoning"]:
@@ -91,6 +148,54 @@ def ben_graham_agent(state: AgentState):
     return {"messages": [message], "data": state["data"]}
 
 
+def _analyze_ticker(ticker: str, end_date: str) -> tuple[str, dict]:
+    """Fetch data and compute the Graham analysis for a single ticker."""
+    # The three fetches are independent, so issue them in parallel
+    progress.update_status("ben_graham_agent", ticker, "Fetching financial data")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        metrics_future = executor.submit(get_financial_metrics, ticker, end_date, period="annual", limit=10)
+        line_items_future = executor.submit(search_line_items, ticker, ["earnings_per_share", "revenue", "net_income", "book_value_per_share", "total_assets", "total_liabilities", "current_assets", "current_liabilities", "dividends_and_other_cash_distributions", "outstanding_shares"], end_date, period="annual", limit=10)
+        market_cap_future = executor.submit(get_market_cap, ticker, end_date)
+
+        metrics = metrics_future.result()
+        financial_line_items = line_items_future.result()
+        market_cap = market_cap_future.result()
+
+    # Perform sub-analyses
+    progress.update_status("ben_graham_agent", ticker, "Analyzing Graham fundamentals")
+    earnings_analysis = analyze_earnings_stability(metrics, financial_line_items)
+    strength_analysis = analyze_financial_strength(metrics, financial_line_items)
+    valuation_analysis = analyze_valuation_graham(metrics, financial_line_items, market_cap)
+
+    # Aggregate scoring
+    total_score = earnings_analysis["score"] + strength_analysis["score"] + valuation_analysis["score"]
+    max_possible_score = 15  # total possible from the three analysis functions
+
+    # Map total_score to signal
+    if total_score >= 0.7 * max_possible_score:
+        signal = "bullish"
+    elif total_score <= 0.3 * max_possible_score:
+        signal = "bearish"
+    else:
+        signal = "neutral"
+
+    analysis_entry = {"signal": signal, "score": total_score, "max_score": max_possible_score, "earnings_analysis": earnings_analysis, "strength_analysis": strength_analysis, "valuation_analysis": valuation_analysis}
+
+    return ticker, analysis_entry
+
+
+# Fetches every balance-sheet field the analyzers need in one call, missing fields come back as None
+_LATEST_FIELDS = operator.attrgetter(
+    'current_assets',
+    'current_liabilities',
+    'total_assets',
+    'total_liabilities',
+    'book_value_per_share',
+    'earnings_per_share',
+    'outstanding_shares',
+)
+
+
 def analyze_earnings_stability(metrics: list, financial_line_items: list) -> dict:
     """
     Graham wants at least several years of consistently positive earnings (ideally 5+).
@@ -104,18 +209,21 @@ def analyze_earnings_stability(metrics: list, financial_line_items: list) -> dic
     if not metrics or not financial_line_items:
         return {"score": score, "details": "Insufficient data for earnings stability analysis"}
 
-    eps_vals = []
-    for item in financial_line_items:
-        if hasattr(item, 'earnings_per_share') and item.earnings_per_share is not None:
-            eps_vals.append(item.earnings_per_share)
+    # Missing EPS becomes NaN and is dropped, keeping the reported periods in order
+    eps_vals = np.fromiter(
+        (np.nan if item.earnings_per_share is None else item.earnings_per_share for item in financial_line_items),
+        dtype=np.float64,
+        count=len(financial_line_items),
+    )
+    eps_vals = eps_vals[~np.isnan(eps_vals)]
 
-    if len(eps_vals) < 2:
+    if eps_vals.size < 2:
         details.append("Not enough multi-year EPS data.")
         return {"score": score, "details": "; ".join(details)}
 
     # 1. Consistently positive EPS
-    positive_eps_years = sum(1 for e in eps_vals if e > 0)
-    total_eps_years = len(eps_vals)
+    positive_eps_years = np.count_nonzero(eps_vals > 0)
+    total_eps_years = eps_vals.size
     if positive_eps_years == total_eps_years:
         score += 3
         details.append("EPS was positive in all available periods.")
@@ -146,19 +254,9 @@ def analyze_financial_strength(metrics: list, financial_line_items: list) -> dic
     if not financial_line_items:
         return {"score": score, "details": "Insufficient data for financial strength analysis"}
 
-    latest_item = financial_line_items[0]
+    current_assets, current_liabilities, total_assets, total_liabilities, _, _, _ = _LATEST_FIELDS(financial_line_items[0])
 
     # 1. Current Ratio
-    # Make sure the attributes exist before trying to use them
-    current_assets = 0
-    current_liabilities = 0
-    
-    if hasattr(latest_item, 'current_assets') and latest_item.current_assets is not None:
-        current_assets = latest_item.current_assets
-    
-    if hasattr(latest_item, 'current_liabilities') and latest_item.current_liabilities is not None:
-        current_liabilities = latest_item.current_liabilities
-        
     current_ratio = None
     if current_assets and current_liabilities:
         current_ratio = current_assets / current_liabilities
@@ -174,15 +272,11 @@ def analyze_financial_strength(metrics: list, financial_line_items: list) -> dic
         details.append("Current ratio could not be calculated (missing data)")
 
     # 2. Debt vs. Assets
-    if hasattr(latest_item, 'total_assets') and latest_item.total_assets is not None:
-        total_assets = latest_item.total_assets
-    else:
+    if total_assets is None:
         details.append("Cannot compute debt ratio (missing total_assets).")
         return {"score": score, "details": "; ".join(details)}
 
-    if hasattr(latest_item, 'total_liabilities') and latest_item.total_liabilities is not None:
-        total_liabilities = latest_item.total_liabilities
-    else:
+    if total_liabilities is None:
         details.append("Cannot compute debt ratio (missing total_liabilities).")
         return {"score": score, "details": "; ".join(details)}
 
@@ -220,6 +314,47 @@ def analyze_financial_strength(metrics: list, financial_line_items: list) -> dic
     return {"score": score, "details": "; ".join(details)}
 
 
+@njit(cache=True)
+def _graham_kernel(current_assets, total_liabilities, book_value_ps, eps, shares_outstanding, market_cap):
+    """
+    Numeric core of analyze_valuation_graham.
+    Returns (score, ncav, graham_number, margin_of_safety), with NaN for values that can't be computed.
+    """
+    score = 0
+
+    # 1. Net-Net Check
+    #   NCAV = Current Assets - Total Liabilities
+    #   If NCAV > Market Cap => historically a strong buy signal
+    ncav = current_assets - total_liabilities
+    if ncav > 0 and shares_outstanding > 0:
+        ncav_per_share = ncav / shares_outstanding
+        price_per_share = market_cap / shares_outstanding
+        if ncav > market_cap:
+            score += 4  # Very strong Graham signal
+        elif ncav_per_share >= price_per_share * 0.67:
+            score += 2  # Partial net-net discount
+
+    # 2. Graham Number
+    #   GrahamNumber = sqrt(22.5 * EPS * BVPS).
+    #   If GrahamNumber >> price, indicates undervaluation
+    graham_number = np.nan
+    if eps > 0 and book_value_ps > 0:
+        graham_number = math.sqrt(22.5 * eps * book_value_ps)
+
+    # 3. Margin of Safety relative to Graham Number
+    margin_of_safety = np.nan
+    if not math.isnan(graham_number) and graham_number > 0 and shares_outstanding > 0:
+        current_price = market_cap / shares_outstanding
+        if current_price > 0:
+            margin_of_safety = (graham_number - current_price) / current_price
+            if margin_of_safety > 0.5:
+                score += 3
+            elif margin_of_safety > 0.2:
+                score += 1
+
+    return score, ncav, graham_number, margin_of_safety
+
+
 def analyze_valuation_graham(metrics: list, financial_line_items: list, market_cap: float) -> dict:
     """
     Graham favors:
@@ -230,82 +365,59 @@ def analyze_valuation_graham(metrics: list, financial_line_items: list, market_c
     if not financial_line_items or market_cap is None:
         return {"score": 0, "details": "Insufficient data for Graham valuation"}
 
-    latest = financial_line_items[0]
-    
-    # Add proper attribute checks for all attributes
-    current_assets = 0
-    if hasattr(latest, 'current_assets') and latest.current_assets is not None:
-        current_assets = latest.current_assets
-        
-    total_liabilities = 0
-    if hasattr(latest, 'total_liabilities') and latest.total_liabilities is not None:
-        total_liabilities = latest.total_liabilities
-        
-    book_value_ps = 0
-    if hasattr(latest, 'book_value_per_share') and latest.book_value_per_share is not None:
-        book_value_ps = latest.book_value_per_share
-        
-    eps = 0
-    if hasattr(latest, 'earnings_per_share') and latest.earnings_per_share is not None:
-        eps = latest.earnings_per_share
-        
-    shares_outstanding = 0
-    if hasattr(latest, 'outstanding_shares') and latest.outstanding_shares is not None:
-        shares_outstanding = latest.outstanding_shares
-
+    current_assets, _, _, total_liabilities, book_value_ps, eps, shares_outstanding = _LATEST_FIELDS(financial_line_items[0])
+    current_assets = current_assets or 0
+    total_liabilities = total_liabilities or 0
+    book_value_ps = book_value_ps or 0
+    eps = eps or 0
+    shares_outstanding = shares_outstanding or 0
+
+    score, net_current_asset_value, graham_number, margin_of_safety = _graham_kernel(
+        float(current_assets),
+        float(total_liabilities),
+        float(book_value_ps),
+        float(eps),
+        float(shares_outstanding),
+        float(market_cap),
+    )
+    score = int(score)
+
+    # The kernel only does the arithmetic, the narrative is rebuilt here
     details = []
-    score = 0
 
     # 1. Net-Net Check
-    #   NCAV = Current Assets - Total Liabilities
-    #   If NCAV > Market Cap => historically a strong buy signal
-    net_current_asset_value = current_assets - total_liabilities
     if net_current_asset_value > 0 and shares_outstanding > 0:
         net_current_asset_value_per_share = net_current_asset_value / shares_outstanding
-        price_per_share = market_cap / shares_outstanding if shares_outstanding else 0
+        price_per_share = market_cap / shares_outstanding
 
         details.append(f"Net Current Asset Value = {net_current_asset_value:,.2f}")
         details.append(f"NCAV Per Share = {net_current_asset_value_per_share:,.2f}")
         details.append(f"Price Per Share = {price_per_share:,.2f}")
 
         if net_current_asset_value > market_cap:
-            score += 4  # Very strong Graham signal
             details.append("Net-Net: NCAV > Market Cap (classic Graham deep value).")
-        else:
-            # For partial net-net discount
-            if net_current_asset_value_per_share >= (price_per_share * 0.67):
-                score += 2
-                details.append("NCAV Per Share >= 2/3 of Price Per Share (moderate net-net discount).")
+        elif net_current_asset_value_per_share >= (price_per_share * 0.67):
+            details.append("NCAV Per Share >= 2/3 of Price Per Share (moderate net-net discount).")
     else:
         details.append("NCAV not exceeding market cap or insufficient data for net-net approach.")
 
     # 2. Graham Number
-    #   GrahamNumber = sqrt(22.5 * EPS * BVPS).
-    #   Compare the result to the current price_per_share
-    #   If GrahamNumber >> price, indicates undervaluation
-    graham_number = None
-    if eps > 0 and book_value_ps > 0:
-        graham_number = math.sqrt(22.5 * eps * book_value_ps)
-        details.append(f"Graham Number = {graham_number:.2f}")
-    else:
+    if math.isnan(graham_number):
         details.append("Unable to compute Graham Number (EPS or Book Value missing/<=0).")
+    else:
+        details.append(f"Graham Number = {graham_number:.2f}")
 
     # 3. Margin of Safety relative to Graham Number
-    if graham_number and shares_outstanding > 0:
-        current_price = market_cap / shares_outstanding
-        if current_price > 0:
-            margin_of_safety = (graham_number - current_price) / current_price
-            details.append(f"Margin of Safety (Graham Number) = {margin_of_safety:.2%}")
-            if margin_of_safety > 0.5:
-                score += 3
-                details.append("Price is well below Graham Number (>=50% margin).")
-            elif margin_of_safety > 0.2:
-                score += 1
-                details.append("Some margin of safety relative to Graham Number.")
-            else:
-                details.append("Price close to or above Graham Number, low margin of safety.")
+    if not math.isnan(margin_of_safety):
+        details.append(f"Margin of Safety (Graham Number) = {margin_of_safety:.2%}")
+        if margin_of_safety > 0.5:
+            details.append("Price is well below Graham Number (>=50% margin).")
+        elif margin_of_safety > 0.2:
+            details.append("Some margin of safety relative to Graham Number.")
         else:
-            details.append("Current price is zero or invalid; can't compute margin of safety.")
+            details.append("Price close to or above Graham Number, low margin of safety.")
+    elif not math.isnan(graham_number) and graham_number > 0 and shares_outstanding > 0:
+        details.append("Current price is zero or invalid; can't compute margin of safety.")
     # else: already appended details for missing graham_number
 
     return {"score": score, "details": "; ".join(details)}
@@ -313,7 +425,7 @@ def analyze_valuation_graham(metrics: list, financial_line_items: list, market_c
 
 def generate_graham_output(
     ticker: str,
-    analysis_data: dict[str, any],
+    ticker_analysis: dict[str, any],
     model_name: str,
     model_provider: str,
 ) -> BenGrahamSignal:
@@ -322,39 +434,8 @@ def generate_graham_output(
     - Value emphasis, margin of safety, net-nets, conservative balance sheet, stable earnings.
     - Return the result in a JSON structure: { signal, confidence, reasoning }.
     """
-
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are a Benjamin Graham AI agent, making investment decisions using his principles:
-            1. Insist on a margin of safety by buying below intrinsic value (e.g., using Graham Number, net-net).
-            2. Emphasize the company's financial strength (low leverage, ample current assets).
-            3. Prefer stable earnings over multiple years.
-            4. Consider dividend record for extra safety.
-            5. Avoid speculative or high-growth assumptions; focus on proven metrics.
-                        
-            Return a rational recommendation: bullish, bearish, or neutral, with a confidence level (0-100) and concise reasoning.
-            """
-        ),
-        (
-            "human",
-            """Based on the following analysis, create a Graham-style investment signal:
-
-            Analysis Data for {ticker}:
-            {analysis_data}
-
-            Return JSON exactly in this format:
-            {{
-              "signal": "bullish" or "bearish" or "neutral",
-              "confidence": float (0-100),
-              "reasoning": "string"
-            }}
-            """
-        )
-    ])
-
-    prompt = template.invoke({
-        "analysis_data": json.dumps(analysis_data, indent=2),
+    prompt = _GRAHAM_PROMPT.invoke({
+        "analysis_data": json_utils.dumps({ticker: ticker_analysis}),
         "ticker": ticker
     })
 
@@ -368,4 +449,30 @@ def generate_graham_output(
         pydantic_model=BenGrahamSignal,
         agent_name="ben_graham_agent",
         default_factory=create_default_ben_graham_signal,
-    )
\ No newline at end of file
+    )
+
+
+def generate_graham_batch_output(
+    analysis_data: dict[str, any],
+    model_name: str,
+    model_provider: str,
+) -> BenGrahamBatchSignal:
+    """
+    Generates Graham-style investment decisions for every ticker in a single LLM call.
+    Tickers missing from the response are left out of the returned signals.
+    """
+    prompt = _GRAHAM_BATCH_PROMPT.invoke({
+        "analysis_data": json_utils.dumps(analysis_data),
+    })
+
+    def create_default_batch_signal():
+        return BenGrahamBatchSignal(signals={})
+
+    return call_llm(
+        prompt=prompt,
+        model_name=model_name,
+        model_provider=model_provider,
+        pydantic_model=BenGrahamBatchSignal,
+        agent_name="ben_graham_agent",
+        default_factory=create_default_batch_signal,
+    )
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 
 class BillAckmanSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -85,19 +85,26 @@ def bill_ackman_agent(state: AgentState):
         }
         
         progress.update_status("bill_ackman_agent", ticker, "Generating Ackman analysis")
-        ackman_output = generate_ackman_output(
-            ticker=ticker, 
-            analysis_data=analysis_data,
+
+    # The LLM calls are independent per ticker, so dispatch them concurrently in batches
+    llm_outputs = map_llm_calls(
+        lambda ticker: generate_ackman_output(
+            ticker=ticker,
+            analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
-        
+        ),
+        tickers,
+        state["metadata"],
+    )
+
+    for ticker in tickers:
+        ackman_output = llm_outputs[ticker]
         ackman_analysis[ticker] = {
             "signal": ackman_output.signal,
             "confidence": ackman_output.confidence,
             "reasoning": ackman_output.reasoning
         }
-        
         progress.update_status("bill_ackman_agent", ticker, "Done")
     
     # Wrap results in a single message for the chain
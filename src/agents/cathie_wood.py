@@ -7,7 +7,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 
 class CathieWoodSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -92,19 +92,26 @@ def cathie_wood_agent(state: AgentState):
         }
 
         progress.update_status("cathie_wood_agent", ticker, "Generating Cathie Wood style analysis")
-        cw_output = generate_cathie_wood_output(
+
+    # The LLM calls are independent per ticker, so dispatch them concurrently in batches
+    llm_outputs = map_llm_calls(
+        lambda ticker: generate_cathie_wood_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
+        ),
+        tickers,
+        state["metadata"],
+    )
 
+    for ticker in tickers:
+        cw_output = llm_outputs[ticker]
         cw_analysis[ticker] = {
             "signal": cw_output.signal,
             "confidence": cw_output.confidence,
             "reasoning": cw_output.reasoning
         }
-
         progress.update_status("cathie_wood_agent", ticker, "Done")
 
     message = HumanMessage(
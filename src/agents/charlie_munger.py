@@ -7,7 +7,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 
 class CharlieMungerSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -122,19 +122,26 @@ def charlie_munger_agent(state: AgentState):
         }
         
         progress.update_status("charlie_munger_agent", ticker, "Generating Munger analysis")
-        munger_output = generate_munger_output(
-            ticker=ticker, 
-            analysis_data=analysis_data,
+
+    # The LLM calls are independent per ticker, so dispatch them concurrently in batches
+    llm_outputs = map_llm_calls(
+        lambda ticker: generate_munger_output(
+            ticker=ticker,
+            analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
-        
+        ),
+        tickers,
+        state["metadata"],
+    )
+
+    for ticker in tickers:
+        munger_output = llm_outputs[ticker]
         munger_analysis[ticker] = {
             "signal": munger_output.signal,
             "confidence": munger_output.confidence,
             "reasoning": munger_output.reasoning
         }
-        
         progress.update_status("charlie_munger_agent", ticker, "Done")
     
     # Wrap results in a single message for the chain
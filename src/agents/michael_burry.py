@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 from datetime import datetime, timedelta
 
 from tools.api import get_financial_metrics, get_market_cap, search_line_items, get_company_news, get_insider_trades
@@ -123,19 +123,26 @@ def michael_burry_agent(state: AgentState):  # noqa: C901  (complexity is fine h
         }
 
         progress.update_status("michael_burry_agent", ticker, "Generating LLM output")
-        burry_output = _generate_burry_output(
+
+    # The LLM calls are independent per ticker, so dispatch them concurrently in batches
+    llm_outputs = map_llm_calls(
+        lambda ticker: _generate_burry_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
+        ),
+        tickers,
+        state["metadata"],
+    )
 
+    for ticker in tickers:
+        burry_output = llm_outputs[ticker]
         burry_analysis[ticker] = {
             "signal": burry_output.signal,
             "confidence": burry_output.confidence,
             "reasoning": burry_output.reasoning,
         }
-
         progress.update_status("michael_burry_agent", ticker, "Done")
 
     # ----------------------------------------------------------------------
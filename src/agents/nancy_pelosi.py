@@ -2,20 +2,195 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from graph.state import AgentState, show_agent_reasoning
 from pydantic import BaseModel, Field
-import json
+from utils import json_utils
+import re
+import numpy as np
+from datetime import date
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from utils._njit import njit
 
 from tools.api import get_financial_metrics, get_market_cap, search_line_items, get_company_news, get_insider_trades
 
 
+# Keywords related to policy and legislation
+LEGISLATION_KEYWORDS = [
+    "bill", "act", "legislation", "congress", "senate", "house", "regulation", 
+    "regulatory", "policy", "subsidies", "tax credit", "incentive", "stimulus",
+    "appropriation", "federal funding", "government program", "committee hearing",
+    "draft legislation", "upcoming vote", "markup session", "lobbying",
+    "earmark", "omnibus", "reconciliation"
+]
+
+# Contract-related news keywords
+CONTRACT_KEYWORDS = [
+    "contract", "procurement", "award", "bid", "tender", "government deal", 
+    "federal contract", "defense contract", "agency award", "government client",
+    "government purchase", "government supplier", "vendor", "appropriation",
+    "request for proposal", "RFP", "no-bid contract", "sole source"
+]
+
+# Keywords for policy areas often subject to government action
+POLICY_AREAS = {
+    'technology': ['tech', 'technology', 'software', 'data', 'privacy', 'cybersecurity', 'ai', 'artificial intelligence'],
+    'healthcare': ['health', 'medical', 'medicare', 'medicaid', 'affordable care', 'pharma', 'drug', 'vaccine'],
+    'finance': ['bank', 'financial', 'credit', 'loan', 'interest rate', 'federal reserve', 'treasury'],
+    'energy': ['energy', 'oil', 'gas', 'renewable', 'solar', 'wind', 'climate', 'carbon', 'emissions'],
+    'infrastructure': ['infrastructure', 'construction', 'transportation', 'highway', 'bridge', 'road', 'rail'],
+    'defense': ['defense', 'military', 'security', 'weapons', 'contractor', 'army', 'navy', 'air force']
+}
+
+# Key terms indicating potential information asymmetry
+ASYMMETRY_KEYWORDS = [
+    "upcoming announcement", "pending approval", "not yet public", "confidential", 
+    "internal documents", "sources familiar", "expected to announce", "advance notice",
+    "exclusive", "unreleased", "leaked", "to be determined", "advance knowledge",
+    "preliminary results", "draft report", "early findings", "before official release",
+    "closed-door meeting", "private briefing", "insider", "tip", "rumor", "not widely known"
+]
+HIGH_VALUE_ASYMMETRY_KEYWORDS = ["approval", "contract award", "investigation", "regulatory action"]
+
+# Congressional trading keywords in news
+CONGRESS_KEYWORDS = [
+    "congress", "congressman", "congresswoman", "senator", "representative", 
+    "house member", "committee chair", "subcommittee", "pelosi", "schumer", 
+    "mcconnell", "committee", "caucus", "congressional trading", "disclosure",
+    "financial disclosure", "stock act", "ethics filing"
+]
+
+# Score contribution of a legislation news item by its sentiment
+_SENTIMENT_SCORE = {"positive": 1, "negative": -1}
+
+# Policy sectors with current legislative momentum
+PRIORITY_POLICY_SECTORS = frozenset({'infrastructure', 'technology', 'healthcare', 'energy'})
+
+# Sectors with high congressional trading activity
+CONGRESS_HEAVY_SECTORS = {
+    "tech": frozenset({"AAPL", "MSFT", "GOOG", "GOOGL", "META", "AMZN", "NVDA"}),
+    "pharma": frozenset({"PFE", "JNJ", "MRK", "ABBV", "LLY"}),
+    "defense": frozenset({"LMT", "RTX", "NOC", "GD", "BA"}),
+    "energy": frozenset({"XOM", "CVX", "COP", "SLB", "EOG"}),
+    "finance": frozenset({"JPM", "BAC", "GS", "MS", "WFC"}),
+}
+_CONGRESS_HEAVY_SECTOR_BY_TICKER = {
+    ticker: sector for sector, tickers in CONGRESS_HEAVY_SECTORS.items() for ticker in tickers
+}
+
+# Known historically high congressional trading stocks
+HIGH_TRADING_STOCKS = frozenset({"AAPL", "MSFT", "AMZN", "GOOGL", "TSLA", "NVDA", "PFE", "JNJ"})
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile keywords into one alternation that matches any of them as a plain substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Built once at import so each title is scanned in a single pass per keyword set
+_LEGISLATION_PATTERN = _keyword_pattern(LEGISLATION_KEYWORDS)
+_CONTRACT_PATTERN = _keyword_pattern(CONTRACT_KEYWORDS)
+_ASYMMETRY_PATTERN = _keyword_pattern(ASYMMETRY_KEYWORDS)
+_HIGH_VALUE_ASYMMETRY_PATTERN = _keyword_pattern(HIGH_VALUE_ASYMMETRY_KEYWORDS)
+_CONGRESS_PATTERN = _keyword_pattern(CONGRESS_KEYWORDS)
+
+# All policy keywords in one scanner. The lookahead reports a match at every position, and trying
+# longest keywords first means the keywords that also match there are exactly the prefixes of the hit,
+# so each keyword maps to the areas of itself and its prefixes.
+_POLICY_KEYWORDS = sorted({keyword for keywords in POLICY_AREAS.values() for keyword in keywords}, key=len, reverse=True)
+_POLICY_PATTERN = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in _POLICY_KEYWORDS) + "))")
+_POLICY_KEYWORD_AREAS = {
+    keyword: frozenset(
+        area for area, keywords in POLICY_AREAS.items() for other in keywords if keyword.startswith(other)
+    )
+    for keyword in _POLICY_KEYWORDS
+}
+
+
 class NancyPelosiSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
     confidence: float
     reasoning: str
 
 
+class NancyPelosiBatchSignal(BaseModel):
+    signals: dict[str, NancyPelosiSignal]
+
+
+def _create_default_signal() -> NancyPelosiSignal:
+    """Fallback signal used when the LLM call fails."""
+    return NancyPelosiSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
+
+
+def _create_default_batch_signal() -> NancyPelosiBatchSignal:
+    """Empty batch result; every ticker then falls back to its own LLM call."""
+    return NancyPelosiBatchSignal(signals={})
+
+
+# Built once at import, the prompts never change between calls
+_PELOSI_SYSTEM_MESSAGE = """You analyze stocks based on information advantage and policy knowledge:
+
+        1. Identify regulatory arbitrage opportunities where policy knowledge creates profit
+        2. Evaluate companies positioned to benefit from upcoming legislation
+        3. Find asymmetric information opportunities before public market awareness
+        4. Determine which companies have direct government revenue streams
+        5. Track actual congressional trading patterns for confirming signals
+        
+        Key investment principles:
+        - Use advanced knowledge of policy directions before market prices adjust
+        - Identify legislation impacts on specific companies before wide awareness
+        - Position ahead of government contract awards and appropriations
+        - Monitor committee activities for sector impacts
+        - Leverage information advantages legally but aggressively
+        
+        Your analysis is purely profit-focused, logical, and direct. You prioritize identifying information asymmetry that creates actionable trading opportunities.
+        """
+
+_PELOSI_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _PELOSI_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following policy-driven analysis, create an investment signal:
+
+        Analysis Data for {ticker}:
+        {analysis_data}
+
+        Return the trading signal in the following JSON format:
+        {{
+          "signal": "bullish/bearish/neutral",
+          "confidence": float (0-100),
+          "reasoning": "string"
+        }}
+        """
+    )
+])
+
+
+_PELOSI_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _PELOSI_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following policy-driven analysis, create an investment signal for each ticker.
+        Judge every ticker on its own analysis only.
+
+        Analysis Data by ticker:
+        {analysis_data}
+
+        Return the trading signals in the following JSON format, with one entry per ticker:
+        {{
+          "signals": {{
+            "<ticker>": {{
+              "signal": "bullish/bearish/neutral",
+              "confidence": float (0-100),
+              "reasoning": "string"
+            }}
+          }}
+        }}
+        """
+    )
+])
+
+
 def nancy_pelosi_agent(state: AgentState):
     """
     Analyzes stocks using policy information advantage and congressional trading patterns:
@@ -30,94 +205,65 @@ def nancy_pelosi_agent(state: AgentState):
     tickers = data["tickers"]
     
     analysis_data = {}
+    # Whether each ticker had both news and insider trades; kept apart from analysis_data so it never reaches the prompt
+    has_evidence = {}
     pelosi_analysis = {}
     
-    for ticker in tickers:
-        progress.update_status("nancy_pelosi_agent", ticker, "Fetching financial metrics")
-        # Fetch required data
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
-            ticker,
-            [
-                "revenue", 
-                "net_income",
-                "outstanding_shares",
-                "total_assets",
-                "research_and_development",
-                "goodwill_and_intangible_assets",  # Often higher in gov contractors
-            ],
-            end_date,
-            period="annual",
-            limit=5,
-        )
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Getting recent news")
-        # Analysis of recent news for policy/regulatory mentions
-        company_news = get_company_news(ticker, end_date, limit=100)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Fetching insider trading data")
-        # Get insider trading data to identify patterns
-        insider_trades = get_insider_trades(ticker, end_date, limit=100)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing legislation impact")
-        legislation_analysis = analyze_legislation_impact(company_news, ticker)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing government contract potential")
-        gov_contract_analysis = analyze_government_contracts(financial_line_items, company_news)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing policy trends")
-        policy_analysis = analyze_policy_trends(company_news, ticker)
-
-        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing information asymmetry")
-        asymmetry_analysis = analyze_information_asymmetry(company_news, insider_trades, ticker)
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing congressional trading patterns")
-        congressional_trading = analyze_congressional_trading(ticker, insider_trades, company_news)
-        
-        # Calculate total score with higher weight on information asymmetry and congressional trading
-        total_score = (
-            legislation_analysis["score"] * 0.2 + 
-            gov_contract_analysis["score"] * 0.2 + 
-            policy_analysis["score"] * 0.2 +
-            asymmetry_analysis["score"] * 0.2 +
-            congressional_trading["score"] * 0.2
+    # Tickers are independent and I/O-bound, so analyze them concurrently
+    max_workers = max(1, min(state["metadata"].get("max_workers", 16), len(tickers)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_analyze_ticker, ticker, end_date) for ticker in tickers]
+        for future in as_completed(futures):
+            ticker, analysis_entry, has_evidence[ticker] = future.result()
+            if analysis_entry is None:
+                pelosi_analysis[ticker] = {"signal": "neutral", "confidence": 0.0, "reasoning": "No data available for analysis"}
+                progress.update_status("nancy_pelosi_agent", ticker, "Done")
+                continue
+            analysis_data[ticker] = analysis_entry
+            progress.update_status("nancy_pelosi_agent", ticker, "Generating congressional trading analysis")
+    
+    # Keep the output ordered like the input tickers
+    analysis_data = {ticker: analysis_data[ticker] for ticker in tickers if ticker in analysis_data}
+    
+    # A score this close to either end leaves the LLM nothing to re-decide, use the analysis as is
+    skip_threshold = state["metadata"].get("llm_skip_threshold", 0.85)
+    deterministic_outputs = {
+        ticker: _create_deterministic_signal(ticker_analysis)
+        for ticker, ticker_analysis in analysis_data.items()
+        if has_evidence[ticker] and _is_extreme_score(ticker_analysis, skip_threshold)
+    }
+    llm_analysis_data = {
+        ticker: ticker_analysis
+        for ticker, ticker_analysis in analysis_data.items()
+        if ticker not in deterministic_outputs
+    }
+    
+    # One LLM round trip for every remaining ticker instead of one per ticker
+    batch_output = _create_default_batch_signal()
+    if llm_analysis_data:
+        batch_output = generate_pelosi_batch_output(
+            analysis_data=llm_analysis_data,
+            model_name=state["metadata"]["model_name"],
+            model_provider=state["metadata"]["model_provider"],
         )
-        max_possible_score = 10
-        
-        # Generate trading signal
-        if total_score >= 0.65 * max_possible_score:  # Lower threshold - biased toward action
-            signal = "bullish"
-        elif total_score <= 0.35 * max_possible_score:
-            signal = "bearish"
-        else:
-            signal = "neutral"
-        
-        # Combine all analysis results
-        analysis_data[ticker] = {
-            "signal": signal,
-            "score": total_score,
-            "max_score": max_possible_score,
-            "legislation_analysis": legislation_analysis,
-            "gov_contract_analysis": gov_contract_analysis,
-            "policy_analysis": policy_analysis,
-            "asymmetry_analysis": asymmetry_analysis,
-            "congressional_trading": congressional_trading,
-            "market_cap": market_cap,
-        }
-        
-        progress.update_status("nancy_pelosi_agent", ticker, "Generating congressional trading analysis")
-        pelosi_output = generate_pelosi_output(
+    
+    # Tickers missing from the batch response (or all of them, if the batch call failed)
+    # are asked for one by one, concurrently
+    missing = [ticker for ticker in llm_analysis_data if ticker not in batch_output.signals]
+    fallback_outputs = map_llm_calls(
+        lambda ticker: generate_pelosi_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            ticker_analysis=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
-        
+        ),
+        missing,
+        state["metadata"],
+    )
+    
+    for ticker in analysis_data:
+        pelosi_output = deterministic_outputs.get(ticker) or batch_output.signals.get(ticker) or fallback_outputs[ticker]
+
         # Store analysis in consistent format with other agents
         pelosi_analysis[ticker] = {
             "signal": pelosi_output.signal,
@@ -127,9 +273,12 @@ def nancy_pelosi_agent(state: AgentState):
         
         progress.update_status("nancy_pelosi_agent", ticker, "Done")
     
+    # Dataless tickers were filled in first, restore the input order
+    pelosi_analysis = {ticker: pelosi_analysis[ticker] for ticker in tickers}
+    
     # Create the message
     message = HumanMessage(
-        content=json.dumps(pelosi_analysis),
+        content=json_utils.dumps(pelosi_analysis),
         name="nancy_pelosi_agent"
     )
     
@@ -146,26 +295,182 @@ def nancy_pelosi_agent(state: AgentState):
     }
 
 
-def analyze_legislation_impact(company_news: list, ticker: str) -> dict:
+def _analyze_ticker(ticker: str, end_date: str) -> tuple[str, dict | None, bool]:
+    """
+    Fetch data and compute the policy-driven analysis for a single ticker.
+    The analysis is None when there is no news, insider or metrics data to work with.
+    The flag is True when there were both news and insider trades; an analyzer with no input scores 0.
+    """
+    # The five fetches are independent, so issue them in parallel
+    progress.update_status("nancy_pelosi_agent", ticker, "Fetching financial data and news")
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        metrics_future = executor.submit(get_financial_metrics, ticker, end_date, period="annual", limit=5)
+        line_items_future = executor.submit(
+            search_line_items,
+            ticker,
+            [
+                "revenue", 
+                "net_income",
+                "outstanding_shares",
+                "total_assets",
+                "research_and_development",
+                "goodwill_and_intangible_assets",  # Often higher in gov contractors
+            ],
+            end_date,
+            period="annual",
+            limit=5,
+        )
+        market_cap_future = executor.submit(get_market_cap, ticker, end_date)
+        # Analysis of recent news for policy/regulatory mentions
+        news_future = executor.submit(get_company_news, ticker, end_date, limit=100)
+        # Get insider trading data to identify patterns
+        insider_trades_future = executor.submit(get_insider_trades, ticker, end_date, limit=100)
+
+        company_news = news_future.result()
+        # Nothing to analyze: no news, no insider trades and no metrics. Skip the analyzers and the LLM.
+        if not company_news and not insider_trades_future.result() and not metrics_future.result():
+            return ticker, None, False
+
+        # Lowercase each title once and classify it against every keyword set in a single pass
+        news_lowered = [(news, news.title.lower()) for news in company_news or []]
+        news_summary = _analyze_all_news(news_lowered)
+
+        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing legislation impact")
+        legislation_analysis = analyze_legislation_impact(news_summary, ticker)
+
+        financial_line_items = line_items_future.result()
+        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing government contract potential")
+        gov_contract_analysis = analyze_government_contracts(financial_line_items, news_summary)
+
+        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing policy trends")
+        policy_analysis = analyze_policy_trends(news_summary, ticker)
+
+        insider_trades = insider_trades_future.result()
+        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing information asymmetry")
+        asymmetry_analysis = analyze_information_asymmetry(news_summary, insider_trades, ticker)
+
+        progress.update_status("nancy_pelosi_agent", ticker, "Analyzing congressional trading patterns")
+        congressional_trading = analyze_congressional_trading(ticker, insider_trades, news_summary)
+
+        market_cap = market_cap_future.result()
+        metrics = metrics_future.result()
+    
+    # Calculate total score with higher weight on information asymmetry and congressional trading
+    total_score = (
+        legislation_analysis["score"] * 0.2 + 
+        gov_contract_analysis["score"] * 0.2 + 
+        policy_analysis["score"] * 0.2 +
+        asymmetry_analysis["score"] * 0.2 +
+        congressional_trading["score"] * 0.2
+    )
+    max_possible_score = 10
+    
+    # Generate trading signal
+    if total_score >= 0.65 * max_possible_score:  # Lower threshold - biased toward action
+        signal = "bullish"
+    elif total_score <= 0.35 * max_possible_score:
+        signal = "bearish"
+    else:
+        signal = "neutral"
+    
+    # Combine all analysis results
+    analysis_entry = {
+        "signal": signal,
+        "score": total_score,
+        "max_score": max_possible_score,
+        "legislation_analysis": legislation_analysis,
+        "gov_contract_analysis": gov_contract_analysis,
+        "policy_analysis": policy_analysis,
+        "asymmetry_analysis": asymmetry_analysis,
+        "congressional_trading": congressional_trading,
+        "market_cap": market_cap,
+    }
+    
+    return ticker, analysis_entry, bool(company_news) and bool(insider_trades)
+
+
+def _is_extreme_score(ticker_analysis: dict, threshold: float) -> bool:
+    """
+    True when the score is within the top or bottom (1 - threshold) share of its range.
+    Only meaningful for tickers with news and insider trades: without them the analyzers score 0,
+    so a low score means missing evidence, not a strong bearish case.
+    """
+    total_score = ticker_analysis["score"]
+    max_possible_score = ticker_analysis["max_score"]
+    return total_score >= threshold * max_possible_score or total_score <= (1 - threshold) * max_possible_score
+
+
+def _create_deterministic_signal(ticker_analysis: dict) -> NancyPelosiSignal:
+    """Build the signal straight from the scored analysis, without an LLM call."""
+    reasoning = "; ".join(
+        ticker_analysis[section]["details"]
+        for section in (
+            "legislation_analysis",
+            "gov_contract_analysis",
+            "policy_analysis",
+            "asymmetry_analysis",
+            "congressional_trading",
+        )
+    )
+    return NancyPelosiSignal(
+        signal=ticker_analysis["signal"],
+        confidence=min(95.0, abs(ticker_analysis["score"] - 5) * 20),
+        reasoning=reasoning,
+    )
+
+
+def _analyze_all_news(news_lowered: list[tuple]) -> dict:
+    """
+    Classify every news title against all keyword sets in one pass.
+    Returns the matching news per category, news counts per policy area and the sorted news days.
+    """
+    summary = {
+        "total": len(news_lowered),
+        "legislation": [],
+        "gov_contract": [],
+        "policy": {area: 0 for area in POLICY_AREAS},
+        "asymmetry": [],
+        "high_value_asymmetry": [],
+        "congress": [],
+        "news_days": [],
+    }
+    
+    for news, title_lower in news_lowered:
+        if _LEGISLATION_PATTERN.search(title_lower):
+            summary["legislation"].append(news)
+        if _CONTRACT_PATTERN.search(title_lower):
+            summary["gov_contract"].append(news)
+        areas_hit = set()
+        for match in _POLICY_PATTERN.finditer(title_lower):
+            areas_hit |= _POLICY_KEYWORD_AREAS[match.group(1)]
+        for area in areas_hit:
+            summary["policy"][area] += 1
+        if _ASYMMETRY_PATTERN.search(title_lower):
+            summary["asymmetry"].append(news)
+            # Identify particularly valuable asymmetric information
+            if _HIGH_VALUE_ASYMMETRY_PATTERN.search(title_lower):
+                summary["high_value_asymmetry"].append(news)
+        if _CONGRESS_PATTERN.search(title_lower):
+            summary["congress"].append(news)
+        day = _to_ordinal(news.date)
+        if day is not None:
+            summary["news_days"].append(day)
+    
+    summary["news_days"].sort()
+    return summary
+
+
+def analyze_legislation_impact(news_summary: dict, ticker: str) -> dict:
     """
     Analyze recent news for mentions of policy or regulatory changes affecting the company.
     Focus on identifying pre-public information about policy changes that could create profit opportunities.
     """
-    if not company_news:
+    if not news_summary["total"]:
         return {
             "score": 0,
             "details": "No news data available for legislation analysis"
         }
     
-    # Keywords related to policy and legislation
-    legislation_keywords = [
-        "bill", "act", "legislation", "congress", "senate", "house", "regulation", 
-        "regulatory", "policy", "subsidies", "tax credit", "incentive", "stimulus",
-        "appropriation", "federal funding", "government program", "committee hearing",
-        "draft legislation", "upcoming vote", "markup session", "lobbying",
-        "earmark", "omnibus", "reconciliation"
-    ]
-    
     # Score parameters
     score = 0
     relevant_news_count = 0
@@ -173,25 +478,25 @@ def analyze_legislation_impact(company_news: list, ticker: str) -> dict:
     negative_legislation_count = 0
     details = []
     
+    # All news items share one schema, so check for a sentiment field once
+    legislation_news = news_summary["legislation"]
+    has_sentiment = bool(legislation_news) and hasattr(legislation_news[0], 'sentiment')
+    
     # Legislation analysis
-    for news in company_news:
-        title_lower = news.title.lower()
+    for news in legislation_news:
+        relevant_news_count += 1
         
-        # Check for legislation-related news
-        if any(keyword in title_lower for keyword in legislation_keywords):
-            relevant_news_count += 1
-            
-            # Score the sentiment for legislation impact
-            sentiment = news.sentiment if hasattr(news, 'sentiment') and news.sentiment else "neutral"
-            
-            if sentiment == "positive":
-                positive_legislation_count += 1
-                score += 1
-                details.append(f"Positive legislation impact: {news.title}")
-            elif sentiment == "negative":
-                negative_legislation_count += 1
-                score -= 1
-                details.append(f"Negative legislation impact: {news.title}")
+        # Score the sentiment for legislation impact
+        sentiment = (news.sentiment or "neutral") if has_sentiment else "neutral"
+        delta = _SENTIMENT_SCORE.get(sentiment, 0)
+        score += delta
+        
+        if delta > 0:
+            positive_legislation_count += 1
+            details.append(f"Positive legislation impact: {news.title}")
+        elif delta < 0:
+            negative_legislation_count += 1
+            details.append(f"Negative legislation impact: {news.title}")
     
     # Additional score boost for significant legislative activity
     if relevant_news_count > 5:
@@ -224,7 +529,7 @@ def analyze_legislation_impact(company_news: list, ticker: str) -> dict:
     }
 
 
-def analyze_government_contracts(financial_line_items: list, company_news: list) -> dict:
+def analyze_government_contracts(financial_line_items: list, news_summary: dict) -> dict:
     """
     Analyze company's potential for securing government contracts.
     
@@ -237,22 +542,10 @@ def analyze_government_contracts(financial_line_items: list, company_news: list)
     score = 0
     details = []
     
-    # Contract-related news keywords
-    contract_keywords = [
-        "contract", "procurement", "award", "bid", "tender", "government deal", 
-        "federal contract", "defense contract", "agency award", "government client",
-        "government purchase", "government supplier", "vendor", "appropriation",
-        "request for proposal", "RFP", "no-bid contract", "sole source"
-    ]
-    
     # Check for contract-related news
-    contract_news_count = 0
-    if company_news:
-        for news in company_news:
-            title_lower = news.title.lower()
-            if any(keyword in title_lower for keyword in contract_keywords):
-                contract_news_count += 1
-                details.append(f"Contract potential indicated in news: {news.title}")
+    contract_news_count = len(news_summary["gov_contract"])
+    for news in news_summary["gov_contract"]:
+        details.append(f"Contract potential indicated in news: {news.title}")
     
     if contract_news_count > 3:
         score += 3
@@ -262,7 +555,7 @@ def analyze_government_contracts(financial_line_items: list, company_news: list)
         details.append(f"Some contract news: {contract_news_count} related items")
     
     # Analyze financial data for government contract indicators
-    if financial_line_items and len(financial_line_items) > 0:
+    if financial_line_items:
         # High goodwill often indicates acquisitions of government contractors
         if hasattr(financial_line_items[0], 'goodwill_and_intangible_assets') and financial_line_items[0].goodwill_and_intangible_assets:
             goodwill_to_assets_ratio = financial_line_items[0].goodwill_and_intangible_assets / financial_line_items[0].total_assets if financial_line_items[0].total_assets else 0
@@ -272,9 +565,12 @@ def analyze_government_contracts(financial_line_items: list, company_news: list)
                 details.append(f"High goodwill ratio ({goodwill_to_assets_ratio:.2f}) suggests acquisitions of contracted businesses")
         
         # Stable revenue patterns often indicate long-term government contracts
-        revenues = [item.revenue for item in financial_line_items if hasattr(item, 'revenue') and item.revenue is not None]
+        revenues = np.asarray(
+            [item.revenue for item in financial_line_items if hasattr(item, 'revenue') and item.revenue is not None],
+            dtype=np.float64,
+        )
         if len(revenues) >= 3:
-            revenue_volatility = sum(abs((revenues[i] / revenues[i+1]) - 1) for i in range(len(revenues)-1)) / (len(revenues)-1) if all(r > 0 for r in revenues) else 1
+            revenue_volatility = _revenue_volatility(revenues) if np.all(revenues > 0) else 1
             
             if revenue_volatility < 0.1:
                 score += 2
@@ -295,37 +591,35 @@ def analyze_government_contracts(financial_line_items: list, company_news: list)
     }
 
 
-def analyze_policy_trends(company_news: list, ticker: str) -> dict:
+@njit(cache=True, fastmath=True)
+def _revenue_volatility(revenues):
+    """Mean absolute period-over-period revenue change; revenues must all be positive."""
+    acc = 0.0
+    for i in range(len(revenues) - 1):
+        acc += abs(revenues[i] / revenues[i + 1] - 1.0)
+    return acc / (len(revenues) - 1)
+
+
+def analyze_policy_trends(news_summary: dict, ticker: str) -> dict:
     """
     Analyze broader policy trends that might affect the company's prospects
     
     Examines sector-wide policy changes, regulatory environments,
     and government priorities that could impact future performance.
     """
+    if not news_summary["total"]:
+        return {
+            "score": 0,
+            "details": "No news data available for policy trend analysis"
+        }
+    
     score = 0
     details = []
     
-    # Keywords for policy areas often subject to government action
-    policy_areas = {
-        'technology': ['tech', 'technology', 'software', 'data', 'privacy', 'cybersecurity', 'ai', 'artificial intelligence'],
-        'healthcare': ['health', 'medical', 'medicare', 'medicaid', 'affordable care', 'pharma', 'drug', 'vaccine'],
-        'finance': ['bank', 'financial', 'credit', 'loan', 'interest rate', 'federal reserve', 'treasury'],
-        'energy': ['energy', 'oil', 'gas', 'renewable', 'solar', 'wind', 'climate', 'carbon', 'emissions'],
-        'infrastructure': ['infrastructure', 'construction', 'transportation', 'highway', 'bridge', 'road', 'rail'],
-        'defense': ['defense', 'military', 'security', 'weapons', 'contractor', 'army', 'navy', 'air force']
-    }
-    
-    # Count news by policy area
-    policy_area_counts = {area: 0 for area in policy_areas}
+    # News counts by policy area
+    policy_area_counts = news_summary["policy"]
     trending_policy_areas = []
     
-    for news in company_news:
-        title_lower = news.title.lower()
-        
-        for area, keywords in policy_areas.items():
-            if any(keyword in title_lower for keyword in keywords):
-                policy_area_counts[area] += 1
-    
     # Identify trending policy areas (areas with significant news coverage)
     for area, count in policy_area_counts.items():
         if count > 5:
@@ -338,29 +632,22 @@ def analyze_policy_trends(company_news: list, ticker: str) -> dict:
             details.append(f"Some {area} policy activity: {count} news items - worth monitoring closely")
     
     # Additional score for sectors with current legislative momentum
-    priority_sectors = ['infrastructure', 'technology', 'healthcare', 'energy']
-    if any(area in priority_sectors for area in trending_policy_areas):
+    if any(area in PRIORITY_POLICY_SECTORS for area in trending_policy_areas):
         score += 2
-        details.append(f"Company in high-priority policy sectors: {[area for area in trending_policy_areas if area in priority_sectors]} - favorable positioning")
+        details.append(f"Company in high-priority policy sectors: {[area for area in trending_policy_areas if area in PRIORITY_POLICY_SECTORS]} - favorable positioning")
     
     # Analysis of policy implications
     if len(trending_policy_areas) > 1:
         score += 1
         details.append(f"Multiple policy areas ({', '.join(trending_policy_areas)}) create cross-sector opportunities")
     
-    if not company_news:
-        return {
-            "score": 0,
-            "details": "No news data available for policy trend analysis"
-        }
-    
     return {
         "score": score,
         "details": "; ".join(details) if details else "No significant policy trends detected"
     }
 
 
-def analyze_information_asymmetry(company_news: list, insider_trades: list, ticker: str) -> dict:
+def analyze_information_asymmetry(news_summary: dict, insider_trades: list, ticker: str) -> dict:
     """
     Analyze information asymmetry opportunities based on policy knowledge.
     Looks for patterns indicating potential policy-driven information advantage.
@@ -371,30 +658,11 @@ def analyze_information_asymmetry(company_news: list, insider_trades: list, tick
     score = 0
     details = []
     
-    # Key terms indicating potential information asymmetry
-    asymmetry_keywords = [
-        "upcoming announcement", "pending approval", "not yet public", "confidential", 
-        "internal documents", "sources familiar", "expected to announce", "advance notice",
-        "exclusive", "unreleased", "leaked", "to be determined", "advance knowledge",
-        "preliminary results", "draft report", "early findings", "before official release",
-        "closed-door meeting", "private briefing", "insider", "tip", "rumor", "not widely known"
-    ]
-    
     # Check for news indicating non-public information
-    asymmetry_news_count = 0
-    high_value_asymmetry = 0
-    
-    if company_news:
-        for news in company_news:
-            title_lower = news.title.lower()
-            
-            if any(keyword in title_lower for keyword in asymmetry_keywords):
-                asymmetry_news_count += 1
-                
-                # Identify particularly valuable asymmetric information
-                if any(term in title_lower for term in ["approval", "contract award", "investigation", "regulatory action"]):
-                    high_value_asymmetry += 1
-                    details.append(f"High-value information asymmetry: {news.title}")
+    asymmetry_news_count = len(news_summary["asymmetry"])
+    high_value_asymmetry = len(news_summary["high_value_asymmetry"])
+    for news in news_summary["high_value_asymmetry"]:
+        details.append(f"High-value information asymmetry: {news.title}")
     
     # Score based on potential information advantage
     if high_value_asymmetry > 0:
@@ -408,22 +676,23 @@ def analyze_information_asymmetry(company_news: list, insider_trades: list, tick
         details.append(f"Possible information advantage: {asymmetry_news_count} items")
     
     # Analyze timing patterns between news and insider activity
-    if company_news and insider_trades and len(insider_trades) > 0:
+    if news_summary["total"] and insider_trades:
         # Look for insider trading before significant news
-        news_dates = [news.date for news in company_news]
-        trade_dates = [trade.transaction_date for trade in insider_trades if trade.transaction_date]
+        # Dates are parsed once and both sorted lists are swept instead of comparing every pair
+        news_days = news_summary["news_days"]
+        trade_days = sorted(day for day in (_to_ordinal(trade.transaction_date) for trade in insider_trades) if day is not None)
         
         # Simple pattern detection - this could be enhanced with more sophisticated analysis
-        pattern_detected = False
-        for trade_date in trade_dates:
-            for news_date in news_dates:
-                if trade_date and news_date and trade_date < news_date:
-                    days_diff = (datetime.strptime(news_date, "%Y-%m-%d") - datetime.strptime(trade_date, "%Y-%m-%d")).days
-                    if 1 <= days_diff <= 30:  # Trading within 30 days before news
-                        pattern_detected = True
-                        details.append(f"Potential information timing pattern: trading activity {days_diff} days before news")
-                        break
-            if pattern_detected:
+        j = 0
+        for trade_day in trade_days:
+            # First news item at least one day after the trade; trade_days only grow, so j never moves back
+            while j < len(news_days) and news_days[j] <= trade_day:
+                j += 1
+            if j == len(news_days):
+                break
+            days_diff = news_days[j] - trade_day
+            if days_diff <= 30:  # Trading within 30 days before news
+                details.append(f"Potential information timing pattern: trading activity {days_diff} days before news")
                 score += 2
                 break
     
@@ -433,7 +702,17 @@ def analyze_information_asymmetry(company_news: list, insider_trades: list, tick
     }
 
 
-def analyze_congressional_trading(ticker: str, insider_trades: list, company_news: list) -> dict:
+def _to_ordinal(value: str | None) -> int | None:
+    """Day number of a YYYY-MM-DD (or longer ISO) date string, None if missing or unparseable."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def analyze_congressional_trading(ticker: str, insider_trades: list, news_summary: dict) -> dict:
     """
     Analyze patterns of congressional trading and policy timing.
     Looks for relationships between insider activity and policy events.
@@ -443,22 +722,10 @@ def analyze_congressional_trading(ticker: str, insider_trades: list, company_new
     score = 0
     details = []
     
-    # Congressional trading keywords in news
-    congress_keywords = [
-        "congress", "congressman", "congresswoman", "senator", "representative", 
-        "house member", "committee chair", "subcommittee", "pelosi", "schumer", 
-        "mcconnell", "committee", "caucus", "congressional trading", "disclosure",
-        "financial disclosure", "stock act", "ethics filing"
-    ]
-    
     # Check for congressional trading related news
-    congress_news_count = 0
-    if company_news:
-        for news in company_news:
-            title_lower = news.title.lower()
-            if any(keyword in title_lower for keyword in congress_keywords):
-                congress_news_count += 1
-                details.append(f"Congress-related trading news: {news.title}")
+    congress_news_count = len(news_summary["congress"])
+    for news in news_summary["congress"]:
+        details.append(f"Congress-related trading news: {news.title}")
     
     if congress_news_count > 2:
         score += 3
@@ -470,8 +737,14 @@ def analyze_congressional_trading(ticker: str, insider_trades: list, company_new
     # Analyze buy/sell patterns for potential information advantage
     if insider_trades and len(insider_trades) > 5:
         # Count buys vs sells
-        buys = sum(1 for trade in insider_trades if trade.transaction_shares > 0)
-        sells = sum(1 for trade in insider_trades if trade.transaction_shares < 0)
+        # Missing share counts become NaN, which counts as neither a buy nor a sell
+        shares = np.fromiter(
+            (np.nan if trade.transaction_shares is None else trade.transaction_shares for trade in insider_trades),
+            dtype=np.float64,
+            count=len(insider_trades),
+        )
+        buys = int(np.count_nonzero(shares > 0))
+        sells = int(np.count_nonzero(shares < 0))
         
         # Calculate buy/sell ratio
         if buys + sells > 0:
@@ -485,23 +758,13 @@ def analyze_congressional_trading(ticker: str, insider_trades: list, company_new
                 details.append(f"Strong insider selling pattern: {(1-buy_ratio):.0%} sells - indicates negative information advantage")
     
     # Check for specific sectors with high congressional trading activity
-    congress_heavy_sectors = {
-        "tech": ["AAPL", "MSFT", "GOOG", "GOOGL", "META", "AMZN", "NVDA"],
-        "pharma": ["PFE", "JNJ", "MRK", "ABBV", "LLY"],
-        "defense": ["LMT", "RTX", "NOC", "GD", "BA"],
-        "energy": ["XOM", "CVX", "COP", "SLB", "EOG"],
-        "finance": ["JPM", "BAC", "GS", "MS", "WFC"]
-    }
-    
-    for sector, tickers in congress_heavy_sectors.items():
-        if ticker in tickers:
-            score += 1
-            details.append(f"Company in {sector} sector with high congressional trading activity")
-            break
+    sector = _CONGRESS_HEAVY_SECTOR_BY_TICKER.get(ticker)
+    if sector:
+        score += 1
+        details.append(f"Company in {sector} sector with high congressional trading activity")
     
     # Finally, check known historically high congressional trading stocks
-    high_trading_stocks = ["AAPL", "MSFT", "AMZN", "GOOGL", "TSLA", "NVDA", "PFE", "JNJ"]
-    if ticker in high_trading_stocks:
+    if ticker in HIGH_TRADING_STOCKS:
         score += 2
         details.append(f"{ticker} is among top stocks with historical congressional trading activity")
     
@@ -513,64 +776,45 @@ def analyze_congressional_trading(ticker: str, insider_trades: list, company_new
 
 def generate_pelosi_output(
     ticker: str,
-    analysis_data: dict[str, any],
+    ticker_analysis: dict[str, any],
     model_name: str,
     model_provider: str,
 ) -> NancyPelosiSignal:
     """Generate congressional trading style investment decision from LLM."""
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You analyze stocks based on information advantage and policy knowledge:
-
-            1. Identify regulatory arbitrage opportunities where policy knowledge creates profit
-            2. Evaluate companies positioned to benefit from upcoming legislation
-            3. Find asymmetric information opportunities before public market awareness
-            4. Determine which companies have direct government revenue streams
-            5. Track actual congressional trading patterns for confirming signals
-            
-            Key investment principles:
-            - Use advanced knowledge of policy directions before market prices adjust
-            - Identify legislation impacts on specific companies before wide awareness
-            - Position ahead of government contract awards and appropriations
-            - Monitor committee activities for sector impacts
-            - Leverage information advantages legally but aggressively
-            
-            Your analysis is purely profit-focused, logical, and direct. You prioritize identifying information asymmetry that creates actionable trading opportunities.
-            """
-        ),
-        (
-            "human",
-            """Based on the following policy-driven analysis, create an investment signal:
-
-            Analysis Data for {ticker}:
-            {analysis_data}
-
-            Return the trading signal in the following JSON format:
-            {{
-              "signal": "bullish/bearish/neutral",
-              "confidence": float (0-100),
-              "reasoning": "string"
-            }}
-            """
-        )
-    ])
-
     # Generate the prompt
-    prompt = template.invoke({
-        "analysis_data": json.dumps(analysis_data, indent=2),
+    prompt = _PELOSI_PROMPT.invoke({
+        "analysis_data": json_utils.dumps({ticker: ticker_analysis}, indent=True),
         "ticker": ticker
     })
 
-    # Create default factory for NancyPelosiSignal
-    def create_default_signal():
-        return NancyPelosiSignal(signal="neutral", confidence=0.0, reasoning="Error in analysis, defaulting to neutral")
-
     return call_llm(
         prompt=prompt,
         model_name=model_name,
         model_provider=model_provider,
         pydantic_model=NancyPelosiSignal,
         agent_name="nancy_pelosi_agent",
-        default_factory=create_default_signal,
-    ) 
\ No newline at end of file
+        default_factory=_create_default_signal,
+    ) 
+
+
+def generate_pelosi_batch_output(
+    analysis_data: dict[str, any],
+    model_name: str,
+    model_provider: str,
+) -> NancyPelosiBatchSignal:
+    """
+    Generate congressional trading style investment decisions for every ticker in a single LLM call.
+    Tickers missing from the response are left out of the returned signals.
+    """
+    prompt = _PELOSI_BATCH_PROMPT.invoke({
+        "analysis_data": json_utils.dumps(analysis_data, indent=True),
+    })
+
+    return call_llm(
+        prompt=prompt,
+        model_name=model_name,
+        model_provider=model_provider,
+        pydantic_model=NancyPelosiBatchSignal,
+        agent_name="nancy_pelosi_agent",
+        default_factory=_create_default_batch_signal,
+    )
@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
 from datetime import datetime, timedelta
 
 from tools.api import get_financial_metrics, get_market_cap, search_line_items, get_company_news, get_insider_trades, get_prices
@@ -131,19 +131,26 @@ def peter_lynch_agent(state: AgentState):
         }
 
         progress.update_status("peter_lynch_agent", ticker, "Generating Peter Lynch analysis")
-        lynch_output = generate_lynch_output(
+
+    # The LLM calls are independent per ticker, so dispatch them concurrently in batches
+    llm_outputs = map_llm_calls(
+        lambda ticker: generate_lynch_output(
             ticker=ticker,
             analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
+        ),
+        tickers,
+        state["metadata"],
+    )
 
+    for ticker in tickers:
+        lynch_output = llm_outputs[ticker]
         lynch_analysis[ticker] = {
             "signal": lynch_output.signal,
             "confidence": lynch_output.confidence,
             "reasoning": lynch_output.reasoning,
         }
-
         progress.update_status("peter_lynch_agent", ticker, "Done")
 
     # Wrap up results
@@ -30,6 +30,14 @@ def risk_management_agent(state: AgentState):
     else:
         position_limit_ratio = 0.20  # 20% (5個以上)
 
+    # The portfolio doesn't change while sizing positions, so its totals are computed once, not per ticker
+    cash = portfolio.get("cash", 0)
+    cost_basis = portfolio.get("cost_basis", {})
+    total_portfolio_value = cash + sum(cost_basis.values())
+    # 根據標的物數量動態計算投資上限
+    # Dynamic position limit based on number of tickers
+    position_limit = total_portfolio_value * position_limit_ratio
+
     for ticker in tickers:
         progress.update_status("risk_management_agent", ticker, "Analyzing price data")
 
@@ -52,20 +60,13 @@ def risk_management_agent(state: AgentState):
         current_prices[ticker] = current_price  # Store the current price
 
         # Calculate current position value for this ticker
-        current_position_value = portfolio.get("cost_basis", {}).get(ticker, 0)
-
-        # Calculate total portfolio value using stored prices
-        total_portfolio_value = portfolio.get("cash", 0) + sum(portfolio.get("cost_basis", {}).get(t, 0) for t in portfolio.get("cost_basis", {}))
-
-        # 根據標的物數量動態計算投資上限
-        # Dynamic position limit based on number of tickers
-        position_limit = total_portfolio_value * position_limit_ratio
+        current_position_value = cost_basis.get(ticker, 0)
 
         # For existing positions, subtract current position value from limit
         remaining_position_limit = position_limit - current_position_value
 
         # Ensure we don't exceed available cash
-        max_position_size = min(remaining_position_limit, portfolio.get("cash", 0))
+        max_position_size = min(remaining_position_limit, cash)
 
         risk_analysis[ticker] = {
             "remaining_position_limit": float(max_position_size),
@@ -75,7 +76,7 @@ def risk_management_agent(state: AgentState):
                 "current_position": float(current_position_value),
                 "position_limit": float(position_limit),
                 "remaining_limit": float(remaining_position_limit),
-                "available_cash": float(portfolio.get("cash", 0)),
+                "available_cash": float(cash),
             },
         }
 
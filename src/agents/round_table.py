@@ -3,21 +3,55 @@ from langchain_core.prompts import ChatPromptTemplate
 from graph.state import AgentState, show_agent_reasoning
 from pydantic import BaseModel, Field
 import json
+import os
+import statistics
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing_extensions import Literal
 from utils.progress import progress
 from utils.llm import call_llm
-from colorama import Fore, Style
+from utils import json_utils
+from data.cache import DAY, SemanticCache, disk_cached
+from llm.models import ModelProvider, get_model_info
+from utils.colors import Fore, Style, get_signal_color, print_readable_conversation
+
 
 class RoundTableOutput(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
     confidence: float = Field(description="Confidence level between 0 and 100")
     reasoning: str = Field(description="Detailed reasoning behind the decision")
-    discussion_summary: str = Field(description="Summary of the key points from the discussion")
-    consensus_view: str = Field(description="The main consensus view that emerged")
-    dissenting_opinions: str = Field(description="Notable contrarian perspectives")
     conversation_transcript: str = Field(description="Transcript of the simulated conversation")
 
 
+class RoundTableBatchOutput(BaseModel):
+    discussions: dict[str, RoundTableOutput]
+
+
+# Synthesizing the signals into a discussion doesn't need a frontier model; the small model of
+# the same provider answers several times faster and works with the API key already configured
+ROUND_TABLE_DEFAULT_MODELS = {
+    ModelProvider.OPENAI.value: "gpt-4o-mini",
+    ModelProvider.ANTHROPIC.value: "claude-3-5-haiku-latest",
+    ModelProvider.GROQ.value: "llama-3.1-8b-instant",
+    ModelProvider.GEMINI.value: "gemini-2.0-flash",
+}
+
+
+def get_round_table_model(model_name: str, model_provider: str) -> tuple[str, str]:
+    """
+    Pick the model for the round table: ROUND_TABLE_MODEL when set, otherwise
+    the small model of the selected provider.
+    """
+    configured = os.environ.get("ROUND_TABLE_MODEL")
+    if configured:
+        model_info = get_model_info(configured)
+        if model_info:
+            return model_info.model_name, model_info.provider.value
+        return configured, model_provider
+    provider = getattr(model_provider, "value", model_provider)
+    return ROUND_TABLE_DEFAULT_MODELS.get(provider, model_name), model_provider
+
+
 def round_table(data, model_name, model_provider, show_reasoning=True):
     """
     Simulates a round table discussion among investment analysts based on their signals.
@@ -45,23 +79,29 @@ def round_table(data, model_name, model_provider, show_reasoning=True):
     
     print(f"Available signals from: {list(analyst_signals.keys())}")
     
+    model_name, model_provider = get_round_table_model(model_name, model_provider)
+    
     # Skip risk management and portfolio management signals
     filtered_signals = {
         agent: signals for agent, signals in analyst_signals.items() 
         if agent not in ["risk_management_agent", "master_agent", "round_table_agent"]
     }
     
+    # Regroup the signals by ticker once instead of probing every agent for every ticker
+    signals_by_agent_for_ticker = defaultdict(dict)
+    for agent_name, signals in filtered_signals.items():
+        for ticker, signal in signals.items():
+            signals_by_agent_for_ticker[ticker][agent_name] = signal
+    
     # Initialize round table analysis for each ticker
     round_table_analysis = {}
+    signals_by_ticker = {}
     
     for ticker in tickers:
         progress.update_status("round_table", ticker, "Collecting analyst inputs")
         
         # Collect all individual agent signals for this ticker
-        ticker_signals = {}
-        for agent_name, signals in filtered_signals.items():
-            if ticker in signals:
-                ticker_signals[agent_name] = signals[ticker]
+        ticker_signals = signals_by_agent_for_ticker.get(ticker, {})
         
         if not ticker_signals:
             progress.update_status("round_table", ticker, "No signals found for discussion")
@@ -70,23 +110,48 @@ def round_table(data, model_name, model_provider, show_reasoning=True):
         
         print(f"{Fore.CYAN}Found {len(ticker_signals)} analyst signals for {ticker}{Style.RESET_ALL}")
         progress.update_status("round_table", ticker, f"Simulating discussion with {len(ticker_signals)} analysts")
-        
-        # Simulate the round table discussion
-        round_table_output = simulate_round_table(
-            ticker=ticker,
-            ticker_signals=ticker_signals,
-            model_name=model_name,
-            model_provider=model_provider,
-        )
-        
+        # Only the essentials go to the model; full agent payloads would mostly add input tokens
+        signals_by_ticker[ticker] = {agent_name: _compact_signal(signal) for agent_name, signal in ticker_signals.items()}
+    
+    # Unanimous, confident analysts and discussions already held for near-identical signals need no LLM call
+    discussion_outputs = {}
+    pending_signals = {}
+    for ticker, ticker_signals in signals_by_ticker.items():
+        unanimous_output = _unanimous_output(ticker, ticker_signals)
+        if unanimous_output is not None:
+            discussion_outputs[ticker] = unanimous_output
+            continue
+        cached = _discussion_cache.get(*_discussion_cache_key(ticker, ticker_signals, model_name, model_provider))
+        if cached is not None:
+            discussion_outputs[ticker] = RoundTableOutput(**cached)
+        else:
+            pending_signals[ticker] = ticker_signals
+    
+    # A few tickers share each request to amortize the system prompt; the batches run concurrently
+    pending_items = list(pending_signals.items())
+    batches = [
+        dict(pending_items[start:start + ROUND_TABLE_BATCH_SIZE])
+        for start in range(0, len(pending_items), ROUND_TABLE_BATCH_SIZE)
+    ]
+    if batches:
+        with ThreadPoolExecutor(max_workers=max(1, min(ROUND_TABLE_CONCURRENCY, len(batches)))) as executor:
+            futures = [
+                executor.submit(simulate_round_table_batch, batch, model_name, model_provider)
+                for batch in batches
+            ]
+            for future in futures:
+                discussion_outputs.update(future.result())
+    
+    # Keep the input ticker order
+    discussion_outputs = {ticker: discussion_outputs[ticker] for ticker in signals_by_ticker}
+    
+    # Print the discussions one after another, in ticker order
+    for ticker, round_table_output in discussion_outputs.items():
         # Store analysis
         round_table_analysis[ticker] = {
             "signal": round_table_output.signal,
             "confidence": round_table_output.confidence,
             "reasoning": round_table_output.reasoning,
-            "discussion_summary": round_table_output.discussion_summary,
-            "consensus_view": round_table_output.consensus_view,
-            "dissenting_opinions": round_table_output.dissenting_opinions,
             "conversation_transcript": round_table_output.conversation_transcript
         }
         
@@ -116,71 +181,27 @@ def round_table(data, model_name, model_provider, show_reasoning=True):
     return round_table_analysis
 
 
-def print_readable_conversation(transcript: str):
-    """Format and print the conversation in a more readable way with color coding."""
-    lines = transcript.split('\n')
-    
-    # Define colors for different analysts
-    analyst_colors = {
-        "Warren Buffett": Fore.GREEN,
-        "Charlie Munger": Fore.GREEN + Style.BRIGHT,
-        "Ben Graham": Fore.GREEN,
-        "Cathie Wood": Fore.MAGENTA,
-        "Bill Ackman": Fore.BLUE + Style.BRIGHT,
-        "Nancy Pelosi": Fore.CYAN,
-        "Technical Analyst": Fore.YELLOW,
-        "Fundamental Analyst": Fore.WHITE + Style.BRIGHT,
-        "Sentiment Analyst": Fore.RED,
-        "Valuation Analyst": Fore.BLUE,
-        "WSB": Fore.RED + Style.BRIGHT,
-        "Moderator": Fore.WHITE,
-    }
-    
-    current_analyst = None
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if this line starts a new speaker
-        for analyst in analyst_colors:
-            if line.startswith(f"{analyst}:") or line.startswith(f"**{analyst}:**"):
-                current_analyst = analyst
-                # Format: Analyst name in color, then the message
-                name_end = line.find(':') + 1
-                print(f"{analyst_colors[analyst]}{line[:name_end]}{Style.RESET_ALL}{line[name_end:]}")
-                break
-        else:
-            # Continuation of previous speaker or general text
-            if current_analyst and not any(marker in line for marker in ['===', '---', '***']):
-                print(f"  {line}")
-            else:
-                # Section headers or other formatting
-                print(f"{Fore.WHITE}{Style.BRIGHT}{line}{Style.RESET_ALL}")
+_discussion_cache = SemanticCache("round_table")
 
+# Output length drives latency: the prompt budgets the transcript and max_tokens stops runaway generations
+ROUND_TABLE_MAX_TURNS = 8
+ROUND_TABLE_MAX_TRANSCRIPT_TOKENS = 800
+ROUND_TABLE_MAX_TOKENS = 1200
 
-def get_signal_color(signal: str) -> str:
-    """Return the appropriate color for a signal"""
-    if signal.lower() == "bullish":
-        return Fore.GREEN
-    elif signal.lower() == "bearish":
-        return Fore.RED
-    else:
-        return Fore.YELLOW
+# Tickers per batched request; larger batches make a single long response the bottleneck
+ROUND_TABLE_BATCH_SIZE = 5
 
+# Characters of each analyst's reasoning passed on as its key point
+ROUND_TABLE_KEY_POINT_CHARS = 280
 
-def simulate_round_table(
-    ticker: str,
-    ticker_signals: dict[str, any],
-    model_name: str,
-    model_provider: str,
-) -> RoundTableOutput:
-    """Simulate a round table discussion among analysts and reach a decision."""
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are the moderator of an Investment Round Table where various financial analysts 
+# Analysts agreeing with at least this average confidence settle the ticker without a discussion
+ROUND_TABLE_UNANIMOUS_MIN_CONFIDENCE = 80
+
+# Requests in flight at once; keep it under the provider's rate limit so calls don't bounce off 429s
+ROUND_TABLE_CONCURRENCY = max(1, int(os.environ.get("ROUND_TABLE_CONCURRENCY", "5")))
+
+# Kept byte-identical across calls (nothing is interpolated into it) so providers can cache the prefix
+_ROUND_TABLE_SYSTEM_MESSAGE = """You are the moderator of an Investment Round Table where various financial analysts 
             discuss an investment decision. Design a logical, natural conversation where:
 
             1. Each analyst only speaks when they have something valuable to contribute
@@ -219,76 +240,283 @@ def simulate_round_table(
             - Minimal moderator interventions - let the discussion flow
             - Strong opinions clearly expressed
             """
-        ),
-        (
-            "human",
-            """Facilitate a realistic Investment Round Table discussion about {ticker} with the following analyst signals:
-
-            Analyst Signals and Reasoning:
-            {ticker_signals}
-
-            Create a logical discussion flow where each analyst speaks ONLY when they have something valuable 
-            to add. Allow the conversation to continue until all important aspects have been thoroughly 
-            explored and a well-reasoned decision is reached.
-
-            Guidelines:
-            - Let the conversation flow NATURALLY - analysts should respond to each other directly
-            - Keep each contribution CONCISE and TO THE POINT
-            - Allow DISAGREEMENT to play out fully with direct challenges
-            - Don't artificially include everyone - some may contribute more than others
-            - Let discussion continue until a TRUE CONSENSUS emerges (or clear disagreement is documented)
-            - Focus on getting to the RIGHT ANSWER, not a specific format or length
-
-            IMPORTANT FORMAT INSTRUCTIONS:
-            Your response must be a valid JSON object with these fields:
-            - signal: "bullish" or "bearish" or "neutral" string
-            - confidence: a number between 0-100
-            - reasoning: a string explaining the final decision
-            - discussion_summary: a string summarizing key points
-            - consensus_view: a string describing areas of agreement
-            - dissenting_opinions: a string summarizing contrarian views
-            - conversation_transcript: a STRING (not an array/list) containing the complete conversation
-
-            For the conversation_transcript, combine all dialogue into a SINGLE STRING with line breaks.
-            DO NOT format it as an array or list of messages.
-
-            Example of proper JSON format:
-            {{
-              "signal": "bullish",
-              "confidence": 75,
-              "reasoning": "Based on strong growth and valuation...",
-              "discussion_summary": "The committee focused on...",
-              "consensus_view": "Most analysts agreed that...",
-              "dissenting_opinions": "Charlie Munger disagreed with...",
-              "conversation_transcript": "Moderator: Welcome everyone...\\nWarren Buffett: I've looked at...\\nCathie Wood: The innovation potential..."
+
+
+# Built once at import, the prompts never change between calls
+_ROUND_TABLE_DISCUSSION_INSTRUCTIONS = """Facilitate a realistic Investment Round Table discussion about {ticker} with the following analyst signals:
+
+        Analyst Signals and Reasoning:
+        {ticker_signals}
+
+        Create a logical discussion flow where each analyst speaks ONLY when they have something valuable 
+        to add. Allow the conversation to continue until all important aspects have been thoroughly 
+        explored and a well-reasoned decision is reached.
+
+        Guidelines:
+        - Let the conversation flow NATURALLY - analysts should respond to each other directly
+        - Keep each contribution CONCISE and TO THE POINT
+        - Allow DISAGREEMENT to play out fully with direct challenges
+        - Don't artificially include everyone - some may contribute more than others
+        - Let discussion continue until a TRUE CONSENSUS emerges (or clear disagreement is documented)
+        - Focus on getting to the RIGHT ANSWER, not a specific format
+        - Limit the transcript to at most {max_turns} speaker turns and {max_transcript_tokens} tokens total
+        """
+
+_ROUND_TABLE_FORMAT_INSTRUCTIONS = """
+        IMPORTANT FORMAT INSTRUCTIONS:
+        Your response must be a valid JSON object with these fields:
+        - signal: "bullish" or "bearish" or "neutral" string
+        - confidence: a number between 0-100
+        - reasoning: a string explaining the final decision
+        - conversation_transcript: a STRING (not an array/list) containing the complete conversation
+
+        For the conversation_transcript, combine all dialogue into a SINGLE STRING with line breaks.
+        DO NOT format it as an array or list of messages.
+
+        Example of proper JSON format:
+        {{
+          "signal": "bullish",
+          "confidence": 75,
+          "reasoning": "Based on strong growth and valuation...",
+          "conversation_transcript": "Moderator: Welcome everyone...\\nWarren Buffett: I've looked at...\\nCathie Wood: The innovation potential..."
+        }}
+        """
+
+_ROUND_TABLE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _ROUND_TABLE_SYSTEM_MESSAGE),
+    ("human", _ROUND_TABLE_DISCUSSION_INSTRUCTIONS + _ROUND_TABLE_FORMAT_INSTRUCTIONS),
+])
+
+
+_ROUND_TABLE_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _ROUND_TABLE_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Facilitate a separate, realistic Investment Round Table discussion for each of the following tickers.
+        Judge every ticker on its own analyst signals only.
+
+        Analyst Signals and Reasoning by ticker:
+        {tickers_block}
+
+        Guidelines:
+        - Let each conversation flow NATURALLY - analysts should respond to each other directly
+        - Keep each contribution CONCISE and TO THE POINT
+        - Allow DISAGREEMENT to play out with direct challenges
+        - Don't artificially include everyone - some may contribute more than others
+        - Limit each transcript to at most {max_turns} speaker turns and {max_transcript_tokens} tokens total
+
+        Return JSON exactly in this format, with one entry per ticker. Each conversation_transcript is a
+        SINGLE STRING with line breaks, not an array or list of messages:
+        {{
+          "discussions": {{
+            "<ticker>": {{
+              "signal": "bullish" or "bearish" or "neutral",
+              "confidence": float (0-100),
+              "reasoning": "string",
+              "conversation_transcript": "Moderator: Welcome everyone...\\nWarren Buffett: I've looked at..."
             }}
-            """
-        )
-    ])
+          }}
+        }}
+        """
+    )
+])
 
+
+def create_default_output() -> RoundTableOutput:
+    """Fallback output used when the discussion could not be generated."""
+    return RoundTableOutput(
+        signal="neutral",
+        confidence=0.0,
+        reasoning="Error in generating discussion, defaulting to neutral",
+        conversation_transcript="Discussion generation failed"
+    )
+
+
+def _compact_signal(signal: any) -> any:
+    """Project an agent's signal onto signal, confidence and the start of its reasoning."""
+    if not isinstance(signal, dict):
+        return signal
+    reasoning = signal.get("reasoning") or ""
+    if not isinstance(reasoning, str):
+        # Some agents report structured reasoning
+        reasoning = json_utils.dumps(reasoning)
+    return {
+        "signal": signal.get("signal"),
+        "confidence": signal.get("confidence"),
+        "key_point": reasoning[:ROUND_TABLE_KEY_POINT_CHARS],
+    }
+
+
+def _unanimous_output(ticker: str, ticker_signals: dict[str, any]) -> RoundTableOutput | None:
+    """
+    Build the outcome locally when every analyst gives the same signal with an average
+    confidence of at least ROUND_TABLE_UNANIMOUS_MIN_CONFIDENCE; None when there is anything to debate.
+    """
+    signals = [signal for signal in ticker_signals.values() if isinstance(signal, dict)]
+    if not signals or len(signals) != len(ticker_signals):
+        return None
+    signal_values = {signal.get("signal") for signal in signals}
+    if len(signal_values) != 1:
+        return None
+    consensus = signal_values.pop()
+    if consensus not in ("bullish", "bearish", "neutral"):
+        return None
+    try:
+        confidence = statistics.mean(float(signal.get("confidence") or 0) for signal in signals)
+    except (TypeError, ValueError):
+        return None
+    if confidence < ROUND_TABLE_UNANIMOUS_MIN_CONFIDENCE:
+        return None
+
+    transcript_lines = [f"Moderator: All {len(signals)} analysts are {consensus} on {ticker}, so there is nothing to debate."]
+    for agent_name, signal in ticker_signals.items():
+        analyst = agent_name.replace("_agent", "").replace("_", " ").title()
+        transcript_lines.append(f"{analyst}: {consensus.capitalize()}, {signal.get('confidence')}% confidence.")
+    return RoundTableOutput(
+        signal=consensus,
+        confidence=round(confidence, 1),
+        reasoning=f"Unanimous {consensus} signal from {len(signals)} analysts with an average confidence of {confidence:.1f}%",
+        conversation_transcript="\n".join(transcript_lines),
+    )
+
+
+def _discussion_cache_key(ticker: str, ticker_signals: dict[str, any], model_name: str, model_provider: str) -> tuple[str, str]:
+    """
+    Scope and text for the discussion cache. The scope pins the ticker, the model and every
+    analyst's call with its confidence to the nearest 10, so only the wording of the reasoning
+    and small confidence moves may drift between hits.
+    """
+    calls = {
+        agent: [signal.get("signal"), round(float(signal.get("confidence") or 0), -1)]
+        for agent, signal in ticker_signals.items()
+        if isinstance(signal, dict)
+    }
+    scope = json.dumps([ticker, model_provider, model_name, calls], sort_keys=True)
+    return scope, json.dumps(ticker_signals, sort_keys=True, default=str)
+
+
+def simulate_round_table_batch(
+    signals_by_ticker: dict[str, dict[str, any]],
+    model_name: str,
+    model_provider: str,
+) -> dict[str, RoundTableOutput]:
+    """Hold the discussions for several tickers in one LLM call, falling back to one call per missing ticker."""
+    if len(signals_by_ticker) == 1:
+        ticker, ticker_signals = next(iter(signals_by_ticker.items()))
+        return {ticker: simulate_round_table(ticker, ticker_signals, model_name, model_provider)}
+
+    prompt = _ROUND_TABLE_BATCH_PROMPT.invoke({
+        # Compact JSON: the model doesn't need indentation and it costs input tokens
+        "tickers_block": json_utils.dumps(
+            [{"ticker": ticker, "signals": ticker_signals} for ticker, ticker_signals in signals_by_ticker.items()]
+        ),
+        "max_turns": ROUND_TABLE_MAX_TURNS,
+        "max_transcript_tokens": ROUND_TABLE_MAX_TRANSCRIPT_TOKENS,
+    })
+
+    reported_tickers = set()
+
+    def report_verdicts(partial: dict) -> None:
+        # Same early verdict as the single-ticker call, for each discussion as it streams in
+        for ticker, discussion in (partial.get("discussions") or {}).items():
+            if ticker in signals_by_ticker and ticker not in reported_tickers and "reasoning" in discussion:
+                reported_tickers.add(ticker)
+                progress.update_status(
+                    "round_table", ticker, f"Leaning {discussion.get('signal')} ({discussion.get('confidence')}%), finishing discussion"
+                )
+
+    batch_output = call_llm(
+        prompt=prompt,
+        model_name=model_name,
+        model_provider=model_provider,
+        pydantic_model=RoundTableBatchOutput,
+        agent_name="round_table",
+        default_factory=lambda: RoundTableBatchOutput(discussions={}),
+        stream_callback=report_verdicts,
+        max_tokens=ROUND_TABLE_MAX_TOKENS * len(signals_by_ticker),
+    )
+
+    discussion_outputs = {}
+    for ticker, ticker_signals in signals_by_ticker.items():
+        round_table_output = batch_output.discussions.get(ticker)
+        if round_table_output is None:
+            # Missing or malformed entry in the batch response, hold this discussion alone
+            round_table_output = simulate_round_table(ticker, ticker_signals, model_name, model_provider)
+        else:
+            _discussion_cache.set(
+                *_discussion_cache_key(ticker, ticker_signals, model_name, model_provider), round_table_output.model_dump(), flush=False
+            )
+        discussion_outputs[ticker] = round_table_output
+    # One write for the whole batch
+    _discussion_cache.flush()
+    return discussion_outputs
+
+
+def simulate_round_table(
+    ticker: str,
+    ticker_signals: dict[str, any],
+    model_name: str,
+    model_provider: str,
+) -> RoundTableOutput:
+    """
+    Simulate a round table discussion among analysts and reach a decision.
+    Signals that only differ in the wording of the reasoning reuse an earlier discussion through the
+    semantic cache; identical signals are served by _generate_discussion's disk cache, whose in-memory
+    layer also covers repeats within the process. Both expire after a day.
+    """
+    scope, signals_text = _discussion_cache_key(ticker, ticker_signals, model_name, model_provider)
+    cached = _discussion_cache.get(scope, signals_text)
+    if cached is not None:
+        return RoundTableOutput(**cached)
+
+    # Failed calls are never stored
+    round_table_output = _generate_discussion(ticker, ticker_signals, model_name, model_provider)
+    if round_table_output is None:
+        return create_default_output()
+    _discussion_cache.set(scope, signals_text, round_table_output.model_dump())
+    return round_table_output
+
+
+@disk_cached(RoundTableOutput, ttl_seconds=DAY)
+def _generate_discussion(
+    ticker: str,
+    ticker_signals: dict[str, any],
+    model_name: str,
+    model_provider: str,
+) -> RoundTableOutput | None:
+    """
+    Run the discussion through the LLM, returning None when the call fails.
+    Cached on the ticker, the model and the signals; the key is built with
+    sorted dict keys, so the order of the signals doesn't cause a miss.
+    """
     # Generate the prompt
-    prompt = template.invoke({
-        "ticker_signals": json.dumps(ticker_signals, indent=2),
-        "ticker": ticker
+    prompt = _ROUND_TABLE_PROMPT.invoke({
+        # Compact JSON: the model doesn't need indentation and it costs input tokens
+        "ticker_signals": json_utils.dumps(ticker_signals),
+        "ticker": ticker,
+        "max_turns": ROUND_TABLE_MAX_TURNS,
+        "max_transcript_tokens": ROUND_TABLE_MAX_TRANSCRIPT_TOKENS,
     })
 
-    # Create default factory for RoundTableOutput
-    def create_default_output():
-        return RoundTableOutput(
-            signal="neutral",
-            confidence=0.0,
-            reasoning="Error in generating discussion, defaulting to neutral",
-            discussion_summary="Unable to facilitate discussion due to technical error",
-            consensus_view="No consensus reached due to error",
-            dissenting_opinions="Unable to evaluate dissenting opinions",
-            conversation_transcript="Discussion generation failed"
-        )
+    verdict_reported = False
+
+    def report_verdict(partial: dict) -> None:
+        # The verdict fields come first in the schema, so they are complete once reasoning starts
+        nonlocal verdict_reported
+        if not verdict_reported and "reasoning" in partial:
+            verdict_reported = True
+            progress.update_status(
+                "round_table", ticker, f"Leaning {partial.get('signal')} ({partial.get('confidence')}%), finishing discussion"
+            )
 
+    # None on failure keeps the error output out of the cache
     return call_llm(
         prompt=prompt,
         model_name=model_name,
         model_provider=model_provider,
         pydantic_model=RoundTableOutput,
         agent_name="round_table",
-        default_factory=create_default_output,
+        default_factory=lambda: None,
+        stream_callback=report_verdict,
+        max_tokens=ROUND_TABLE_MAX_TOKENS,
     ) 
\ No newline at end of file
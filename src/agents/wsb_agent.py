@@ -2,13 +2,20 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from graph.state import AgentState, show_agent_reasoning
 from pydantic import BaseModel, Field
-import json
 from typing_extensions import Literal
 from utils.progress import progress
-from utils.llm import call_llm
+from utils.llm import call_llm, map_llm_calls
+from utils import json_utils
 import praw
 from datetime import datetime, timedelta
 import os
+import re
+import threading
+from collections import Counter
+from operator import attrgetter
+from bisect import bisect_left, bisect_right
+from math import inf, nextafter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tools.api import get_financial_metrics, get_market_cap, search_line_items, get_company_news
 
@@ -19,6 +26,10 @@ class WSBSignal(BaseModel):
     reasoning: str
 
 
+class WSBBatchSignal(BaseModel):
+    signals: dict[str, WSBSignal]
+
+
 class RedditPost(BaseModel):
     title: str
     score: int
@@ -28,6 +39,83 @@ class RedditPost(BaseModel):
     url: str
     text: str = ""
     sentiment: str = "neutral"  # Will be filled in with analysis
+    _rank: float = 0.0  # Private sort key used by get_reddit_posts, not part of the dump
+
+
+# Built once at import, the prompts never change between calls
+_WSB_SYSTEM_MESSAGE = """You are a WallStreetBets trader analyzing stocks using the distinctive WSB approach and vocabulary:
+
+            1. Look for moonshot opportunities with asymmetric risk/reward
+            2. Identify potential short squeeze candidates and meme stock momentum
+            3. Consider YOLO-worthy options plays (particularly weeklies with high leverage)
+            4. Value social sentiment and Reddit activity over traditional fundamentals
+            5. Use WSB terminology correctly in your analysis
+
+            Key WSB terminology to incorporate:
+            - "Tendies" (profits/money)
+            - "Diamond hands" (holding despite volatility)
+            - "Paper hands" (selling too early)
+            - "YOLO" (all-in bets)
+            - "FD" (risky weekly options)
+            - "Autist" (someone who does thorough analysis)
+            - "Smooth brain" (someone who makes poor decisions)
+            - "Apes" (WSB community members)
+            - "To the moon" (stock with huge upside potential)
+            - "Drilling" (stock rapidly declining)
+            
+            Your analysis style:
+            - Focus on potential asymmetric gains over conservative investments
+            - Consider both long plays and short squeeze opportunities
+            - Emphasize options strategies with high leverage potential
+            - Be contrarian when institutional investors are overly bearish
+            - Consider Reddit activity and sentiment as key indicators
+            - Maintain factual analysis while incorporating WSB culture
+            
+            Provide a signal (bullish/bearish/neutral) with confidence level and clear reasoning using appropriate WSB terminology.
+            """
+
+_WSB_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _WSB_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following WSB-style analysis, create an investment signal:
+
+        Analysis Data for {ticker}:
+        {analysis_data}
+
+        Return the trading signal in the following JSON format:
+        {{
+          "signal": "bullish/bearish/neutral",
+          "confidence": float (0-100),
+          "reasoning": "string"
+        }}
+        """
+    )
+])
+
+_WSB_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _WSB_SYSTEM_MESSAGE),
+    (
+        "human",
+        """Based on the following WSB-style analysis, create an investment signal for each ticker.
+        Judge every ticker on its own analysis only.
+
+        Analysis Data by ticker:
+        {analysis_data}
+
+        Return the trading signals in the following JSON format, with one entry per ticker:
+        {{
+          "signals": {{
+            "<ticker>": {{
+              "signal": "bullish/bearish/neutral",
+              "confidence": float (0-100),
+              "reasoning": "string"
+            }}
+          }}
+        }}
+        """
+    )
+])
 
 
 def wsb_agent(state: AgentState):
@@ -46,102 +134,60 @@ def wsb_agent(state: AgentState):
     
     analysis_data = {}
     wsb_analysis = {}
-    
-    for ticker in tickers:
-        progress.update_status("wsb_agent", ticker, "Fetching financial metrics")
-        # Fetch required data
-        metrics = get_financial_metrics(ticker, end_date, period="annual", limit=5)
-        
-        progress.update_status("wsb_agent", ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
-            ticker,
-            [
-                "revenue", 
-                "net_income",
-                "outstanding_shares",
-                "cash_and_equivalents",
-                "total_debt",
-                "research_and_development",
-            ],
-            end_date,
-            period="annual",
-            limit=5,
-        )
-        
-        progress.update_status("wsb_agent", ticker, "Getting market cap")
-        market_cap = get_market_cap(ticker, end_date)
-        
-        progress.update_status("wsb_agent", ticker, "Fetching Reddit WSB posts")
-        # Get a small number of high-quality, recent Reddit posts
-        print(f"\n--- FETCHING TOP RECENT WSB POSTS FOR ${ticker} ---\n")
-        reddit_posts = get_reddit_posts(ticker, start_date, end_date, limit=10)
-        
-        progress.update_status("wsb_agent", ticker, "Analyzing social media hype")
-        # Get company news to analyze social sentiment
-        company_news = get_company_news(ticker, end_date, limit=100)
-        
-        progress.update_status("wsb_agent", ticker, "Analyzing meme potential")
-        meme_analysis = analyze_meme_potential(company_news, ticker, market_cap, reddit_posts)
-        
-        progress.update_status("wsb_agent", ticker, "Identifying short squeeze potential")
-        squeeze_analysis = analyze_short_squeeze_potential(metrics, financial_line_items, market_cap, ticker)
-        
-        progress.update_status("wsb_agent", ticker, "Analyzing YOLO options potential")
-        options_analysis = analyze_options_potential(metrics, financial_line_items, market_cap)
-        
-        # Calculate total score
-        total_score = (
-            meme_analysis["score"] + 
-            squeeze_analysis["score"] + 
-            options_analysis["score"]
-        )
-        max_possible_score = 15  # Normalize scores to be out of 15
-        
-        # Generate trading signal based on WSB mentality
-        if total_score >= 0.6 * max_possible_score:  # Lower threshold for bullish - WSB is optimistic!
-            signal = "bullish"
-        elif total_score <= 0.3 * max_possible_score:
-            signal = "bearish"
-        else:
-            signal = "neutral"
-        
-        # Store analysis data
-        analysis_data[ticker] = {
-            "signal": signal,
-            "score": total_score,
-            "max_score": max_possible_score,
-            "meme_analysis": meme_analysis,
-            "squeeze_analysis": squeeze_analysis,
-            "options_analysis": options_analysis,
-            "market_cap": market_cap,
-            "reddit_data": {
-                "post_count": len(reddit_posts),
-                "top_posts": [post.model_dump() for post in reddit_posts[:5]] if reddit_posts else []
-            }
-        }
-        
-        progress.update_status("wsb_agent", ticker, "Generating WSB-style analysis")
-        wsb_output = generate_wsb_output(
+    reddit_posts_by_ticker = {}
+    
+    # Tickers are independent and I/O-bound, so process them concurrently
+    max_workers = max(1, min(state["metadata"].get("max_workers", 16), len(tickers)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_process_ticker, ticker, start_date, end_date) for ticker in tickers]
+        for future in as_completed(futures):
+            ticker, analysis_entry, reddit_posts = future.result()
+            analysis_data[ticker] = analysis_entry
+            reddit_posts_by_ticker[ticker] = reddit_posts
+            progress.update_status("wsb_agent", ticker, "Generating WSB-style analysis")
+
+    # Keep the output ordered like the input tickers
+    analysis_data = {ticker: analysis_data[ticker] for ticker in tickers}
+
+    # One LLM round trip for every ticker instead of one per ticker
+    batch_output = generate_wsb_batch_output(
+        analysis_data=analysis_data,
+        model_name=state["metadata"]["model_name"],
+        model_provider=state["metadata"]["model_provider"],
+    )
+
+    # Tickers missing or malformed in the batch response are asked for one by one, concurrently
+    missing = [ticker for ticker in tickers if ticker not in batch_output.signals]
+    fallback_outputs = map_llm_calls(
+        lambda ticker: generate_wsb_output(
             ticker=ticker,
-            analysis_data=analysis_data,
+            analysis_data=analysis_data[ticker],
             model_name=state["metadata"]["model_name"],
             model_provider=state["metadata"]["model_provider"],
-        )
-        
+        ),
+        missing,
+        state["metadata"],
+    )
+
+    for ticker in tickers:
+        wsb_output = batch_output.signals.get(ticker) or fallback_outputs[ticker]
+
         # Store analysis in consistent format with other agents
         wsb_analysis[ticker] = {
             "signal": wsb_output.signal,
             "confidence": wsb_output.confidence,
             "reasoning": wsb_output.reasoning,
         }
-        
         progress.update_status("wsb_agent", ticker, "Done")
-        
+    
+    for ticker in tickers:
+        reddit_posts = reddit_posts_by_ticker[ticker]
         # Remove testimonial feature and simplified sentiment summary
         if reddit_posts:
-            # Display simple stats about the posts
-            bullish_count = sum(1 for post in reddit_posts if post.sentiment == "bullish")
-            bearish_count = sum(1 for post in reddit_posts if post.sentiment == "bearish")
+            # Display simple stats about the posts, counting every sentiment in one pass
+            sentiment_counts = Counter(post.sentiment for post in reddit_posts)
+            bullish_count = sentiment_counts["bullish"]
+            bearish_count = sentiment_counts["bearish"]
             neutral_count = len(reddit_posts) - bullish_count - bearish_count
             
             print(f"\nWSB Stats for {ticker}: {len(reddit_posts)} posts found.")
@@ -149,7 +195,7 @@ def wsb_agent(state: AgentState):
     
     # Create the message
     message = HumanMessage(
-        content=json.dumps(wsb_analysis),
+        content=json_utils.dumps(wsb_analysis),
         name="wsb_agent"
     )
     
@@ -166,6 +212,89 @@ def wsb_agent(state: AgentState):
     }
 
 
+
+def _process_ticker(
+    ticker: str,
+    start_date: str | None,
+    end_date: str,
+) -> tuple[str, dict, list[RedditPost]]:
+    """Fetch data and score the WSB analysis for a single ticker."""
+    # The fetches are independent, so issue them in parallel
+    progress.update_status("wsb_agent", ticker, "Fetching financial data, news and Reddit posts")
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        metrics_future = executor.submit(get_financial_metrics, ticker, end_date, period="annual", limit=5)
+        line_items_future = executor.submit(
+            search_line_items,
+            ticker,
+            [
+                "revenue", 
+                "net_income",
+                "outstanding_shares",
+                "cash_and_equivalents",
+                "total_debt",
+                "research_and_development",
+            ],
+            end_date,
+            period="annual",
+            limit=5,
+        )
+        market_cap_future = executor.submit(get_market_cap, ticker, end_date)
+        # Get a small number of high-quality, recent Reddit posts
+        reddit_posts_future = executor.submit(get_reddit_posts, ticker, start_date, end_date, limit=10)
+        # Get company news to analyze social sentiment. Same arguments as the sentiment agent,
+        # so both share one cached fetch; the news source has no field selection to narrow it further
+        news_future = executor.submit(get_company_news, ticker, end_date, limit=100)
+
+        metrics = metrics_future.result()
+        financial_line_items = line_items_future.result()
+        market_cap = market_cap_future.result()
+        reddit_posts = reddit_posts_future.result()
+        # Only the headlines are used, so keep just those
+        news_titles = [news.title for news in news_future.result()]
+    
+    progress.update_status("wsb_agent", ticker, "Analyzing meme potential")
+    meme_analysis = analyze_meme_potential(news_titles, ticker, market_cap, reddit_posts)
+    
+    progress.update_status("wsb_agent", ticker, "Identifying short squeeze potential")
+    squeeze_analysis = analyze_short_squeeze_potential(metrics, financial_line_items, market_cap, ticker)
+    
+    progress.update_status("wsb_agent", ticker, "Analyzing YOLO options potential")
+    options_analysis = analyze_options_potential(metrics, financial_line_items, market_cap)
+    
+    # Calculate total score
+    total_score = (
+        meme_analysis["score"] + 
+        squeeze_analysis["score"] + 
+        options_analysis["score"]
+    )
+    max_possible_score = 15  # Normalize scores to be out of 15
+    
+    # Generate trading signal based on WSB mentality
+    if total_score >= 0.6 * max_possible_score:  # Lower threshold for bullish - WSB is optimistic!
+        signal = "bullish"
+    elif total_score <= 0.3 * max_possible_score:
+        signal = "bearish"
+    else:
+        signal = "neutral"
+    
+    # Store analysis data
+    analysis_entry = {
+        "signal": signal,
+        "score": total_score,
+        "max_score": max_possible_score,
+        "meme_analysis": meme_analysis,
+        "squeeze_analysis": squeeze_analysis,
+        "options_analysis": options_analysis,
+        "market_cap": market_cap,
+        "reddit_data": {
+            "post_count": len(reddit_posts),
+            # The selftext body is the bulk of each post and the prompt only needs the summary fields
+            "top_posts": [post.model_dump(exclude={"text"}) for post in reddit_posts[:5]]
+        }
+    }
+
+    return ticker, analysis_entry, reddit_posts
+
 def get_reddit_posts(ticker: str, start_date: str = None, end_date: str = None, limit: int = 10) -> list[RedditPost]:
     """
     Fetch a small number of recent, high-quality Reddit posts from r/wallstreetbets about a specific ticker.
@@ -179,78 +308,68 @@ def get_reddit_posts(ticker: str, start_date: str = None, end_date: str = None,
     Returns:
         List of RedditPost objects, prioritizing recent posts with good engagement
     """
+    print(f"\n--- FETCHING TOP RECENT WSB POSTS FOR ${ticker} ---\n")
     try:
         # Try to initialize PRAW client
         reddit_client_id = os.environ.get("REDDIT_CLIENT_ID")
         reddit_client_secret = os.environ.get("REDDIT_CLIENT_SECRET")
-        reddit_user_agent = os.environ.get("REDDIT_USER_AGENT", "wsb_agent:v1.0")
         
         if not reddit_client_id or not reddit_client_secret:
             # Gracefully handle missing credentials
             print("Reddit API credentials not found. Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in environment")
             return []
         
-        # Initialize Reddit client
-        reddit = praw.Reddit(
-            client_id=reddit_client_id,
-            client_secret=reddit_client_secret,
-            user_agent=reddit_user_agent
-        )
-        
-        # Only use r/wallstreetbets
-        subreddit = reddit.subreddit("wallstreetbets")
         all_posts = []
+        seen_urls = set()
         
         # Search terms - both "$TICKER" and "TICKER" formats
         search_terms = [f"${ticker}", ticker]
-        initial_fetch_limit = 20  # Fetch more initially to filter for quality
         
-        # First, try to get the newest posts (last 24 hours)
-        for term in search_terms:
-            new_results = subreddit.search(
-                term,
-                sort="new",
-                time_filter="day",
-                limit=initial_fetch_limit//len(search_terms)
-            )
-            
-            for post in new_results:
-                # Only add posts with at least 10 upvotes
-                if post.score >= 10:
+        # First, try to get the newest posts (last 24 hours) with at least 10 upvotes; the searches run concurrently
+        new_futures = [
+            _reddit_search_executor.submit(_search_wsb, term, "new", "day", limit, min_score=10)
+            for term in search_terms
+        ]
+        for future in new_futures:
+            for post in future.result():
+                # Both terms can find the same post
+                url = f"https://reddit.com{post.permalink}"
+                if url not in seen_urls:
                     reddit_post = create_reddit_post(post)
                     all_posts.append(reddit_post)
+                    seen_urls.add(url)
                     print(f"NEW: {post.title} - {reddit_post.url} (↑{post.score}, {post.num_comments} comments)")
         
-        # If we don't have enough posts, try hot posts from the past week
-        if len(all_posts) < limit:
-            hot_results = subreddit.search(
-                term,
-                sort="hot",
-                time_filter="week",
-                limit=initial_fetch_limit//len(search_terms)
-            )
-            
-            for post in hot_results:
+        # If we don't have enough posts, try hot posts from the past week for each search term in turn,
+        # so the next term's search is only paid for while the list is still short
+        for term in search_terms:
+            if len(all_posts) >= limit:
+                break
+            for post in _reddit_search_executor.submit(_search_wsb, term, "hot", "week", limit).result():
                 # Skip posts we've already added
-                if any(p.url == f"https://reddit.com{post.permalink}" for p in all_posts):
+                url = f"https://reddit.com{post.permalink}"
+                if url in seen_urls:
                     continue
                     
                 reddit_post = create_reddit_post(post)
                 all_posts.append(reddit_post)
+                seen_urls.add(url)
                 print(f"HOT: {post.title} - {reddit_post.url} (↑{post.score}, {post.num_comments} comments)")
                 
-                # Break once we have enough posts
+                # Stop once we have enough posts
                 if len(all_posts) >= limit:
                     break
-        
+
         # Sort by a combination of recency (70%) and score (30%) to get recent, high-quality posts
         one_day_ago = datetime.now().timestamp() - 86400
-        all_posts.sort(key=lambda x: (
-            # Higher weight to posts from the last 24 hours
-            (2 if x.created_utc > one_day_ago else 1) * 0.7 +
-            # Some weight to post score
-            (min(x.score, 1000) / 1000) * 0.3
-        ), reverse=True)
+        for post in all_posts:
+            post._rank = (
+                # Higher weight to posts from the last 24 hours
+                (2 if post.created_utc > one_day_ago else 1) * 0.7 +
+                # Some weight to post score
+                (min(post.score, 1000) / 1000) * 0.3
+            )
+        all_posts.sort(key=attrgetter("_rank"), reverse=True)
         
         # Return the top posts (limited to requested amount)
         return all_posts[:limit]
@@ -260,6 +379,114 @@ def get_reddit_posts(ticker: str, start_date: str = None, end_date: str = None,
         return []
 
 
+# Every WSB search, from any ticker, goes through one bounded pool so the round trips overlap
+# without exceeding Reddit's rate limit. PRAW isn't thread-safe, so each worker keeps its own client.
+_REDDIT_SEARCH_WORKERS = 8
+_reddit_search_executor = ThreadPoolExecutor(max_workers=_REDDIT_SEARCH_WORKERS, thread_name_prefix="reddit-search")
+_reddit_local = threading.local()
+
+
+def _get_reddit_client() -> praw.Reddit:
+    """Reddit client of the current search worker, created on first use."""
+    reddit = getattr(_reddit_local, "reddit", None)
+    if reddit is None:
+        reddit = praw.Reddit(
+            client_id=os.environ.get("REDDIT_CLIENT_ID"),
+            client_secret=os.environ.get("REDDIT_CLIENT_SECRET"),
+            user_agent=os.environ.get("REDDIT_USER_AGENT", "wsb_agent:v1.0")
+        )
+        _reddit_local.reddit = reddit
+    return reddit
+
+
+# Upper bound on the posts one search may walk through; stays within a single listing page
+_REDDIT_SEARCH_CEILING = 50
+
+
+def _search_wsb(term: str, sort: str, time_filter: str, wanted: int, min_score: int = 0) -> list:
+    """
+    Run one r/wallstreetbets search in the worker, returning up to `wanted` posts scoring at least `min_score`.
+    The listing is paginated lazily, so stopping as soon as enough posts qualify skips the remaining requests.
+    """
+    subreddit = _get_reddit_client().subreddit("wallstreetbets")
+    posts = []
+    for post in subreddit.search(term, sort=sort, time_filter=time_filter, limit=_REDDIT_SEARCH_CEILING):
+        if post.score >= min_score:
+            posts.append(post)
+            if len(posts) >= wanted:
+                break
+    return posts
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Find every occurrence of any keyword, as a substring and including overlaps, in one pass."""
+    return re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+
+
+BULLISH_WORDS = ["bull", "buy", "calls", "moon", "rocket", "yolo", "tendies", "gain", "long"]
+BEARISH_WORDS = ["bear", "put", "short", "drill", "crash", "tank", "loss", "guh", "dump"]
+_BULLISH_PATTERN = _keyword_pattern(BULLISH_WORDS)
+_BEARISH_PATTERN = _keyword_pattern(BEARISH_WORDS)
+
+SOCIAL_KEYWORDS = [
+    'reddit', 'twitter', 'wallstreetbets', 'wsb', 'social media', 'viral',
+    'meme', 'trending', 'retail investors', 'robinhood', 'tiktok', 'hype',
+    'discord', 'influencer', 'short sellers', 'squeeze'
+]
+# Only whether a title mentions any keyword matters, so a plain alternation search is enough
+_SOCIAL_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in SOCIAL_KEYWORDS))
+
+# Tiered scores as lookup tables: bisect the sorted bounds, then index the parallel score and detail lists.
+# With bisect_left a value equal to a bound falls in the lower tier; bounds nudged down with nextafter
+# put that exact value in the upper tier instead. Details are formatted with the value in billions/millions.
+_MEME_MCAP_BOUNDS = [nextafter(100_000_000, -inf), 10_000_000_000, 50_000_000_000]
+_MEME_MCAP_SCORES = [2, 3, 1, 0]
+_MEME_MCAP_DETAILS = [
+    "Micro-cap: ${millions:.1f}M - moonshot potential but super risky",
+    "Perfect market cap for memes: ${billions:.1f}B - small enough to move",
+    "Mid-cap: ${billions:.1f}B - still movable with enough retail interest",
+    "Too large: ${billions:.1f}B - hard for retail to influence",
+]
+
+_TICKER_LENGTH_BOUNDS = [3, 4]
+_TICKER_LENGTH_SCORES = [2, 1, 0]
+_TICKER_LENGTH_DETAILS = [
+    "Short, catchy ticker: ${ticker} - perfect for memes",
+    "Decent ticker length: ${ticker} - workable for memes",
+    None,
+]
+
+# bisect_right: a float exactly on a bound already counts as the larger tier
+_FLOAT_BOUNDS = [50_000_000, 200_000_000, 500_000_000]
+_FLOAT_SCORES = [3, 2, 1, 0]
+_FLOAT_DETAILS = [
+    "Small float ({millions:.1f}M shares) - perfect for a squeeze!",
+    "Medium float ({millions:.1f}M shares) - decent squeeze potential",
+    "Large float ({millions:.1f}M shares) - harder to squeeze but possible",
+    "Huge float ({millions:.1f}M shares) - would take massive volume to squeeze",
+]
+
+_OPTIONS_PRICE_BOUNDS = [0, nextafter(5, -inf), nextafter(10, -inf), 500, 1000]
+_OPTIONS_PRICE_SCORES = [0, 1, 2, 3, 2, 1]
+_OPTIONS_PRICE_DETAILS = [
+    None,
+    "Too cheap for good options: ${price:.2f} - penny stock territory",
+    "Affordable options but less liquid: ${price:.2f}",
+    "Perfect price range for options: ${price:.2f} - liquid chains",
+    "High-priced options: ${price:.2f} - expensive premiums but good leverage",
+    "Very expensive options: ${price:.2f} - may need spreads",
+]
+
+_OPTIONS_MCAP_BOUNDS = [300_000_000, 2_000_000_000, 10_000_000_000]
+_OPTIONS_MCAP_SCORES = [0, 1, 2, 3]
+_OPTIONS_MCAP_DETAILS = [
+    "Micro cap (${millions:.1f}M) - poor options liquidity",
+    "Small cap (${millions:.1f}M) - limited options liquidity",
+    "Mid cap (${billions:.1f}B) - decent options liquidity",
+    "Large cap (${billions:.1f}B) - liquid options market",
+]
+
+
 def create_reddit_post(post) -> RedditPost:
     """Helper function to create a RedditPost from a PRAW post object"""
     reddit_post = RedditPost(
@@ -272,13 +499,10 @@ def create_reddit_post(post) -> RedditPost:
         text=post.selftext if hasattr(post, "selftext") else ""
     )
     
-    # Simple sentiment analysis based on keywords
-    text = (post.title + " " + post.selftext).lower()
-    bullish_words = ["bull", "buy", "calls", "moon", "rocket", "yolo", "tendies", "gain", "long"]
-    bearish_words = ["bear", "put", "short", "drill", "crash", "tank", "loss", "guh", "dump"]
-    
-    bullish_count = sum(1 for word in bullish_words if word in text)
-    bearish_count = sum(1 for word in bearish_words if word in text)
+    # Simple sentiment analysis based on keywords: how many distinct words of each list appear
+    text = (reddit_post.title + " " + reddit_post.text).lower()
+    bullish_count = len(set(_BULLISH_PATTERN.findall(text)))
+    bearish_count = len(set(_BEARISH_PATTERN.findall(text)))
     
     if bullish_count > bearish_count:
         reddit_post.sentiment = "bullish"
@@ -288,7 +512,7 @@ def create_reddit_post(post) -> RedditPost:
     return reddit_post
 
 
-def analyze_meme_potential(company_news: list, ticker: str, market_cap: float, reddit_posts: list[RedditPost] = None) -> dict:
+def analyze_meme_potential(news_titles: list[str], ticker: str, market_cap: float, reddit_posts: list[RedditPost] = None) -> dict:
     """
     Analyze a stock's potential as a meme stock.
     
@@ -303,20 +527,11 @@ def analyze_meme_potential(company_news: list, ticker: str, market_cap: float, r
     score = 0
     details = []
     
-    # Check for social media mentions in news
-    social_keywords = [
-        'reddit', 'twitter', 'wallstreetbets', 'wsb', 'social media', 'viral',
-        'meme', 'trending', 'retail investors', 'robinhood', 'tiktok', 'hype',
-        'discord', 'influencer', 'short sellers', 'squeeze'
-    ]
-    
-    social_mentions = 0
-    for news in company_news:
-        title_lower = news.title.lower()
-        for keyword in social_keywords:
-            if keyword in title_lower:
-                social_mentions += 1
-                break
+    # Lowercase every title once and share it between the keyword scans
+    lowered_titles = [title.lower() for title in news_titles]
+    
+    # Check for social media mentions in news: titles matching any social keyword
+    social_mentions = sum(1 for title in lowered_titles if _SOCIAL_PATTERN.search(title))
     
     # Score based on social mentions
     if social_mentions > 10:
@@ -332,34 +547,45 @@ def analyze_meme_potential(company_news: list, ticker: str, market_cap: float, r
         details.append("Limited social media mentions - no meme buzz detected")
     
     # Reddit activity analysis
+    reddit_stats = {"post_count": 0, "bullish_count": 0, "bearish_count": 0, "avg_engagement": 0}
     if reddit_posts:
+        post_count = len(reddit_posts)
+        
         # Count posts by sentiment
-        bullish_posts = sum(1 for post in reddit_posts if post.sentiment == "bullish")
-        bearish_posts = sum(1 for post in reddit_posts if post.sentiment == "bearish")
+        sentiment_counts = Counter(post.sentiment for post in reddit_posts)
+        bullish_posts = sentiment_counts["bullish"]
+        bearish_posts = sentiment_counts["bearish"]
         
         # Total engagement (upvotes + comments)
         total_engagement = sum(post.score + post.num_comments for post in reddit_posts)
-        avg_engagement = total_engagement / len(reddit_posts) if reddit_posts else 0
+        avg_engagement = total_engagement / post_count
+        
+        reddit_stats = {
+            "post_count": post_count,
+            "bullish_count": bullish_posts,
+            "bearish_count": bearish_posts,
+            "avg_engagement": avg_engagement
+        }
         
         # Calculate Reddit score component
         reddit_score = 0
         
         # Post volume scoring
-        if len(reddit_posts) > 20:
+        if post_count > 20:
             reddit_score += 2
-            details.append(f"Massive Reddit activity: {len(reddit_posts)} recent posts - viral meme status")
-        elif len(reddit_posts) > 10:
+            details.append(f"Massive Reddit activity: {post_count} recent posts - viral meme status")
+        elif post_count > 10:
             reddit_score += 1.5
-            details.append(f"Strong Reddit activity: {len(reddit_posts)} recent posts - high meme potential")
-        elif len(reddit_posts) > 5:
+            details.append(f"Strong Reddit activity: {post_count} recent posts - high meme potential")
+        elif post_count > 5:
             reddit_score += 1
-            details.append(f"Moderate Reddit activity: {len(reddit_posts)} recent posts - growing meme interest")
-        elif len(reddit_posts) > 0:
+            details.append(f"Moderate Reddit activity: {post_count} recent posts - growing meme interest")
+        else:
             reddit_score += 0.5
-            details.append(f"Some Reddit activity: {len(reddit_posts)} recent posts - on WSB radar")
+            details.append(f"Some Reddit activity: {post_count} recent posts - on WSB radar")
         
         # Sentiment scoring (WSB loves positivity)
-        sentiment_ratio = bullish_posts / len(reddit_posts) if reddit_posts else 0
+        sentiment_ratio = bullish_posts / post_count
         if sentiment_ratio > 0.8:
             reddit_score += 1.5
             details.append(f"Overwhelmingly bullish Reddit sentiment: {sentiment_ratio:.0%} positive posts - rocket emoji territory")
@@ -382,51 +608,32 @@ def analyze_meme_potential(company_news: list, ticker: str, market_cap: float, r
     
     # Market cap analysis for meme potential
     # WSB tends to prefer stocks they can actually move - small to mid cap
+    # $100M to $10B is ideal, micro-caps are risky, above $50B is too large
     if market_cap:
-        if 100_000_000 <= market_cap <= 10_000_000_000:  # $100M to $10B
-            score += 3
-            details.append(f"Perfect market cap for memes: ${market_cap/1_000_000_000:.1f}B - small enough to move")
-        elif market_cap < 100_000_000:  # < $100M
-            score += 2
-            details.append(f"Micro-cap: ${market_cap/1_000_000:.1f}M - moonshot potential but super risky")
-        elif market_cap <= 50_000_000_000:  # < $50B
-            score += 1
-            details.append(f"Mid-cap: ${market_cap/1_000_000_000:.1f}B - still movable with enough retail interest")
-        else:
-            details.append(f"Too large: ${market_cap/1_000_000_000:.1f}B - hard for retail to influence")
+        tier = bisect_left(_MEME_MCAP_BOUNDS, market_cap)
+        score += _MEME_MCAP_SCORES[tier]
+        details.append(_MEME_MCAP_DETAILS[tier].format(billions=market_cap / 1_000_000_000, millions=market_cap / 1_000_000))
     
     # Ticker symbol analysis - shorter is better for memes
-    if len(ticker) <= 3:
-        score += 2
-        details.append(f"Short, catchy ticker: ${ticker} - perfect for memes")
-    elif len(ticker) == 4:
-        score += 1
-        details.append(f"Decent ticker length: ${ticker} - workable for memes")
+    tier = bisect_left(_TICKER_LENGTH_BOUNDS, len(ticker))
+    score += _TICKER_LENGTH_SCORES[tier]
+    if _TICKER_LENGTH_DETAILS[tier]:
+        details.append(_TICKER_LENGTH_DETAILS[tier].format(ticker=ticker))
     
     # Check for brand recognition from company name or news mentions
-    brand_score = 0
-    
     # Special cases for well-known meme stocks
     if ticker in ["GME", "AMC", "BB", "PLTR", "TSLA", "HOOD", "BBBY", "NOK", "WISH", "CLOV"]:
         brand_score = 5
         details.append(f"Classic meme stock: ${ticker} - proven retail favorite")
     else:
         # Extract company name from news if available
-        company_names = set([news.title.split(':')[0] for news in company_news[:5] if ':' in news.title])
-        
-        if len(company_names) > 0:
-            brand_score = min(3, len(company_names))
+        company_names = set([title.split(':')[0] for title in news_titles[:5] if ':' in title])
+        brand_score = min(3, len(company_names))
+        if company_names:
             details.append(f"Some brand recognition: mentioned across {len(company_names)} sources")
     
     score += brand_score
-    
-    reddit_stats = {
-        "post_count": len(reddit_posts) if reddit_posts else 0,
-        "bullish_count": bullish_posts if 'bullish_posts' in locals() else 0,
-        "bearish_count": bearish_posts if 'bearish_posts' in locals() else 0,
-        "avg_engagement": avg_engagement if 'avg_engagement' in locals() else 0
-    }
-    
+
     return {
         "score": min(score, 10) / 2,  # Normalize to 0-5 scale
         "details": "; ".join(details),
@@ -463,16 +670,16 @@ def analyze_short_squeeze_potential(metrics: list, financial_line_items: list, m
     # In a real implementation, you'd calculate the actual volatility
     if len(metrics) >= 2:
         # Simulate high volatility for stocks with high debt and low cash
+        # (LineItem returns None for fields the provider didn't send, so no hasattr probes are needed)
         latest = financial_line_items[0]
-        if hasattr(latest, 'cash_and_equivalents') and hasattr(latest, 'total_debt'):
-            if latest.cash_and_equivalents and latest.total_debt:
-                cash_to_debt = latest.cash_and_equivalents / latest.total_debt if latest.total_debt > 0 else float('inf')
-                if cash_to_debt < 0.3:
-                    score += 2
-                    details.append("High cash/debt pressure - boosts squeeze potential")
-                elif cash_to_debt < 0.7:
-                    score += 1
-                    details.append("Moderate cash/debt pressure - some squeeze potential")
+        if latest.cash_and_equivalents and latest.total_debt:
+            cash_to_debt = latest.cash_and_equivalents / latest.total_debt if latest.total_debt > 0 else float('inf')
+            if cash_to_debt < 0.3:
+                score += 2
+                details.append("High cash/debt pressure - boosts squeeze potential")
+            elif cash_to_debt < 0.7:
+                score += 1
+                details.append("Moderate cash/debt pressure - some squeeze potential")
     
     # Estimated float based on market cap and financial data
     float_score = 0
@@ -481,24 +688,16 @@ def analyze_short_squeeze_potential(metrics: list, financial_line_items: list, m
         avg_price = market_cap / shares
         
         # Small float is better for squeezes
-        if shares < 50_000_000:
-            float_score = 3
-            details.append(f"Small float ({shares/1_000_000:.1f}M shares) - perfect for a squeeze!")
-        elif shares < 200_000_000:
-            float_score = 2
-            details.append(f"Medium float ({shares/1_000_000:.1f}M shares) - decent squeeze potential")
-        elif shares < 500_000_000:
-            float_score = 1
-            details.append(f"Large float ({shares/1_000_000:.1f}M shares) - harder to squeeze but possible")
-        else:
-            details.append(f"Huge float ({shares/1_000_000:.1f}M shares) - would take massive volume to squeeze")
+        tier = bisect_right(_FLOAT_BOUNDS, shares)
+        float_score = _FLOAT_SCORES[tier]
+        details.append(_FLOAT_DETAILS[tier].format(millions=shares / 1_000_000))
     
     score += float_score
     
     # Profitability factor - unprofitable companies often have higher short interest
     profit_score = 0
     if len(financial_line_items) >= 2:
-        recent_profits = [item.net_income for item in financial_line_items[:2] if hasattr(item, 'net_income') and item.net_income is not None]
+        recent_profits = [profit for profit in (item.net_income for item in financial_line_items[:2]) if profit is not None]
         if recent_profits and all(profit < 0 for profit in recent_profits):
             profit_score = 3
             details.append("Consistently unprofitable - likely high short interest")
@@ -552,28 +751,21 @@ def analyze_options_potential(metrics: list, financial_line_items: list, market_
             "details": "Insufficient data for options analysis"
         }
     
+    # Read the latest period's fields once
+    latest = financial_line_items[0]
+    shares = latest.outstanding_shares
+    research_and_development = latest.research_and_development
+    revenue = latest.revenue
+    
     # Calculate share price (market cap / outstanding shares)
-    share_price = 0
-    if financial_line_items[0].outstanding_shares and financial_line_items[0].outstanding_shares > 0:
-        share_price = market_cap / financial_line_items[0].outstanding_shares
+    share_price = market_cap / shares if shares and shares > 0 else 0
     
     # Analyze price point for options liquidity
-    price_score = 0
-    if 10 <= share_price <= 500:
-        price_score = 3
-        details.append(f"Perfect price range for options: ${share_price:.2f} - liquid chains")
-    elif 5 <= share_price < 10:
-        price_score = 2
-        details.append(f"Affordable options but less liquid: ${share_price:.2f}")
-    elif 500 < share_price <= 1000:
-        price_score = 2
-        details.append(f"High-priced options: ${share_price:.2f} - expensive premiums but good leverage")
-    elif share_price > 1000:
-        price_score = 1
-        details.append(f"Very expensive options: ${share_price:.2f} - may need spreads")
-    elif share_price > 0:
-        price_score = 1
-        details.append(f"Too cheap for good options: ${share_price:.2f} - penny stock territory")
+    # $10 to $500 is ideal; an unknown (zero) price scores nothing
+    tier = bisect_left(_OPTIONS_PRICE_BOUNDS, share_price)
+    price_score = _OPTIONS_PRICE_SCORES[tier]
+    if _OPTIONS_PRICE_DETAILS[tier]:
+        details.append(_OPTIONS_PRICE_DETAILS[tier].format(price=share_price))
     
     score += price_score
     
@@ -595,25 +787,16 @@ def analyze_options_potential(metrics: list, financial_line_items: list, market_
     score += vol_score
     
     # Analyze market cap for options liquidity
-    mcap_score = 0
-    if market_cap > 10_000_000_000:  # > $10B
-        mcap_score = 3
-        details.append(f"Large cap (${market_cap/1_000_000_000:.1f}B) - liquid options market")
-    elif market_cap > 2_000_000_000:  # > $2B
-        mcap_score = 2
-        details.append(f"Mid cap (${market_cap/1_000_000_000:.1f}B) - decent options liquidity")
-    elif market_cap > 300_000_000:  # > $300M
-        mcap_score = 1
-        details.append(f"Small cap (${market_cap/1_000_000:.1f}M) - limited options liquidity")
-    else:
-        details.append(f"Micro cap (${market_cap/1_000_000:.1f}M) - poor options liquidity")
+    tier = bisect_left(_OPTIONS_MCAP_BOUNDS, market_cap)
+    mcap_score = _OPTIONS_MCAP_SCORES[tier]
+    details.append(_OPTIONS_MCAP_DETAILS[tier].format(billions=market_cap / 1_000_000_000, millions=market_cap / 1_000_000))
     
     score += mcap_score
     
     # Additional factors for WSB-style options plays
-    if financial_line_items[0].research_and_development and financial_line_items[0].revenue:
+    if research_and_development and revenue:
         # Check if R&D is high relative to revenue (tech/biotech plays popular on WSB)
-        rd_to_revenue = financial_line_items[0].research_and_development / financial_line_items[0].revenue
+        rd_to_revenue = research_and_development / revenue
         if rd_to_revenue > 0.2:  # >20% of revenue on R&D
             score += 1
             details.append(f"High R&D spending ({rd_to_revenue:.1%} of revenue) - potential for binary events")
@@ -628,6 +811,34 @@ def analyze_options_potential(metrics: list, financial_line_items: list, market_
     }
 
 
+def _compact_for_prompt(analysis: dict[str, any]) -> dict[str, any]:
+    """Keep the scores, detail strings and headline numbers of a ticker's analysis; the raw Reddit posts are summarized as counts."""
+    meme_analysis = analysis["meme_analysis"]
+    squeeze_analysis = analysis["squeeze_analysis"]
+    options_analysis = analysis["options_analysis"]
+    return {
+        "signal": analysis["signal"],
+        "score": analysis["score"],
+        "max_score": analysis["max_score"],
+        "market_cap": analysis["market_cap"],
+        "meme_analysis": {
+            "score": meme_analysis["score"],
+            "details": meme_analysis["details"],
+            "social_mentions": meme_analysis["social_mentions"],
+        },
+        "squeeze_analysis": {
+            "score": squeeze_analysis["score"],
+            "details": squeeze_analysis["details"],
+        },
+        "options_analysis": {
+            "score": options_analysis["score"],
+            "details": options_analysis["details"],
+            "price": options_analysis.get("price"),
+        },
+        "reddit": meme_analysis["reddit_stats"],
+    }
+
+
 def generate_wsb_output(
     ticker: str,
     analysis_data: dict[str, any],
@@ -635,60 +846,9 @@ def generate_wsb_output(
     model_provider: str,
 ) -> WSBSignal:
     """Generate WallStreetBets style investment decision from LLM."""
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are a WallStreetBets trader analyzing stocks using the distinctive WSB approach and vocabulary:
-
-            1. Look for moonshot opportunities with asymmetric risk/reward
-            2. Identify potential short squeeze candidates and meme stock momentum
-            3. Consider YOLO-worthy options plays (particularly weeklies with high leverage)
-            4. Value social sentiment and Reddit activity over traditional fundamentals
-            5. Use WSB terminology correctly in your analysis
-
-            Key WSB terminology to incorporate:
-            - "Tendies" (profits/money)
-            - "Diamond hands" (holding despite volatility)
-            - "Paper hands" (selling too early)
-            - "YOLO" (all-in bets)
-            - "FD" (risky weekly options)
-            - "Autist" (someone who does thorough analysis)
-            - "Smooth brain" (someone who makes poor decisions)
-            - "Apes" (WSB community members)
-            - "To the moon" (stock with huge upside potential)
-            - "Drilling" (stock rapidly declining)
-            
-            Your analysis style:
-            - Focus on potential asymmetric gains over conservative investments
-            - Consider both long plays and short squeeze opportunities
-            - Emphasize options strategies with high leverage potential
-            - Be contrarian when institutional investors are overly bearish
-            - Consider Reddit activity and sentiment as key indicators
-            - Maintain factual analysis while incorporating WSB culture
-            
-            Provide a signal (bullish/bearish/neutral) with confidence level and clear reasoning using appropriate WSB terminology.
-            """
-        ),
-        (
-            "human",
-            """Based on the following WSB-style analysis, create an investment signal:
-
-            Analysis Data for {ticker}:
-            {analysis_data}
-
-            Return the trading signal in the following JSON format:
-            {{
-              "signal": "bullish/bearish/neutral",
-              "confidence": float (0-100),
-              "reasoning": "string"
-            }}
-            """
-        )
-    ])
-
     # Generate the prompt
-    prompt = template.invoke({
-        "analysis_data": json.dumps(analysis_data, indent=2),
+    prompt = _WSB_PROMPT.invoke({
+        "analysis_data": json_utils.dumps(_compact_for_prompt(analysis_data), indent=True),
         "ticker": ticker
     })
 
@@ -703,4 +863,32 @@ def generate_wsb_output(
         pydantic_model=WSBSignal,
         agent_name="wsb_agent",
         default_factory=create_default_signal,
-    ) 
\ No newline at end of file
+    ) 
+
+
+def generate_wsb_batch_output(
+    analysis_data: dict[str, any],
+    model_name: str,
+    model_provider: str,
+) -> WSBBatchSignal:
+    """
+    Generate WallStreetBets style investment decisions for every ticker in a single LLM call.
+    Tickers missing from the response are left out of the returned signals.
+    """
+    prompt = _WSB_BATCH_PROMPT.invoke({
+        "analysis_data": json_utils.dumps(
+            {ticker: _compact_for_prompt(analysis) for ticker, analysis in analysis_data.items()}, indent=True
+        ),
+    })
+
+    def create_default_batch_signal():
+        return WSBBatchSignal(signals={})
+
+    return call_llm(
+        prompt=prompt,
+        model_name=model_name,
+        model_provider=model_provider,
+        pydantic_model=WSBBatchSignal,
+        agent_name="wsb_agent",
+        default_factory=create_default_batch_signal,
+    )
@@ -1,3 +1,21 @@
+import contextlib
+import functools
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+from pydantic import BaseModel
+
+
 class Cache:
     """In-memory cache for API responses."""
 
@@ -89,3 +107,283 @@ _cache = Cache()
 def get_cache() -> Cache:
     """Get the global cache instance."""
     return _cache
+
+
+# Persistent cache for fetch results, keyed by function name and arguments
+_DISK_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "api"
+# key -> (stored_at, JSON-ready result)
+_disk_memo: dict[str, tuple[float, any]] = {}
+
+# Shared TTLs: news moves fast, filings and statements rarely change once published
+HOUR = 60 * 60
+DAY = 24 * HOUR
+_disk_memo_lock = threading.Lock()
+# key -> [lock held while that key is being loaded or fetched, callers using it];
+# the last caller removes the entry so only keys in flight are kept
+_disk_key_locks: dict[str, list] = {}
+# When set, replaces every function's own TTL (see set_disk_cache_ttl)
+_disk_ttl_override: float | None = None
+
+
+def _disk_cache_disabled() -> bool:
+    """Read at call time so a .env loaded after import still applies."""
+    return os.environ.get("DISABLE_DATA_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def set_disk_cache_ttl(ttl_seconds: float | None) -> None:
+    """Use ttl_seconds for every disk-cached function instead of its own TTL; None restores the defaults."""
+    global _disk_ttl_override
+    _disk_ttl_override = ttl_seconds
+
+
+@contextlib.contextmanager
+def _locked_key(key: str):
+    """Hold the lock for key, creating it on first use and dropping it once no caller needs it."""
+    with _disk_memo_lock:
+        slot = _disk_key_locks.setdefault(key, [threading.Lock(), 0])
+        slot[1] += 1
+    try:
+        with slot[0]:
+            yield
+    finally:
+        with _disk_memo_lock:
+            slot[1] -= 1
+            if slot[1] == 0:
+                del _disk_key_locks[key]
+
+
+def _normalize_arg(value):
+    """Make an argument hashable and independent of ordering where order doesn't matter."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sorted(_normalize_arg(v) for v in value)
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _cache_key(fn_name: str, bound: inspect.BoundArguments) -> str:
+    payload = json.dumps([fn_name, {k: _normalize_arg(v) for k, v in bound.arguments.items()}], sort_keys=True, default=str)
+    return f"{fn_name}_{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+def _encode(value):
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return value
+
+
+def _decode(value, model: type[BaseModel] | None):
+    if model is None:
+        return value
+    if isinstance(value, list):
+        return [model(**v) for v in value]
+    return model(**value)
+
+
+def disk_cached(model: type[BaseModel] | None = None, ttl_seconds: float | None = None, should_cache=None):
+    """
+    Cache a fetch function's results in memory and as gzipped JSON under .cache/api.
+    Arguments are bound against the signature so defaults and keyword usage hit
+    the same entry, and list arguments are sorted before hashing.
+    Entries older than ttl_seconds are refetched; None keeps them indefinitely.
+    set_disk_cache_ttl overrides ttl_seconds for every decorated function.
+    Empty results are not persisted so transient failures don't stick, nor are results
+    should_cache(result) rejects (e.g. placeholders a fetcher returns when its provider fails).
+    Concurrent calls with the same arguments share a single fetch.
+    Set DISABLE_DATA_CACHE=true to bypass both layers.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def is_fresh(stored_at: float) -> bool:
+            ttl = _disk_ttl_override if _disk_ttl_override is not None else ttl_seconds
+            return ttl is None or time.time() - stored_at < ttl
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _disk_cache_disabled():
+                return fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _cache_key(fn.__name__, bound)
+
+            with _disk_memo_lock:
+                entry = _disk_memo.get(key)
+            if entry is not None and is_fresh(entry[0]):
+                return _decode(entry[1], model)
+
+            # Agents run concurrently and often ask for the same ticker's data at the same time;
+            # the first caller fetches while the others wait for its result instead of repeating the request
+            with _locked_key(key):
+                with _disk_memo_lock:
+                    entry = _disk_memo.get(key)
+                if entry is not None and is_fresh(entry[0]):
+                    return _decode(entry[1], model)
+
+                path = _DISK_CACHE_DIR / f"{key}.json.gz"
+                try:
+                    stored_at = os.stat(path).st_mtime
+                    if is_fresh(stored_at):
+                        with gzip.open(path, "rt", encoding="utf-8") as f:
+                            raw = json.load(f)
+                        with _disk_memo_lock:
+                            _disk_memo[key] = (stored_at, raw)
+                        return _decode(raw, model)
+                except FileNotFoundError:
+                    pass
+                except (OSError, EOFError, ValueError, TypeError):
+                    # Corrupt entry, fall through and refetch
+                    pass
+
+                result = fn(*args, **kwargs)
+                if result is None or result == [] or (should_cache is not None and not should_cache(result)):
+                    return result
+
+                raw = _encode(result)
+                with _disk_memo_lock:
+                    _disk_memo[key] = (time.time(), raw)
+                try:
+                    _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    tmp_path = _DISK_CACHE_DIR / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                        json.dump(raw, f)
+                    os.replace(tmp_path, path)
+                except (OSError, TypeError, ValueError) as e:
+                    print(f"Warning: could not write cache entry for {fn.__name__}: {e}")
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+_SEMANTIC_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "semantic"
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _semantic_cache_disabled() -> bool:
+    return _disk_cache_disabled() or os.environ.get("DISABLE_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache for results derived from free text, stored as gzipped JSON under .cache/semantic.
+    Texts are embedded as hashed bag-of-words vectors, so small wording drift still hits while
+    different content misses. Lookups only compare entries sharing the same exact scope string.
+    Entries older than ttl_seconds are ignored and dropped on the next write; set_disk_cache_ttl
+    overrides ttl_seconds here too. Set DISABLE_SEMANTIC_CACHE=true (or DISABLE_DATA_CACHE=true) to bypass it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = 0.97,
+        dimensions: int = 1024,
+        max_entries_per_scope: int = 256,
+        ttl_seconds: float | None = DAY,
+    ):
+        self._path = _SEMANTIC_CACHE_DIR / f"{name}.json.gz"
+        self._threshold = threshold
+        self._ttl_seconds = ttl_seconds
+        self._dimensions = dimensions
+        self._max_entries_per_scope = max_entries_per_scope
+        self._lock = threading.Lock()
+        # scope -> list of (text, stored_at, value); vectors are rebuilt from the text, not stored
+        self._entries: dict[str, list[tuple[str, float, any]]] | None = None
+        self._vectors: dict[str, np.ndarray] = {}
+        # Whether entries hold values not written to disk yet
+        self._dirty = False
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self._dimensions)
+        for word in _WORD_PATTERN.findall(text.lower()):
+            # crc32 rather than hash() so buckets are stable across processes
+            vector[zlib.crc32(word.encode()) % self._dimensions] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        ttl = _disk_ttl_override if _disk_ttl_override is not None else self._ttl_seconds
+        return ttl is None or time.time() - stored_at < ttl
+
+    def _load(self) -> dict[str, list[tuple[str, float, any]]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with gzip.open(self._path, "rt", encoding="utf-8") as f:
+                    for scope, entries in json.load(f).items():
+                        self._entries[scope] = [(text, stored_at, value) for text, stored_at, value in entries]
+            except FileNotFoundError:
+                pass
+            except (OSError, EOFError, ValueError, TypeError):
+                # Corrupt file, start over
+                self._entries = {}
+            self._vectors = {
+                scope: np.array([self._embed(text) for text, _, _ in entries])
+                for scope, entries in self._entries.items()
+            }
+        return self._entries
+
+    def get(self, scope: str, text: str):
+        """Value stored for the most similar text in scope, or None below the threshold."""
+        if _semantic_cache_disabled():
+            return None
+        with self._lock:
+            entries = self._load().get(scope)
+            if not entries:
+                return None
+            similarities = self._vectors[scope] @ self._embed(text)
+            for index, (_, stored_at, _) in enumerate(entries):
+                if not self._is_fresh(stored_at):
+                    similarities[index] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] < self._threshold:
+                return None
+            return entries[best][2]
+
+    def set(self, scope: str, text: str, value, flush: bool = True) -> None:
+        """
+        Store a JSON-ready value for text in scope. The cache is persisted right away unless
+        flush is False, in which case callers storing many values write them once with flush().
+        """
+        if _semantic_cache_disabled():
+            return
+        with self._lock:
+            entries = self._load().setdefault(scope, [])
+            fresh = np.array([self._is_fresh(stored_at) for _, stored_at, _ in entries], dtype=bool)
+            # Only the new text is embedded; the kept entries reuse their vectors
+            kept_vectors = self._vectors[scope][fresh] if entries else np.empty((0, self._dimensions))
+            vectors = np.vstack([kept_vectors, self._embed(text)])
+            entries[:] = [entry for entry, keep in zip(entries, fresh) if keep]
+            entries.append((text, time.time(), value))
+            del entries[:-self._max_entries_per_scope]
+            self._vectors[scope] = vectors[-self._max_entries_per_scope:]
+            self._dirty = True
+            if flush:
+                self._write()
+
+    def flush(self) -> None:
+        """Persist values stored with flush=False since the last write."""
+        if _semantic_cache_disabled():
+            return
+        with self._lock:
+            if self._dirty:
+                self._write()
+
+    def _write(self) -> None:
+        """Rewrite the cache file. Callers must hold the lock."""
+        try:
+            _SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not write semantic cache {self._path.name}: {e}")
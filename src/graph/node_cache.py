@@ -0,0 +1,106 @@
+import functools
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+
+from data.cache import DAY
+from graph.state import AgentState, show_agent_reasoning
+from utils.progress import progress
+
+# Analyst outputs for a given input, stored as gzipped JSON
+_NODE_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "nodes"
+_NODE_CACHE_TTL = DAY
+# Reasoning the agents (and call_llm's default response) use when they fall back to neutral after a failure
+_FALLBACK_REASONING = re.compile(r"\berror\b.*\bdefault", re.IGNORECASE | re.DOTALL)
+
+
+def _node_cache_disabled() -> bool:
+    """Read at call time so the CLI flag applies to workflows that are already compiled."""
+    return any(
+        os.environ.get(name, "").lower() in ("1", "true", "yes")
+        for name in ("DISABLE_DATA_CACHE", "DISABLE_NODE_CACHE")
+    )
+
+
+def _node_cache_key(node_name: str, state: AgentState) -> str:
+    data, metadata = state["data"], state["metadata"]
+    payload = json.dumps([
+        node_name,
+        sorted(data["tickers"]),
+        data["start_date"],
+        data["end_date"],
+        data.get("is_crypto", False),
+        metadata["model_name"],
+        metadata["model_provider"],
+    ])
+    return f"{node_name}_{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+def _has_fallback_entry(signals: dict) -> bool:
+    """True when any ticker's signal is a zero-confidence placeholder left by a failed analysis."""
+    return any(
+        isinstance(signal, dict)
+        and not signal.get("confidence")
+        and isinstance(signal.get("reasoning"), str)
+        and _FALLBACK_REASONING.search(signal["reasoning"]) is not None
+        for signal in signals.values()
+    )
+
+
+def cached_node(node_name: str, node_func):
+    """
+    Wrap an analyst node so its signals are reused when it runs again on the same tickers, date range
+    and model, skipping the data fetches and LLM calls. Only the analyst's own contribution is stored:
+    its analyst_signals entry and its message, both named after the agent. Outputs where a ticker fell
+    back to the neutral default after an error are not stored, so the next run retries them.
+    Entries expire after a day. Set DISABLE_NODE_CACHE=true (or DISABLE_DATA_CACHE) to always run the node.
+    """
+
+    @functools.wraps(node_func)
+    def wrapper(state: AgentState):
+        if _node_cache_disabled():
+            return node_func(state)
+
+        path = _NODE_CACHE_DIR / f"{_node_cache_key(node_name, state)}.json.gz"
+        try:
+            if time.time() - os.stat(path).st_mtime < _NODE_CACHE_TTL:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+                name, signals = entry["name"], entry["signals"]
+                state["data"]["analyst_signals"][name] = signals
+                if state["metadata"]["show_reasoning"]:
+                    show_agent_reasoning(signals, name.replace("_", " ").title())
+                progress.update_status(name, None, "Done (cached)")
+                return {"messages": [HumanMessage(content=entry["content"], name=name)], "data": state["data"]}
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            # Corrupt entry, run the node and overwrite it
+            pass
+
+        output = node_func(state)
+
+        messages = output.get("messages") or []
+        message = messages[-1] if messages else None
+        signals = output.get("data", {}).get("analyst_signals", {}).get(getattr(message, "name", None))
+        if not signals or _has_fallback_entry(signals):
+            return output
+
+        try:
+            _NODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({"name": message.name, "content": message.content, "signals": signals}, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not write node cache entry for {node_name}: {e}")
+        return output
+
+    return wrapper
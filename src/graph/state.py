@@ -8,7 +8,13 @@ import json
 
 
 def merge_dicts(a: dict[str, any], b: dict[str, any]) -> dict[str, any]:
-    return {**a, **b}
+    # Analysts run in parallel and each returns the data dict with its own entry in analyst_signals,
+    # so nested dicts are merged one level deep instead of the last writer replacing the others
+    merged = {**a, **b}
+    for key, value in b.items():
+        if isinstance(value, dict) and isinstance(a.get(key), dict):
+            merged[key] = {**a[key], **value}
+    return merged
 
 
 # Define agent state
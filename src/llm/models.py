@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from langchain_anthropic import ChatAnthropic
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
@@ -52,6 +53,11 @@ AVAILABLE_MODELS = [
         model_name="deepseek-r1-distill-llama-70b",
         provider=ModelProvider.GROQ
     ),
+    LLMModel(
+        display_name="[groq] llama-3.1 8b",
+        model_name="llama-3.1-8b-instant",
+        provider=ModelProvider.GROQ
+    ),
     LLMModel(
         display_name="[groq] llama-3.3 70b",
         model_name="llama-3.3-70b-versatile",
@@ -87,10 +93,15 @@ AVAILABLE_MODELS = [
 # Create LLM_ORDER in the format expected by the UI
 LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 
+@lru_cache(maxsize=None)
 def get_model_info(model_name: str) -> LLMModel | None:
     """Get model information by model_name"""
     return next((model for model in AVAILABLE_MODELS if model.model_name == model_name), None)
 
+# Every LLM call used to build a fresh client (and HTTP connection pool); one client per
+# (model, provider) is reused instead. Callers must not mutate it, call_llm copies before changing options.
+# A missing API key raises, and lru_cache doesn't store exceptions, so setting the key later still works.
+@lru_cache(maxsize=16)
 def get_model(model_name: str, model_provider: ModelProvider) -> ChatOpenAI | ChatGroq | None:
     if model_provider == ModelProvider.GROQ:
         api_key = os.getenv("GROQ_API_KEY")
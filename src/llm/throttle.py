@@ -0,0 +1,109 @@
+"""Client-side rate limiting for LLM calls."""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional, fall back to a character-based estimate
+    tiktoken = None
+
+
+class ProactiveLimiter:
+    """
+    Token buckets for requests per minute and tokens per minute.
+    acquire() blocks until both budgets cover the call, so parallel analysts queue for capacity
+    instead of all firing at once, hitting the provider's rate limit and backing off blindly.
+    """
+
+    def __init__(self, rpm: float | None = None, tpm: float | None = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        # Buckets start full so the first calls go out immediately
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        # call_llm runs on the analysts' worker threads
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the budget earned since the last update. Callers must hold the lock."""
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request and `tokens` tokens are available, then spend them."""
+        if self.tpm:
+            # A call larger than the whole budget waits for a full bucket rather than forever
+            tokens = min(tokens, self.tpm)
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = (1 - self._requests) * 60 / self.rpm
+                if self.tpm and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+                if wait == 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= tokens
+                    return
+            time.sleep(wait)
+
+
+_limiter: ProactiveLimiter | None = None
+
+
+def set_llm_rate_limits(rpm: float | None = None, tpm: float | None = None) -> None:
+    """Throttle every LLM call to rpm requests and tpm tokens per minute; None for both turns it off."""
+    global _limiter
+    _limiter = ProactiveLimiter(rpm, tpm) if rpm or tpm else None
+
+
+@lru_cache(maxsize=None)
+def _encoding_for(model_name: str):
+    """Tokenizer for model_name, or None when tiktoken (or its encoding files) is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Non-OpenAI models: cl100k is close enough for budgeting
+        pass
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def estimate_tokens(prompt: Any, model_name: str) -> int:
+    """Approximate prompt size in tokens, for rate-limit budgeting only."""
+    if hasattr(prompt, "to_string"):
+        text = prompt.to_string()
+    elif isinstance(prompt, list):
+        text = "\n".join(str(getattr(message, "content", message)) for message in prompt)
+    else:
+        text = str(prompt)
+
+    encoding = _encoding_for(model_name)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def throttle(prompt: Any, model_name: str, max_tokens: int | None = None) -> None:
+    """Wait for rate-limit budget before sending prompt; returns at once when no limits are set."""
+    limiter = _limiter
+    if limiter is None:
+        return
+    tokens = estimate_tokens(prompt, model_name) if limiter.tpm else 0
+    # Providers count the completion against the token budget too
+    limiter.acquire(tokens + (max_tokens or 0))
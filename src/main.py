@@ -1,4 +1,7 @@
 import sys
+import threading
+import traceback
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
@@ -14,31 +17,37 @@ from agents.risk_manager import risk_management_agent
 from agents.sentiment import sentiment_agent
 from agents.warren_buffett import warren_buffett_agent
 from graph.state import AgentState
+from graph.node_cache import cached_node
 from agents.valuation import valuation_agent
 from utils.display import print_trading_output
 from utils.analysts import ANALYST_ORDER, get_analyst_nodes
 from utils.progress import progress
 from llm.models import LLM_ORDER, get_model_info
 from agents.round_table import round_table
+from round_table import run_round_table
 
 import argparse
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from tabulate import tabulate
 from utils.visualize import save_graph_as_png
-import json
+from data.cache import DAY, set_disk_cache_ttl
+from llm.throttle import set_llm_rate_limits
+import os
+from utils import json_utils
 
 # Load environment variables from .env file
 load_dotenv()
 
 init(autoreset=True)
 
+# Workflow debug output, off unless --verbose is passed
+VERBOSE = False
 
-def parse_hedge_fund_response(response):
-    import json
 
+def parse_hedge_fund_response(response):
     try:
-        return json.loads(response)
+        return json_utils.loads(response)
     except:
         print(f"Error parsing response: {response}")
         return None
@@ -55,18 +64,19 @@ def run_hedge_fund(
     model_name: str = "gpt-4o",
     model_provider: str = "OpenAI",
     is_crypto: bool = False,
+    llm_batch_size: int = 8,
+    llm_batch_delay: float = 0.0,
 ):
     # Start progress tracking
     progress.start()
 
     try:
-        # Create a new workflow with the specified analysts
-        workflow = create_workflow(selected_analysts)
+        # Reuse the compiled workflow for this set of analysts
+        app = _get_compiled_app(tuple(sorted(selected_analysts)) if selected_analysts is not None else None)
         
         # Print the selected analysts for debugging
-        print(f"\n{Fore.CYAN}Selected analysts for workflow: {selected_analysts}{Style.RESET_ALL}\n")
-        
-        app = workflow.compile()
+        if VERBOSE:
+            print(f"\n{Fore.CYAN}Selected analysts for workflow: {selected_analysts}{Style.RESET_ALL}\n")
 
         # Create the initial state
         initial_state = {
@@ -84,41 +94,56 @@ def run_hedge_fund(
                 "model_name": model_name,
                 "model_provider": model_provider,
                 "is_crypto": is_crypto,
+                "llm_batch_size": llm_batch_size,
+                "llm_batch_delay": llm_batch_delay,
             },
         }
 
-        # Run the workflow
-        result = app.invoke(initial_state)
+        # Run the workflow. The analysts all fan out from start_node into the same superstep, which
+        # LangGraph runs on a thread pool; size it so every analyst starts at once rather than queueing
+        analyst_count = len(selected_analysts) if selected_analysts is not None else len(get_analyst_nodes())
+        # Stream node updates instead of waiting for the final state, so each node is shown as done
+        # the moment it finishes and the signals are collected as they arrive
+        analyst_signals = {}
+        portfolio_decision = None
+        portfolio_messages = []
+        for update in app.stream(initial_state, config={"max_concurrency": max(analyst_count, 1)}, stream_mode="updates"):
+            for node_name, node_output in update.items():
+                if not node_output:
+                    continue
+                node_data = node_output.get("data") or {}
+                analyst_signals.update(node_data.get("analyst_signals", {}))
+                if node_name == "portfolio_management_agent":
+                    portfolio_decision = node_data.get("portfolio_decision")
+                    portfolio_messages = node_output.get("messages", [])
+                if node_name != "start_node":
+                    progress.update_status(node_name, None, "Done")
         
         # Stop progress tracking
         progress.stop()
 
         # Extract the portfolio decisions
-        if "portfolio_decision" in result["data"]:
-            portfolio_decision = result["data"]["portfolio_decision"]
-        else:
+        if portfolio_decision is None:
             # Handle the case where portfolio_decision might be missing
-            # Look for it in portfolio_management_agent output in messages
-            for message in reversed(result["messages"]):
-                if hasattr(message, "name") and message.name == "portfolio_management_agent":
-                    try:
-                        portfolio_decision = json.loads(message.content)
-                        break
-                    except:
-                        pass
-            else:
+            # Look for it in portfolio_management_agent output in messages; later messages win
+            named_messages = {message.name: message for message in portfolio_messages if getattr(message, "name", None)}
+            message = named_messages.get("portfolio_management_agent")
+            try:
+                portfolio_decision = json_utils.loads(message.content) if message else None
+            except ValueError:  # both json and orjson decode errors derive from ValueError
+                portfolio_decision = None
+            if portfolio_decision is None:
                 portfolio_decision = {}
                 print(f"{Fore.RED}Warning: Could not find portfolio decisions in output{Style.RESET_ALL}")
         
         # Return result with analyst signals for further processing
         return {
             "decisions": portfolio_decision,
-            "analyst_signals": result["data"]["analyst_signals"],
+            "analyst_signals": analyst_signals,
         }
     except Exception as e:
         progress.stop()
         print(f"Error running hedge fund: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -136,31 +161,33 @@ def create_workflow(selected_analysts=None):
     # Get analyst nodes from the configuration
     analyst_nodes = get_analyst_nodes()
     
-    print(f"\n{Fore.YELLOW}Creating workflow with analysts: {selected_analysts}{Style.RESET_ALL}")
+    if VERBOSE:
+        print(f"\n{Fore.YELLOW}Creating workflow with analysts: {selected_analysts}{Style.RESET_ALL}")
     
     # Default to all analysts if none selected
     if selected_analysts is None:
         selected_analysts = list(analyst_nodes.keys())
-        print(f"{Fore.RED}No analysts specified, defaulting to all: {selected_analysts}{Style.RESET_ALL}")
+        if VERBOSE:
+            print(f"{Fore.RED}No analysts specified, defaulting to all: {selected_analysts}{Style.RESET_ALL}")
     
-    # Add all selected analyst nodes
+    # Add all selected analyst nodes, resolving each key against the configuration once
+    analyst_node_names = []
     for analyst_key in selected_analysts:
-        if analyst_key in analyst_nodes:
-            node_name, node_func = analyst_nodes[analyst_key]
-            workflow.add_node(node_name, node_func)
-            workflow.add_edge("start_node", node_name)
-        else:
+        if analyst_key not in analyst_nodes:
             print(f"{Fore.RED}Warning: Analyst {analyst_key} not found in configuration{Style.RESET_ALL}")
+            continue
+        node_name, node_func = analyst_nodes[analyst_key]
+        workflow.add_node(node_name, cached_node(node_name, node_func))
+        workflow.add_edge("start_node", node_name)
+        analyst_node_names.append(node_name)
     
     # Always add risk and portfolio management
     workflow.add_node("risk_management_agent", risk_management_agent)
     workflow.add_node("portfolio_management_agent", portfolio_management_agent)
     
     # Connect all analysts to risk management
-    for analyst_key in selected_analysts:
-        if analyst_key in analyst_nodes:
-            node_name = analyst_nodes[analyst_key][0]
-            workflow.add_edge(node_name, "risk_management_agent")
+    for node_name in analyst_node_names:
+        workflow.add_edge(node_name, "risk_management_agent")
     
     # Connect risk management to portfolio management
     workflow.add_edge("risk_management_agent", "portfolio_management_agent")
@@ -170,7 +197,17 @@ def create_workflow(selected_analysts=None):
     return workflow
 
 
-def run_all_analysts_with_round_table(tickers, start_date, end_date, portfolio, show_reasoning, model_name, model_provider, is_crypto=False):
+@lru_cache(maxsize=32)
+def _get_compiled_app(selected_analysts: tuple[str, ...] | None):
+    """
+    Compiled workflow for a set of analysts, built once and reused across runs.
+    The graph holds no per-run state (no checkpointer), so sharing it is safe; the key is
+    sorted because the analysts all fan out in parallel and their order doesn't change the graph.
+    """
+    return create_workflow(list(selected_analysts) if selected_analysts is not None else None).compile()
+
+
+def run_all_analysts_with_round_table(tickers, start_date, end_date, portfolio, show_reasoning, model_name, model_provider, is_crypto=False, llm_batch_size=8, llm_batch_delay=0.0):
     """
     Run all available analysts and then conduct a round table discussion without user selection.
     This is a simplified workflow for when the user specifies the --round-table flag.
@@ -195,10 +232,11 @@ def run_all_analysts_with_round_table(tickers, start_date, end_date, portfolio,
         model_name=model_name,
         model_provider=model_provider,
         is_crypto=is_crypto,
+        llm_batch_size=llm_batch_size,
+        llm_batch_delay=llm_batch_delay,
     )
     
     # Run the round table discussion
-    from round_table import run_round_table
     round_table_results = run_round_table(
         data={
             "tickers": tickers,
@@ -240,6 +278,7 @@ if __name__ == "__main__":
     parser.add_argument(
         "--show-agent-graph", action="store_true", help="Show the agent graph"
     )
+    parser.add_argument("--verbose", action="store_true", help="Print workflow construction details")
     parser.add_argument(
         "--round-table",
         action="store_true",
@@ -250,8 +289,56 @@ if __name__ == "__main__":
         action="store_true",
         help="Analyze cryptocurrency instead of stocks (append -USD to ticker symbols)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Maximum number of per-ticker LLM calls an analyst sends concurrently. Defaults to 8"
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=0.0,
+        help="Seconds to wait between batches of LLM calls, to stay under provider rate limits. Defaults to 0"
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=float,
+        help="Requests per minute allowed by your LLM provider; calls wait for budget instead of hitting the limit"
+    )
+    parser.add_argument(
+        "--llm-tpm",
+        type=float,
+        help="Tokens per minute allowed by your LLM provider; calls wait for budget instead of hitting the limit"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch all financial data and round table discussions fresh instead of reading the local cache in .cache/"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        help="Days before cached financial data is refetched, for every endpoint. Defaults to each endpoint's own TTL"
+    )
+    parser.add_argument(
+        "--no-node-cache",
+        action="store_true",
+        help="Rerun every analyst instead of reusing its signals from an earlier run with the same tickers, dates and model"
+    )
 
     args = parser.parse_args()
+    VERBOSE = args.verbose
+
+    # The data cache reads this at call time, so it also covers the round table and semantic caches
+    if args.no_cache:
+        os.environ["DISABLE_DATA_CACHE"] = "true"
+    if args.no_node_cache:
+        os.environ["DISABLE_NODE_CACHE"] = "true"
+    if args.cache_ttl is not None:
+        set_disk_cache_ttl(args.cache_ttl * DAY)
+    set_llm_rate_limits(args.llm_rpm, args.llm_tpm)
 
     # Parse tickers from comma-separated string
     tickers = [ticker.strip() for ticker in args.tickers.split(",")]
@@ -285,46 +372,37 @@ if __name__ == "__main__":
             model_provider = "Unknown"
             print(f"\nSelected model: {Fore.GREEN + Style.BRIGHT}{model_choice}{Style.RESET_ALL}\n")
 
-    # Validate dates if provided
-    if args.start_date:
+    # Validate dates if provided, parsing each one once and deriving the default start from the parsed end
+    def parse_date(value: str, label: str) -> datetime:
         try:
-            datetime.strptime(args.start_date, "%Y-%m-%d")
+            return datetime.strptime(value, "%Y-%m-%d")
         except ValueError:
-            raise ValueError("Start date must be in YYYY-MM-DD format")
-
-    if args.end_date:
-        try:
-            datetime.strptime(args.end_date, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("End date must be in YYYY-MM-DD format")
-
-    # Set the start and end dates
-    end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
-    if not args.start_date:
-        # Calculate 3 months before end_date
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-        start_date = (end_date_obj - relativedelta(months=3)).strftime("%Y-%m-%d")
-    else:
-        start_date = args.start_date
-
-    # Initialize portfolio with cash amount and stock positions
+            raise ValueError(f"{label} date must be in YYYY-MM-DD format")
+
+    end_date_obj = parse_date(args.end_date, "End") if args.end_date else datetime.now()
+    # Defaults to 3 months before end_date
+    start_date_obj = parse_date(args.start_date, "Start") if args.start_date else end_date_obj - relativedelta(months=3)
+    end_date = end_date_obj.strftime("%Y-%m-%d")
+    start_date = start_date_obj.strftime("%Y-%m-%d")
+
+    # Initialize portfolio with cash amount and stock positions, filling both per-ticker tables in one pass
+    positions, realized_gains = {}, {}
+    for ticker in tickers:
+        positions[ticker] = {
+            "long": 0,  # Number of shares held long
+            "short": 0,  # Number of shares held short
+            "long_cost_basis": 0.0,  # Average cost basis for long positions
+            "short_cost_basis": 0.0,  # Average price at which shares were sold short
+        }
+        realized_gains[ticker] = {
+            "long": 0.0,  # Realized gains from long positions
+            "short": 0.0,  # Realized gains from short positions
+        }
     portfolio = {
         "cash": args.initial_cash,  # Initial cash amount
         "margin_requirement": args.margin_requirement,  # Initial margin requirement
-        "positions": {
-            ticker: {
-                "long": 0,  # Number of shares held long
-                "short": 0,  # Number of shares held short
-                "long_cost_basis": 0.0,  # Average cost basis for long positions
-                "short_cost_basis": 0.0,  # Average price at which shares were sold short
-            } for ticker in tickers
-        },
-        "realized_gains": {
-            ticker: {
-                "long": 0.0,  # Realized gains from long positions
-                "short": 0.0,  # Realized gains from short positions
-            } for ticker in tickers
-        }
+        "positions": positions,
+        "realized_gains": realized_gains,
     }
 
     # Bypass analyst selection when round table is specified
@@ -338,7 +416,9 @@ if __name__ == "__main__":
             show_reasoning=args.show_reasoning,
             model_name=model_choice,
             model_provider=model_provider,
-            is_crypto=args.crypto
+            is_crypto=args.crypto,
+            llm_batch_size=args.batch_size,
+            llm_batch_delay=args.batch_delay,
         )
         print_trading_output(result)
     else:
@@ -368,14 +448,15 @@ if __name__ == "__main__":
 
         # Create workflow for visualization if requested
         if args.show_agent_graph:
-            workflow = create_workflow(selected_analysts)
-            app = workflow.compile()
+            app = _get_compiled_app(tuple(sorted(selected_analysts)))
             
             file_path = ""
             for selected_analyst in selected_analysts:
                 file_path += selected_analyst + "_"
             file_path += "graph.png"
-            save_graph_as_png(app, file_path)
+            # Rendering goes through the Mermaid web API; do it alongside the run rather than before it.
+            # Not a daemon thread, so the interpreter still waits for the file to be written at exit
+            threading.Thread(target=save_graph_as_png, args=(app, file_path), name="save-agent-graph").start()
 
         # Run the hedge fund with is_crypto flag
         result = run_hedge_fund(
@@ -387,6 +468,8 @@ if __name__ == "__main__":
             selected_analysts=selected_analysts,
             model_name=model_choice,
             model_provider=model_provider,
-            is_crypto=args.crypto
+            is_crypto=args.crypto,
+            llm_batch_size=args.batch_size,
+            llm_batch_delay=args.batch_delay,
         )
         print_trading_output(result)
@@ -1,13 +1,109 @@
-from pydantic import BaseModel, Field, root_validator
+from pydantic import BaseModel, Field, model_validator
 import json
 from typing_extensions import Literal, Dict, Any
 from utils.progress import progress
 from utils.llm import call_llm
+from data.cache import SemanticCache
 from colorama import Fore, Style
 from langchain_core.prompts import ChatPromptTemplate
+import os
 import time
 import random
 import re
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Cap on round table LLM calls in flight at once, to stay under provider rate limits;
+# shares ROUND_TABLE_CONCURRENCY with the round table agent
+_LLM_CONCURRENCY = max(1, int(os.getenv("ROUND_TABLE_CONCURRENCY", "5")))
+
+
+def _map_concurrently(fn, items):
+    """Call fn on every item from a thread pool and return the results in the items' order."""
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_LLM_CONCURRENCY, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+# Round table replies, reused when a later discussion sends (nearly) the same prompt for the same ticker.
+# The bag-of-words similarity ignores word order, so who speaks (and to whom, or on which topic) is part of
+# the exact scope; the strict threshold only lets near-identical prompts share a reply, e.g. an analyst's
+# reasoning reworded slightly between runs
+_response_cache = SemanticCache("round_table_engine", threshold=0.995)
+
+# Guards the reply memos simulate_round_table creates for each discussion (see _cached_call_llm)
+_reply_memo_lock = threading.Lock()
+
+
+def _discussion_key(ticker: str, ticker_signals: dict[str, any]) -> str:
+    """
+    Ticker plus a digest of every analyst's call and confidence to the nearest 10. Most prompts carry no
+    run data, so this keeps a reply from being reused once the signals behind the discussion change.
+    """
+    calls = {
+        agent: [signal.get("signal"), round(float(signal.get("confidence") or 0), -1)]
+        for agent, signal in ticker_signals.items()
+        if isinstance(signal, dict)
+    }
+    digest = hashlib.sha1(json.dumps(calls, sort_keys=True).encode()).hexdigest()[:16]
+    return f"{ticker}|{digest}"
+
+
+def _cached_call_llm(discussion_key, reply_memo, kind, speaker, prompt, model_name, model_provider, pydantic_model, agent_name, default_factory):
+    """
+    call_llm for a text reply, cached per discussion (see _discussion_key), kind of turn, speaker and model.
+    The response models are all aliases of TextResponseBase, so kind (e.g. "question") names the turn instead.
+    reply_memo maps exact prompts to futures of their replies for one discussion, so identical prompts in it
+    (e.g. two questions put to the same analyst, whose answer prompts match) share one call, even when they
+    are sent at the same time. Fallback replies are not stored. New replies are written to disk by
+    _response_cache.flush().
+    """
+    prompt_text = prompt.to_string()
+    memo_key = (model_provider, model_name, kind, prompt_text)
+    with _reply_memo_lock:
+        future = reply_memo.get(memo_key)
+        owner = future is None
+        if owner:
+            future = reply_memo[memo_key] = Future()
+    # Replies below were validated when first received, so they are restored without validating again
+    if not owner:
+        return pydantic_model.model_construct(**future.result())
+
+    try:
+        scope = f"{model_provider}|{model_name}|{kind}|{discussion_key}|{speaker}"
+        cached = _response_cache.get(scope, prompt_text)
+        if cached is not None:
+            future.set_result(cached)
+            return pydantic_model.model_construct(**cached)
+
+        response = call_llm(
+            prompt=prompt,
+            model_name=model_name,
+            model_provider=model_provider,
+            pydantic_model=pydantic_model,
+            agent_name=agent_name,
+            default_factory=default_factory
+        )
+    except BaseException as e:
+        future.set_exception(e)
+        with _reply_memo_lock:
+            if reply_memo.get(memo_key) is future:
+                del reply_memo[memo_key]
+        raise
+
+    future.set_result(response.model_dump())
+    if response.text == default_factory().text:
+        # Let a later prompt retry instead of repeating the fallback
+        with _reply_memo_lock:
+            if reply_memo.get(memo_key) is future:
+                del reply_memo[memo_key]
+    else:
+        _response_cache.set(scope, prompt_text, response.model_dump(), flush=False)
+    return response
+
 
 class RoundTableOutput(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
@@ -24,78 +120,77 @@ class AnalystPersona(BaseModel):
     background: str
     biases: str
     initial_position: str = ""
+    # Key of this analyst's entry in ticker_signals, e.g. "warren_buffett_agent"
+    agent_key: str = ""
 
-# Base response model that handles either direct text or common JSON formats
-class TextResponseBase(BaseModel):
-    text: str
+def extract_text_from_various_formats(values) -> dict:
+    """Map a reply given as direct text or one of the common JSON shapes onto {"text": ...}."""
+    # If already a string, just use it
+    if isinstance(values, str):
+        return {"text": values}
     
-    # Add a validator to handle multiple response formats
-    @root_validator(pre=True)
-    def extract_text_from_various_formats(cls, values):
-        # If already a string, just use it
-        if isinstance(values, str):
-            return {"text": values}
-        
-        # If it's a dict, look for common patterns
-        if isinstance(values, dict):
-            # Format {"text": "content"} - direct mapping
-            if "text" in values:
-                return values
-                
-            # Format {"query": "content"} - extract content
-            if "query" in values:
-                return {"text": values["query"]}
-                
-            # Format {"question": "content"} - common format in our errors
-            if "question" in values:
-                return {"text": values["question"]}
-                
-            # Format {"response": "content"} - common format in our errors 
-            if "response" in values:
-                return {"text": values["response"]}
-                
-            # Format {"answer": "content"} - another common format in our errors
-            if "answer" in values:
-                return {"text": values["answer"]}
-                
-            # Format {"Analyst Name": "content"} - take the first value
-            if len(values) == 1:
-                return {"text": next(iter(values.values()))}
-                
-            # Format with message content
-            if "content" in values:
-                return {"text": values["content"]}
-                
-            # If we have a dict but can't find a standard pattern,
-            # serialize it back to a string
-            return {"text": str(values)}
+    # If it's a dict, look for common patterns
+    if isinstance(values, dict):
+        # Format {"text": "content"} - direct mapping
+        if "text" in values:
+            return values
+            
+        # Format {"query": "content"} - extract content
+        if "query" in values:
+            return {"text": values["query"]}
             
-        # For any other type, convert to string
+        # Format {"question": "content"} - common format in our errors
+        if "question" in values:
+            return {"text": values["question"]}
+            
+        # Format {"response": "content"} - common format in our errors 
+        if "response" in values:
+            return {"text": values["response"]}
+            
+        # Format {"answer": "content"} - another common format in our errors
+        if "answer" in values:
+            return {"text": values["answer"]}
+            
+        # Format {"Analyst Name": "content"} - take the first value
+        if len(values) == 1:
+            return {"text": next(iter(values.values()))}
+            
+        # Format with message content
+        if "content" in values:
+            return {"text": values["content"]}
+            
+        # If we have a dict but can't find a standard pattern,
+        # serialize it back to a string
         return {"text": str(values)}
+        
+    # For any other type, convert to string
+    return {"text": str(values)}
 
-# Response models for different conversation parts
-class InitialPositionResponse(TextResponseBase):
-    pass
-
-class QuestionResponse(TextResponseBase):
-    pass
-
-class AnswerResponse(TextResponseBase):
-    pass
-
-class DebateResponse(TextResponseBase):
-    pass
 
-class SynthesisResponse(TextResponseBase):
-    pass
+# Base response model that handles either direct text or common JSON formats
+class TextResponseBase(BaseModel):
+    text: str
+    
+    # Native before-validator instead of the deprecated v1 root_validator shim; the parsing itself is a plain function
+    @model_validator(mode="before")
+    @classmethod
+    def _extract_text(cls, values):
+        return extract_text_from_various_formats(values)
 
-class ConclusionResponse(TextResponseBase):
-    pass
+# Response models for different conversation parts. They only ever differed by name, so they share
+# one class rather than each building its own pydantic schema and validator
+InitialPositionResponse = TextResponseBase
+QuestionResponse = TextResponseBase
+AnswerResponse = TextResponseBase
+DebateResponse = TextResponseBase
+SynthesisResponse = TextResponseBase
+ConclusionResponse = TextResponseBase
 
 class TopicsResponse(BaseModel):
     topics: list[str]
     
-    @root_validator(pre=True)
+    @model_validator(mode="before")
+    @classmethod
     def extract_topics(cls, values):
         # Handle string that might be a list
         if isinstance(values, str):
@@ -126,32 +221,44 @@ def simulate_round_table(
     """Simulate a round table discussion among analysts with multiple API calls."""
     # Setup the analysts based on signals
     analysts = setup_analysts(ticker_signals)
+    discussion_key = _discussion_key(ticker, ticker_signals)
+    # Identical prompts within this discussion share one call; the memo goes away with the discussion
+    reply_memo: dict[tuple, Future] = {}
     
     # Start with the moderator's introduction
     progress.update_status("round_table", ticker, "Starting moderated discussion")
     full_transcript = generate_moderator_intro(ticker)
     
-    # Phase 1: Initial positions (separate API call for each analyst)
+    # Phase 1: Initial positions (separate API call for each analyst, all sent at once
+    # since no opening statement depends on another)
     progress.update_status("round_table", ticker, "Gathering initial positions")
-    for analyst in analysts:
-        if analyst.name in ticker_signals:
-            try:
-                position = generate_initial_position(
-                    analyst_name=analyst.name,
-                    ticker=ticker,
-                    ticker_signal=ticker_signals[analyst.name],
-                    analyst_style=analyst.style,
-                    model_name=model_name,
-                    model_provider=model_provider
-                )
-                analyst.initial_position = position
-                full_transcript += f"\n\n{analyst.name}: {position}"
-                # Add small delays between analysts to simulate real discussion timing
-                time.sleep(0.5)
-            except Exception as e:
-                # Continue with other analysts if one fails
-                print(f"Error generating position for {analyst.name}: {e}")
-                continue
+    speakers = [analyst for analyst in analysts if analyst.agent_key in ticker_signals]
+
+    def initial_position(analyst):
+        try:
+            return generate_initial_position(
+                analyst_name=analyst.name,
+                ticker=ticker,
+                ticker_signal=ticker_signals[analyst.agent_key],
+                analyst_style=analyst.style,
+                model_name=model_name,
+                model_provider=model_provider,
+                discussion_key=discussion_key,
+                reply_memo=reply_memo
+            )
+        except Exception as e:
+            return e
+
+    positions = _map_concurrently(initial_position, speakers)
+
+    # The transcript keeps the analysts' order, whichever call finished first
+    for analyst, position in zip(speakers, positions):
+        if isinstance(position, Exception):
+            # Continue with other analysts if one fails
+            print(f"Error generating position for {analyst.name}: {position}")
+            continue
+        analyst.initial_position = position
+        full_transcript += f"\n\n{analyst.name}: {position}"
     
     # Phase 2: Interactive questioning and debate (multiple turns)
     progress.update_status("round_table", ticker, "Starting interactive debate")
@@ -169,7 +276,9 @@ def simulate_round_table(
             analysts=primary_debaters,
             phase="questioning",
             model_name=model_name,
-            model_provider=model_provider
+            model_provider=model_provider,
+            discussion_key=discussion_key,
+            reply_memo=reply_memo
         )
         conversation_turns.extend(questions)
     except Exception as e:
@@ -185,7 +294,9 @@ def simulate_round_table(
             analysts=analysts,
             primary_debaters=primary_debaters,
             model_name=model_name,
-            model_provider=model_provider
+            model_provider=model_provider,
+            discussion_key=discussion_key,
+            reply_memo=reply_memo
         )
         conversation_turns.extend(debate_exchanges)
     except Exception as e:
@@ -201,7 +312,9 @@ def simulate_round_table(
             transcript_so_far=current_transcript,
             analysts=primary_debaters,
             model_name=model_name,
-            model_provider=model_provider
+            model_provider=model_provider,
+            discussion_key=discussion_key,
+            reply_memo=reply_memo
         )
         conversation_turns.extend(synthesis)
     except Exception as e:
@@ -216,7 +329,9 @@ def simulate_round_table(
             ticker=ticker,
             transcript=full_transcript,
             model_name=model_name,
-            model_provider=model_provider
+            model_provider=model_provider,
+            discussion_key=discussion_key,
+            reply_memo=reply_memo
         )
         full_transcript += f"\n\n{moderator_conclusion}"
     except Exception as e:
@@ -245,6 +360,9 @@ def simulate_round_table(
             "dissenting_opinions": "Analysts disagreed on valuation and growth potential."
         }
     
+    # One write for every reply this discussion added to the cache
+    _response_cache.flush()
+
     return RoundTableOutput(
         signal=final_analysis["signal"],
         confidence=final_analysis["confidence"],
@@ -329,14 +447,10 @@ def setup_analysts(ticker_signals):
     }
     
     # Add analysts that have signals
-    for agent_name, signal in ticker_signals.items():
-        # Convert agent name to persona key (remove "_agent" suffix if present)
-        persona_key = agent_name
-        if persona_key.endswith("_agent"):
-            persona_key = persona_key
-            
-        if persona_key in persona_definitions:
-            analysts.append(persona_definitions[persona_key])
+    for agent_name in ticker_signals:
+        if agent_name in persona_definitions:
+            # Signals are keyed by agent id, personas by display name; keep the id for signal lookups
+            analysts.append(persona_definitions[agent_name].model_copy(update={"agent_key": agent_name}))
     
     return analysts
 
@@ -344,7 +458,7 @@ def generate_moderator_intro(ticker):
     """Generate the moderator's introduction."""
     return f"Moderator: Welcome everyone to our investment round table discussion on {ticker}. Today we'll examine the bull and bear cases, analyze the company's fundamentals, technical indicators, and reach a consensus investment decision. Let's begin with each of you sharing your initial position."
 
-def generate_initial_position(analyst_name, ticker, ticker_signal, analyst_style, model_name, model_provider):
+def generate_initial_position(analyst_name, ticker, ticker_signal, analyst_style, model_name, model_provider, discussion_key, reply_memo):
     """Generate initial position statement for an analyst (separate API call)."""
     template = ChatPromptTemplate.from_messages([
         (
@@ -386,7 +500,11 @@ def generate_initial_position(analyst_name, ticker, ticker_signal, analyst_style
     def create_default_position():
         return InitialPositionResponse(text=f"I'm {ticker_signal.get('signal', 'neutral')} on {ticker} based on my analysis.")
     
-    response = call_llm(
+    response = _cached_call_llm(
+        discussion_key=discussion_key,
+        reply_memo=reply_memo,
+        kind="initial_position",
+        speaker=analyst_name,
         prompt=prompt,
         model_name=model_name,
         model_provider=model_provider,
@@ -405,9 +523,9 @@ def select_primary_debaters(ticker_signals, analysts):
     neutral_analysts = []
     
     for analyst in analysts:
-        if analyst.name in ticker_signals:
-            signal = ticker_signals[analyst.name].get('signal', '').lower()
-            confidence = ticker_signals[analyst.name].get('confidence', 50)
+        if analyst.agent_key in ticker_signals:
+            signal = ticker_signals[analyst.agent_key].get('signal', '').lower()
+            confidence = ticker_signals[analyst.agent_key].get('confidence', 50)
             
             if signal == 'bullish':
                 bullish_analysts.append((analyst, confidence))
@@ -434,19 +552,24 @@ def select_primary_debaters(ticker_signals, analysts):
     
     return primary_debaters
 
-def generate_questions(ticker, transcript_so_far, analysts, phase, model_name, model_provider):
+def generate_questions(ticker, transcript_so_far, analysts, phase, model_name, model_provider, discussion_key, reply_memo):
     """Generate probing questions between analysts with better error handling."""
-    questions = []
-    
     # Select who asks questions (we want to have at least 3 good questions)
     questioners = random.sample(analysts, min(3, len(analysts)))
     
+    # Pick every pairing up front, then run the exchanges concurrently; no prompt depends on another exchange
+    pairs = []
     for questioner in questioners:
         # Select who to question (someone other than the questioner)
         eligible_responders = [a for a in analysts if a.name != questioner.name]
         if not eligible_responders:
             continue
-        responder = random.choice(eligible_responders)
+        pairs.append((questioner, random.choice(eligible_responders)))
+
+    def exchange(pair):
+        """Question from the questioner and the responder's answer."""
+        questioner, responder = pair
+        lines = []
         
         # Create a fixed question format without template variables
         question_prompt = """You are an investment analyst participating in a round table discussion.
@@ -472,7 +595,11 @@ Do not include any JSON formatting or additional text."""
             return QuestionResponse(text=f"{questioner.name}: {responder.name}, could you elaborate on your thesis for {ticker}? I'm particularly interested in your assumptions about growth and valuation.")
         
         try:
-            question_result = call_llm(
+            question_result = _cached_call_llm(
+                discussion_key=discussion_key,
+                reply_memo=reply_memo,
+                kind="question",
+                speaker=f"{questioner.name} -> {responder.name}",
                 prompt=final_prompt,
                 model_name=model_name,
                 model_provider=model_provider,
@@ -482,7 +609,7 @@ Do not include any JSON formatting or additional text."""
             )
             
             question = question_result.text
-            questions.append(question.strip())
+            lines.append(question.strip())
             
             # Generate an answer using a similar simple template approach
             answer_prompt = """You are an investment analyst participating in a round table discussion.
@@ -507,7 +634,11 @@ Do not include any JSON formatting or additional text."""
                 return AnswerResponse(text=f"{responder.name}: Based on my analysis of {ticker}, I believe my position is justified by the fundamentals and market conditions.")
             
             try:
-                answer_result = call_llm(
+                answer_result = _cached_call_llm(
+                    discussion_key=discussion_key,
+                    reply_memo=reply_memo,
+                    kind="answer",
+                    speaker=responder.name,
                     prompt=answer_final_prompt,
                     model_name=model_name,
                     model_provider=model_provider,
@@ -517,25 +648,26 @@ Do not include any JSON formatting or additional text."""
                 )
                 
                 answer = answer_result.text
-                questions.append(answer.strip())
+                lines.append(answer.strip())
             except Exception as e:
                 print(f"Error generating answer, using default: {e}")
                 default_answer = create_default_answer().text
-                questions.append(default_answer)
+                lines.append(default_answer)
                 
         except Exception as e:
             # Fallback to default question/answer
             print(f"Error generating question/answer, using defaults: {e}")
             default_q = create_default_question().text
-            questions.append(default_q)
-            questions.append(f"{responder.name}: My analysis of {ticker} is based on careful consideration of the fundamentals and market conditions.")
-            
-        # Add a small delay
-        time.sleep(0.5)
+            lines.append(default_q)
+            lines.append(f"{responder.name}: My analysis of {ticker} is based on careful consideration of the fundamentals and market conditions.")
+
+        return lines
+
+    questions = [line for lines in _map_concurrently(exchange, pairs) for line in lines]
     
     return questions
 
-def identify_debate_topics(ticker, transcript, model_name, model_provider):
+def identify_debate_topics(ticker, transcript, model_name, model_provider, discussion_key, reply_memo):
     """Identify key topics for debate from the discussion so far."""
     # Default topics to fall back on
     default_topics = ["Valuation", "Growth Prospects", "Competitive Position"]
@@ -554,18 +686,19 @@ Example: ["Valuation multiples", "AI market growth", "Competitive threats"]"""
     
     try:
         # Modified approach: Use a string response and parse it separately
-        class SimpleTextResponse(TextResponseBase):
-            pass
-            
         def create_default_topics_text():
-            return SimpleTextResponse(text=json.dumps(default_topics))
+            return TextResponseBase(text=json.dumps(default_topics))
         
         # Get response as plain text
-        response_result = call_llm(
+        response_result = _cached_call_llm(
+            discussion_key=discussion_key,
+            reply_memo=reply_memo,
+            kind="topics",
+            speaker="Moderator",
             prompt=final_prompt,
             model_name=model_name,
             model_provider=model_provider,
-            pydantic_model=SimpleTextResponse,
+            pydantic_model=TextResponseBase,
             agent_name="round_table",
             default_factory=create_default_topics_text
         )
@@ -616,29 +749,30 @@ Example: ["Valuation multiples", "AI market growth", "Competitive threats"]"""
     # Return default topics if all else fails
     return default_topics
 
-def generate_debate_exchanges(ticker, transcript_so_far, analysts, primary_debaters, model_name, model_provider):
+def generate_debate_exchanges(ticker, transcript_so_far, analysts, primary_debaters, model_name, model_provider, discussion_key, reply_memo):
     """Generate deeper debate exchanges between analysts focusing on key disagreements."""
     exchanges = []
     
     # Extract key topics for debate based on initial positions
     progress.update_status("round_table", ticker, "Identifying key debate topics")
-    topics = identify_debate_topics(ticker, transcript_so_far, model_name, model_provider)
+    topics = identify_debate_topics(ticker, transcript_so_far, model_name, model_provider, discussion_key, reply_memo)
     
     # Add a moderator message to transition to focused debate
     moderator_message = f"Moderator: Now let's dig deeper into some key areas of disagreement. Let's start by discussing {topics[0]}."
     exchanges.append(moderator_message)
     
     # For each topic, set up a focused exchange between analysts with opposite views
-    for topic_idx, topic in enumerate(topics[:2]):  # Limit to top 2 topics to keep it simpler
+    if len(primary_debaters) < 2:
+        return exchanges
+
+    # Select two different analysts for the debate
+    debater1 = primary_debaters[0]
+    debater2 = primary_debaters[1]
+    debate_topics = topics[:2]  # Limit to top 2 topics to keep it simpler
+
+    def bullish_argument(topic):
         progress.update_status("round_table", ticker, f"Debating {topic}")
-        
-        if len(primary_debaters) < 2:
-            continue
-            
-        # Select two different analysts for the debate
-        debater1 = primary_debaters[0]
-        debater2 = primary_debaters[1]
-        
+
         # Generate a simple bullish point
         bullish_prompt = """You are an investment analyst participating in a round table discussion.
 
@@ -661,7 +795,11 @@ Do not include any JSON formatting or additional text."""
             return DebateResponse(text=f"{debater1.name}: Regarding {topic}, I see strong potential for {ticker} based on the fundamentals and market trends.")
         
         try:
-            argument_result = call_llm(
+            argument_result = _cached_call_llm(
+                discussion_key=discussion_key,
+                reply_memo=reply_memo,
+                kind="debate",
+                speaker=f"{debater1.name} on {topic}",
                 prompt=final_prompt,
                 model_name=model_name,
                 model_provider=model_provider,
@@ -670,13 +808,12 @@ Do not include any JSON formatting or additional text."""
                 default_factory=create_default_argument
             )
             
-            bullish_argument = argument_result.text
-            exchanges.append(bullish_argument.strip())
+            return argument_result.text.strip()
         except Exception as e:
             print(f"Error generating bullish argument: {e}")
-            default_arg = create_default_argument().text
-            exchanges.append(default_arg)
-        
+            return create_default_argument().text
+
+    def bearish_counterpoint(topic):
         # Generate a bearish counterpoint
         bearish_prompt = """You are an investment analyst participating in a round table discussion.
 
@@ -700,7 +837,11 @@ Do not include any JSON formatting or additional text."""
             return DebateResponse(text=f"{debater2.name}: I disagree with the bullish view on {topic}. The evidence actually suggests caution for {ticker}.")
         
         try:
-            counterpoint_result = call_llm(
+            counterpoint_result = _cached_call_llm(
+                discussion_key=discussion_key,
+                reply_memo=reply_memo,
+                kind="counterpoint",
+                speaker=f"{debater2.name} on {topic}",
                 prompt=final_prompt,
                 model_name=model_name,
                 model_provider=model_provider,
@@ -709,16 +850,21 @@ Do not include any JSON formatting or additional text."""
                 default_factory=create_default_counterargument
             )
             
-            counterpoint = counterpoint_result.text
-            exchanges.append(counterpoint.strip())
+            return counterpoint_result.text.strip()
         except Exception as e:
             print(f"Error generating bearish argument: {e}")
-            default_counter = create_default_counterargument().text
-            exchanges.append(default_counter)
+            return create_default_counterargument().text
+
+    # Every argument's prompt stands on its own, so all of them go out at once;
+    # the exchanges are then laid out topic by topic, bullish point before its counterpoint
+    arguments = _map_concurrently(lambda task: task[0](task[1]), [
+        (make_argument, topic) for topic in debate_topics for make_argument in (bullish_argument, bearish_counterpoint)
+    ])
+    exchanges.extend(arguments)
     
     return exchanges
 
-def generate_synthesis(ticker, transcript_so_far, analysts, model_name, model_provider):
+def generate_synthesis(ticker, transcript_so_far, analysts, model_name, model_provider, discussion_key, reply_memo):
     """Generate synthesis statements where analysts refine their positions."""
     synthesis = []
     
@@ -727,7 +873,7 @@ def generate_synthesis(ticker, transcript_so_far, analysts, model_name, model_pr
     synthesis.append(moderator_transition)
     
     # Have each analyst provide a refined position (limit to a few to keep it focused)
-    for analyst in analysts[:3]:
+    def final_position(analyst):
         synthesis_prompt = """You are an investment analyst participating in a round table discussion.
 
 You are discussing """ + ticker + """.
@@ -750,7 +896,11 @@ Do not include any JSON formatting or additional text."""
             return SynthesisResponse(text=f"{analyst.name}: After considering all perspectives, I maintain my position on {ticker}.")
         
         try:
-            position_result = call_llm(
+            position_result = _cached_call_llm(
+                discussion_key=discussion_key,
+                reply_memo=reply_memo,
+                kind="synthesis",
+                speaker=analyst.name,
                 prompt=final_prompt,
                 model_name=model_name,
                 model_provider=model_provider,
@@ -759,18 +909,17 @@ Do not include any JSON formatting or additional text."""
                 default_factory=create_default_synthesis
             )
             
-            synthesis.append(position_result.text.strip())
+            return position_result.text.strip()
         except Exception as e:
             print(f"Error generating synthesis: {e}")
-            default_synthesis = create_default_synthesis().text
-            synthesis.append(default_synthesis)
-        
-        # Small delay between analysts
-        time.sleep(0.5)
+            return create_default_synthesis().text
+
+    # The final positions don't depend on each other, request them together
+    synthesis.extend(_map_concurrently(final_position, analysts[:3]))
     
     return synthesis
 
-def generate_moderator_conclusion(ticker, transcript, model_name, model_provider):
+def generate_moderator_conclusion(ticker, transcript, model_name, model_provider, discussion_key, reply_memo):
     """Generate the moderator's conclusion."""
     conclusion_prompt = """You are the moderator of an investment round table discussion.
 
@@ -793,7 +942,11 @@ Do not include any JSON formatting or additional text."""
         return ConclusionResponse(text=f"Moderator: Thank you all for your thoughtful analysis of {ticker}. We've heard a range of perspectives today, from bullish to bearish, each supported by different analytical approaches.")
     
     try:
-        conclusion_result = call_llm(
+        conclusion_result = _cached_call_llm(
+            discussion_key=discussion_key,
+            reply_memo=reply_memo,
+            kind="conclusion",
+            speaker="Moderator",
             prompt=final_prompt,
             model_name=model_name,
             model_provider=model_provider,
@@ -855,6 +1008,7 @@ def generate_final_analysis(ticker, transcript, ticker_signals, model_name, mode
         # Get the text response directly from the LLM
         from langchain_core.language_models import BaseChatModel
         from llm.models import get_model
+        from llm.throttle import throttle
         from utils.progress import progress
         
         # Get the LLM model
@@ -871,6 +1025,7 @@ def generate_final_analysis(ticker, transcript, ticker_signals, model_name, mode
                 try:
                     # Call the LLM directly with retry logic
                     progress.update_status("round_table", ticker, f"Generating final analysis (attempt {retry_count+1}/{max_retries})")
+                    throttle([system_message, human_message], model_name)
                     raw_response = llm.invoke([system_message, human_message])
                     response_text = raw_response.content
                     
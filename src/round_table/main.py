@@ -2,7 +2,7 @@ from graph.state import show_agent_reasoning
 from utils.progress import progress
 from colorama import Fore, Style
 from round_table.engine import simulate_round_table
-from round_table.display import print_readable_conversation, get_signal_color
+from utils.colors import print_readable_conversation, get_signal_color
 
 def run_round_table(data, model_name, model_provider, show_reasoning=True):
     """
@@ -3,12 +3,13 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 import json
 from typing import List, Dict, Any, Optional
 from functools import lru_cache
 
-from data.cache import get_cache
+from data.cache import get_cache, disk_cached, HOUR, DAY
 from data.models import (
     CompanyNews,
     CompanyNewsResponse,
@@ -25,6 +26,13 @@ from data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Shared HTTP session: keep-alive connections are pooled per host, so the concurrent per-ticker
+# fetches reuse TCP/TLS connections instead of opening a new one for every request
+_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount("https://", _http_adapter)
+_session.mount("http://", _http_adapter)
+
 # Define API keys and fallback order
 def get_api_keys():
     """Get all available API keys with fallback options."""
@@ -149,7 +157,7 @@ def get_prices(ticker: str, start_date: str, end_date: str, is_crypto: bool = Fa
         api_keys = get_api_keys()
         if api_key := api_keys.get("stockdata"):
             url = f"https://api.stockdata.org/v1/data/eod?symbols={sd_ticker_str}&date_from={start_date}&date_to={end_date}&api_key={api_key}"
-            response = requests.get(url)
+            response = _session.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -177,7 +185,7 @@ def get_prices(ticker: str, start_date: str, end_date: str, is_crypto: bool = Fa
         api_keys = get_api_keys()
         if api_key := api_keys.get("alpha_vantage"):
             url = f"https://www.alphavantage.co/query?function=TIME_SERIES_DAILY_ADJUSTED&symbol={av_ticker_str}&outputsize=full&apikey={api_key}"
-            response = requests.get(url)
+            response = _session.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -242,7 +250,7 @@ def get_crypto_prices(ticker: str, start_date: str, end_date: str) -> list[Price
             "end": end_timestamp * 1000,
         }
         
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -274,7 +282,7 @@ def get_crypto_prices(ticker: str, start_date: str, end_date: str) -> list[Price
                 
                 # Get volume data from asset endpoint
                 volume_url = f"https://api.coincap.io/v2/assets/{coin_id}"
-                volume_response = requests.get(volume_url)
+                volume_response = _session.get(volume_url)
                 volume_data = {}
                 
                 if volume_response.status_code == 200:
@@ -309,6 +317,21 @@ def get_crypto_prices(ticker: str, start_date: str, end_date: str) -> list[Price
     # Fallback to other APIs as they were already implemented
     # ... existing code for CoinGecko, CryptoCompare, and Binance ...
 
+# Fields every record carries, even the placeholders returned when a provider has no data
+_IDENTITY_FIELDS = frozenset({"ticker", "report_period", "period", "currency"})
+
+
+def _has_reported_values(items: list) -> bool:
+    """False for the all-None placeholders the crypto fallbacks return after an API error, so they aren't cached."""
+    return any(
+        value is not None
+        for item in items
+        for field, value in item.model_dump().items()
+        if field not in _IDENTITY_FIELDS
+    )
+
+
+@disk_cached(FinancialMetrics, ttl_seconds=30 * DAY, should_cache=_has_reported_values)
 def get_financial_metrics(
     ticker: str,
     end_date: str,
@@ -554,7 +577,7 @@ def get_crypto_metrics(
         if api_key := api_keys.get("coingecko"):
             params["x_cg_pro_api_key"] = api_key
         
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -630,6 +653,7 @@ def get_crypto_metrics(
     
     return [empty_metrics]
 
+@disk_cached(LineItem, ttl_seconds=30 * DAY, should_cache=_has_reported_values)
 def search_line_items(
     ticker: str,
     line_items: list[str],
@@ -881,7 +905,7 @@ def search_crypto_line_items(
         if api_key := api_keys.get("coingecko"):
             params["x_cg_pro_api_key"] = api_key
         
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -974,6 +998,7 @@ def search_crypto_line_items(
     
     return [result]
 
+@disk_cached(InsiderTrade, ttl_seconds=DAY)
 def get_insider_trades(
     ticker: str,
     end_date: str,
@@ -1006,7 +1031,7 @@ def get_insider_trades(
             return []
         
         url = f"https://www.alphavantage.co/query?function=INSIDER_TRANSACTIONS&symbol={ticker}&apikey={alpha_vantage_key}"
-        response = requests.get(url)
+        response = _session.get(url)
         
         if response.status_code != 200:
             print(f"Error fetching insider data from Alpha Vantage: {response.status_code}")
@@ -1080,6 +1105,7 @@ def get_insider_trades(
         # Fallback to empty result
         return []
 
+@disk_cached(CompanyNews, ttl_seconds=HOUR)
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -1190,7 +1216,7 @@ def get_crypto_news(
         if api_key := api_keys.get("cryptocompare"):
             params["api_key"] = api_key
         
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1234,6 +1260,7 @@ def get_crypto_news(
     # Fallback to empty list if no news found
     return []
 
+@disk_cached(ttl_seconds=DAY)
 def get_market_cap(
     ticker: str,
     end_date: str,
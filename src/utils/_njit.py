@@ -0,0 +1,16 @@
+"""Numba decorators with pure-Python fallbacks when numba is not installed."""
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(cache=True, ...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
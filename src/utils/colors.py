@@ -0,0 +1,78 @@
+import os
+import re
+import sys
+from types import SimpleNamespace
+
+from colorama import Fore, Style
+
+# Piped or logged output (e.g. behind the API server) gets plain text; NO_COLOR opts out on a terminal too.
+# Swapping in blank codes at import keeps every colored f-string and color table free of escapes.
+USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+if not USE_COLOR:
+    Fore = SimpleNamespace(**{name: "" for name in vars(Fore) if name.isupper()})
+    Style = SimpleNamespace(**{name: "" for name in vars(Style) if name.isupper()})
+
+
+# Define colors for different analysts
+ANALYST_COLORS = {
+    "Warren Buffett": Fore.GREEN,
+    "Charlie Munger": Fore.GREEN + Style.BRIGHT,
+    "Ben Graham": Fore.GREEN,
+    "Cathie Wood": Fore.MAGENTA,
+    "Bill Ackman": Fore.BLUE + Style.BRIGHT,
+    "Nancy Pelosi": Fore.CYAN,
+    "Technical Analyst": Fore.YELLOW,
+    "Fundamental Analyst": Fore.WHITE + Style.BRIGHT,
+    "Sentiment Analyst": Fore.RED,
+    "Valuation Analyst": Fore.BLUE,
+    "WSB": Fore.RED + Style.BRIGHT,
+    "Moderator": Fore.WHITE,
+}
+
+# A new speaker's line starts with "Name:" or "**Name:**"; one match finds which analyst it is
+_SPEAKER_NAMES = "|".join(re.escape(analyst) for analyst in ANALYST_COLORS)
+SPEAKER_RE = re.compile(rf"({_SPEAKER_NAMES}):|\*\*({_SPEAKER_NAMES}):\*\*")
+HEADER_RE = re.compile(r"===|---|\*\*\*")
+
+
+def print_readable_conversation(transcript: str):
+    """Format and print the conversation in a more readable way with color coding."""
+    lines = transcript.split('\n')
+    
+    current_analyst = None
+    # Build the whole transcript first and write it once instead of one print per line
+    out: list[str] = []
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+            
+        # Check if this line starts a new speaker
+        match = SPEAKER_RE.match(line)
+        if match:
+            current_analyst = match.group(1) or match.group(2)
+            # Format: Analyst name in color, then the message
+            name_end = line.find(':') + 1
+            out.append(f"{ANALYST_COLORS[current_analyst]}{line[:name_end]}{Style.RESET_ALL}{line[name_end:]}\n")
+        elif current_analyst and not HEADER_RE.search(line):
+            # Continuation of previous speaker or general text
+            out.append(f"  {line}\n")
+        else:
+            # Section headers or other formatting
+            out.append(f"{Fore.WHITE}{Style.BRIGHT}{line}{Style.RESET_ALL}\n")
+
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+
+_SIGNAL_COLORS = {"bullish": Fore.GREEN, "bearish": Fore.RED, "neutral": Fore.YELLOW}
+
+
+def get_signal_color(signal: str) -> str:
+    """Return the appropriate color for a signal"""
+    # RoundTableOutput already validates signals as lowercase, so lower() only runs for other callers
+    color = _SIGNAL_COLORS.get(signal)
+    if color is None:
+        color = _SIGNAL_COLORS.get(signal.lower(), Fore.YELLOW)
+    return color
@@ -0,0 +1,27 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, using orjson when it is available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # Types orjson refuses (e.g. ints above 64 bits) go through json below
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def loads(data: str | bytes):
+    """Parse a JSON string or bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
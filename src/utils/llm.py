@@ -1,9 +1,13 @@
 """Helper functions for LLM"""
 
-import json
-from typing import TypeVar, Type, Optional, Any
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar, Type, Optional, Any, Callable
 from pydantic import BaseModel
 from utils.progress import progress
+from utils import json_utils
+from llm.throttle import throttle
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -14,7 +18,9 @@ def call_llm(
     pydantic_model: Type[T],
     agent_name: Optional[str] = None,
     max_retries: int = 3,
-    default_factory = None
+    default_factory = None,
+    stream_callback: Optional[Callable[[dict], None]] = None,
+    max_tokens: Optional[int] = None,
 ) -> T:
     """
     Makes an LLM call with retry logic, handling both Deepseek and non-Deepseek models.
@@ -27,25 +33,51 @@ def call_llm(
         agent_name: Optional name of the agent for progress updates
         max_retries: Maximum number of retries (default: 3)
         default_factory: Optional factory function to create default response on failure
+        stream_callback: Optional callback receiving the partially parsed JSON object while the
+            response streams in, so fields like the signal can be used before generation ends
+        max_tokens: Optional cap on the number of generated tokens
         
     Returns:
         An instance of the specified Pydantic model
     """
-    from llm.models import get_model, get_model_info
+    from llm.models import ModelProvider, get_model, get_model_info
     
     model_info = get_model_info(model_name)
     llm = get_model(model_name, model_provider)
+    if max_tokens is not None:
+        # Copy rather than mutate, the model instance may be shared
+        llm = llm.model_copy(update={"max_tokens": max_tokens})
+
+    # Anthropic only caches a prompt prefix when asked to; OpenAI caches identical prefixes automatically
+    if model_provider == ModelProvider.ANTHROPIC:
+        prompt = _with_cached_system_prompt(prompt)
     
+    # OpenAI gets the schema itself rather than plain JSON mode, so replies match it far more often
+    json_schema = supports_json_schema(model_name, model_provider)
+
     # For non-Deepseek models, we can use structured output
+    stream = stream_callback is not None and not (model_info and model_info.is_deepseek())
     if not (model_info and model_info.is_deepseek()):
         llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
+            # A plain JSON schema gets a JSON parser, which yields partial objects while streaming
+            pydantic_model.model_json_schema() if stream else pydantic_model,
+            method="json_schema" if json_schema else "json_mode",
         )
     
     # Call the LLM with retries
     for attempt in range(max_retries):
         try:
+            # Wait for rate-limit budget up front instead of provoking a 429 and backing off
+            throttle(prompt, model_name, max_tokens)
+
+            if stream:
+                result = None
+                for partial in llm.stream(prompt):
+                    if partial:
+                        stream_callback(partial)
+                        result = partial
+                return pydantic_model(**(result or {}))
+
             # Call the LLM
             result = llm.invoke(prompt)
             
@@ -62,15 +94,60 @@ def call_llm(
                 progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
             
             if attempt == max_retries - 1:
-                print(f"Error in LLM call after {max_retries} attempts: {e}")
+                print(f"Error in LLM call after {attempt + 1} attempts: {e}")
                 # Use default_factory if provided, otherwise create a basic default
                 if default_factory:
                     return default_factory()
                 return create_default_response(pydantic_model)
 
+            # Exponential backoff with jitter, so concurrent calls hitting a rate limit don't retry in lockstep
+            time.sleep(min(10.0, 2 ** attempt) * random.uniform(0.5, 1.0))
+
     # This should never be reached due to the retry logic above
     return create_default_response(pydantic_model)
 
+def map_llm_calls(generate: Callable[[str], T], tickers: list[str], metadata: dict) -> dict[str, T]:
+    """
+    Run generate(ticker) for every ticker, dispatching the independent LLM calls concurrently.
+    Calls go out in batches of metadata["llm_batch_size"] (default 8), waiting
+    metadata["llm_batch_delay"] seconds (default 0) between batches to stay under provider rate limits.
+    """
+    batch_size = max(1, metadata.get("llm_batch_size") or 8)
+    batch_delay = metadata.get("llm_batch_delay") or 0.0
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(batch_size, len(tickers)))) as executor:
+        for start in range(0, len(tickers), batch_size):
+            if start and batch_delay > 0:
+                time.sleep(batch_delay)
+            batch = tickers[start:start + batch_size]
+            results.update(zip(batch, executor.map(generate, batch)))
+    return results
+
+def supports_json_schema(model_name: str, model_provider: str) -> bool:
+    """
+    Whether the provider accepts the pydantic schema as a response format (OpenAI json_schema).
+    strict mode is left off because it rejects dict-typed fields used by the batch signal models,
+    so the schema guides the reply but isn't guaranteed: malformed replies are still retried
+    and prompts still spell out the JSON format.
+    """
+    from llm.models import ModelProvider, get_model_info
+
+    model_info = get_model_info(model_name)
+    return model_provider == ModelProvider.OPENAI and not (model_info and model_info.is_deepseek())
+
+def _with_cached_system_prompt(prompt: Any) -> Any:
+    """Mark plain-text system messages as an Anthropic prompt-cache breakpoint."""
+    from langchain_core.messages import SystemMessage
+
+    if not hasattr(prompt, "to_messages"):
+        return prompt
+    return [
+        SystemMessage(content=[{"type": "text", "text": message.content, "cache_control": {"type": "ephemeral"}}])
+        if isinstance(message, SystemMessage) and isinstance(message.content, str)
+        else message
+        for message in prompt.to_messages()
+    ]
+
 def create_default_response(model_class: Type[T]) -> T:
     """Creates a safe default response based on the model's fields."""
     default_values = {}
@@ -101,7 +178,7 @@ def extract_json_from_deepseek_response(content: str) -> Optional[dict]:
             json_end = json_text.find("```")
             if json_end != -1:
                 json_text = json_text[:json_end].strip()
-                return json.loads(json_text)
+                return json_utils.loads(json_text)
     except Exception as e:
         print(f"Error extracting JSON from Deepseek response: {e}")
     return None
@@ -4,7 +4,7 @@ from rich.table import Table
 from rich.style import Style
 from rich.text import Text
 from typing import Dict, Optional
-from datetime import datetime
+import threading
 
 console = Console()
 
@@ -15,8 +15,19 @@ class AgentProgress:
     def __init__(self):
         self.agent_status: Dict[str, Dict[str, str]] = {}
         self.table = Table(show_header=False, box=None, padding=(0, 1))
-        self.live = Live(self.table, console=console, refresh_per_second=4)
+        # Live renders this object on its own timer, so updates only mark the table dirty
+        self.live = Live(self, console=console, refresh_per_second=20)
         self.started = False
+        self._dirty = True
+        # Agents may report progress from worker threads
+        self._lock = threading.Lock()
+
+    def __rich__(self) -> Table:
+        with self._lock:
+            if self._dirty:
+                self._refresh_display()
+                self._dirty = False
+            return self.table
 
     def start(self):
         """Start the progress display."""
@@ -32,15 +43,16 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = ""):
         """Update the status of an agent."""
-        if agent_name not in self.agent_status:
-            self.agent_status[agent_name] = {"status": "", "ticker": None}
+        with self._lock:
+            if agent_name not in self.agent_status:
+                self.agent_status[agent_name] = {"status": "", "ticker": None}
 
-        if ticker:
-            self.agent_status[agent_name]["ticker"] = ticker
-        if status:
-            self.agent_status[agent_name]["status"] = status
+            if ticker:
+                self.agent_status[agent_name]["ticker"] = ticker
+            if status:
+                self.agent_status[agent_name]["status"] = status
 
-        self._refresh_display()
+            self._dirty = True
 
     def _refresh_display(self):
         """Refresh the progress display."""
@@ -5,6 +5,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 import json
 import threading
 import traceback
+from concurrent.futures import Future
 import requests
 from flask import Flask, request, jsonify
 from flask_cors import CORS
@@ -30,6 +31,45 @@ sock = Sock(app)
 # WebSocket 客戶端列表
 websocket_clients = []
 
+
+class SharedAnalysisRuns:
+    """
+    Lets identical analysis requests that arrive while one is already running share its result.
+    The first caller for a key runs the analysis; callers with the same key wait on its future instead
+    of starting another full workflow run. Requests are only shared when everything that affects the
+    outcome matches, because the risk and portfolio managers size positions across all tickers of a run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running: dict[tuple, Future] = {}
+
+    def run(self, key: tuple, func):
+        """Return func()'s result, reusing the run already in flight for key if there is one."""
+        with self._lock:
+            future = self._running.get(key)
+            owner = future is None
+            if owner:
+                future = self._running[key] = Future()
+
+        if not owner:
+            return future.result(), False
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            with self._lock:
+                del self._running[key]
+
+
+shared_runs = SharedAnalysisRuns()
+
 def send_discord_notification(tickers, result, analysis_date):
     """發送分析結果到 Discord"""
     # 檢查是否啟用 Discord 通知
@@ -205,9 +245,10 @@ def run_analysis():
             "realized_gains": {ticker: {"long": 0.0, "short": 0.0} for ticker in ticker_list}
         }
 
-        # 執行完整分析
+        # 執行完整分析，相同參數且正在執行中的請求共用同一次分析結果
         broadcast_log(f"Starting analysis for {ticker_list}", "info")
-        result = run_hedge_fund(
+        run_key = (tuple(ticker_list), start_date, end_date, tuple(selected_analysts), model_name, portfolio["cash"])
+        result, ran_here = shared_runs.run(run_key, lambda: run_hedge_fund(
             tickers=ticker_list,
             start_date=start_date,
             end_date=end_date,
@@ -217,12 +258,13 @@ def run_analysis():
             model_name=model_name,
             model_provider="OpenAI",
             is_crypto=False
-        )
+        ))
 
         broadcast_log("Analysis completed successfully", "success")
         
-        # 發送 Discord 通知
-        send_discord_notification(ticker_list, result, end_date)
+        # 發送 Discord 通知（共用結果的請求不重複發送）
+        if ran_here:
+            send_discord_notification(ticker_list, result, end_date)
         
         return jsonify(result)
 